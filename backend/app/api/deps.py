@@ -1,14 +1,17 @@
 # app/api/deps.py
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 import jwt  # PyJWT (ensure it's in requirements.txt: python-jose[cryptography] or PyJWT)
 from pydantic import ValidationError  # For validating token payload
-from typing import Optional
+from typing import Optional, Tuple
+import hmac
 import logging
 
+from app.catalog.catalog import TermCatalog
 from app.core.config import settings
 from app.crud.crud_user import crud_user  # Your user CRUD operations
+from app.schemas.term import TERM_FIELDS
 from app.schemas.token import TokenPayload  # Pydantic schema for token data
 from app.schemas.user import User as UserSchema  # Pydantic schema for API response
 from app.models.user import User as UserModel  # SQLAlchemy model for DB operations
@@ -89,3 +92,61 @@ async def get_current_active_user(
     # UserSchema should have model_config = ConfigDict(from_attributes=True)
     return UserSchema.model_validate(current_user)  # Pydantic V2
     # For Pydantic V1, it would be: return UserSchema.from_orm(current_user)
+
+
+def get_catalog() -> TermCatalog:
+    """
+    Returns the process-wide term catalog.
+    The catalog is built once at application startup, so this is just a lookup.
+    """
+    # Imported here so that auth-only routes don't pull in the search stack.
+    from app.crud.crud_search import get_catalog as get_term_catalog
+
+    return get_term_catalog()
+
+
+def get_term_fields(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated term attributes to return, e.g. 'term,language' "
+        "(id is always included; default: all)",
+    ),
+) -> Optional[Tuple[str, ...]]:
+    """
+    Parses the fields= sparse fieldset parameter of term responses.
+    Returns the selected Term attributes in response order (always including id),
+    or None to return every attribute.
+    Raises HTTPException 400 for attributes a Term does not have.
+    """
+    if not fields:
+        return None
+    names = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = sorted(names.difference(TERM_FIELDS))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}. "
+            f"Available fields: {', '.join(TERM_FIELDS)}.",
+        )
+    return tuple(name for name in TERM_FIELDS if name == "id" or name in names)
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Guards admin endpoints with the shared secret in settings.ADMIN_API_TOKEN.
+    Raises HTTPException 403 if admin endpoints are disabled or the X-Admin-Token
+    header does not match.
+    """
+    expected = settings.ADMIN_API_TOKEN
+    if not expected:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin endpoints are disabled.",
+        )
+    if x_admin_token is None or not hmac.compare_digest(
+        x_admin_token.encode(), expected.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin token.",
+        )
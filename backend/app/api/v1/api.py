@@ -1,9 +1,11 @@
 # app/api/v1/api.py
 from fastapi import APIRouter
+from app.api.v1.endpoints import admin
 from app.api.v1.endpoints import analytics
 from app.api.v1.endpoints import auth  # <--- IMPORT your auth router
 from app.api.v1.endpoints import search
 from app.api.v1.endpoints import suggest
+from app.api.v1.endpoints import terms
 
 # from .endpoints import lexicon, comment # You'll import these later when created
 
@@ -17,6 +19,8 @@ api_router_v1.include_router(
 api_router_v1.include_router(analytics.router, prefix="/analytics", tags=["Analytics"])
 api_router_v1.include_router(search.router, prefix="/search", tags=["Search"])
 api_router_v1.include_router(suggest.router, prefix="/suggest", tags=["Suggest"])
+api_router_v1.include_router(terms.router, prefix="/terms", tags=["Terms"])
+api_router_v1.include_router(admin.router, prefix="/admin", tags=["Admin"])
 
 # You will include other routers here later:
 # api_router_v1.include_router(lexicon.router, prefix="/lexicons", tags=["Lexicons & Entries"])
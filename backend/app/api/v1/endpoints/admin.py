@@ -0,0 +1,50 @@
+"""
+Module: admin.py
+
+This module defines operational endpoints for the API v1 router. They are
+guarded by a shared secret (settings.ADMIN_API_TOKEN, sent as the
+X-Admin-Token header) and disabled when no token is configured.
+
+Dependencies:
+- FastAPI
+- app.crud.crud_search.reload_catalog (catalog hot reload)
+- app.api.deps.require_admin_token (admin guard)
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
+
+from app.api import deps
+from app.catalog.catalog import TermCatalog
+from app.crud.crud_search import reload_catalog
+
+router = APIRouter(dependencies=[Depends(deps.require_admin_token)])
+
+
+@router.post("/catalog/reload", response_model=Dict[str, Any])
+async def reload_catalog_endpoint(
+    force: bool = Query(
+        False, description="Swap in a new catalog even if the dataset is unchanged"
+    ),
+    catalog: TermCatalog = Depends(deps.get_catalog),
+):
+    """
+    Rebuild the term catalog from the dataset and swap it in.
+
+    The rebuild runs in a worker thread; search requests keep being served from
+    the current catalog until the new one is ready. Only the worker that handles
+    this request is reloaded; with several workers, set
+    CATALOG_WATCH_INTERVAL_SECONDS so every worker picks up dataset changes.
+
+    Returns:
+        Dict[str, Any]: {"reloaded", "previous_version", "version", "terms"}.
+    """
+    new_catalog, reloaded = await run_in_threadpool(reload_catalog, force=force)
+    return {
+        "reloaded": reloaded,
+        "previous_version": catalog.version,
+        "version": new_catalog.version,
+        "terms": len(new_catalog),
+    }
@@ -1,15 +1,27 @@
-from fastapi import APIRouter
-import pandas as pd
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from collections import Counter  # noqa: F401
 import os
+from typing import Any, Dict, Optional, Tuple
+
+from app.api import deps
+from app.catalog.catalog import TermCatalog
+from app.core.config import settings
+from app.core.http_cache import cache_headers, if_none_match, not_modified, request_etag
+from app.core.serialization import FastJSONResponse, dumps
+from app.core.startup_report import startup_report
+from app.crud.crud_search import add_reload_listener
 
 router = APIRouter()
 
 # caches dataset
 TERM_DATASET = None
 
-# Build path relative to the current file location
-DATASET_PATH = os.path.abspath(
+# caches the encoded /descriptive response as (dataset it was computed from, JSON body)
+DESCRIPTIVE_RESPONSE: Optional[Tuple[Any, bytes]] = None
+
+# Build path relative to the current file location (or the configured dataset)
+DATASET_PATH = settings.CATALOG_DATA_FILE or os.path.abspath(
     os.path.join(
         os.path.dirname(__file__),
         "../../../../Mock_Data/multilingual_statistical_terminology_clean.json",
@@ -17,20 +29,59 @@ DATASET_PATH = os.path.abspath(
 )
 
 
+# read marito data from json into a DataFrame, tagged with the catalog version it matches
+def read_marito_data(version: Optional[str] = None):
+    # pandas is imported on first use so it doesn't slow down cold starts
+    with startup_report.phase("import pandas"):
+        import pandas as pd
+
+    df = pd.read_json(DATASET_PATH)
+    # Normalize column names
+    df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
+    df.attrs["catalog_version"] = version
+    return df
+
+
 # load marito data from json
-async def load_marito_data():
+async def load_marito_data(version: Optional[str] = None):
     global TERM_DATASET
     if TERM_DATASET is None:
-        df = pd.read_json(DATASET_PATH)
-        # Normalize column names
-        df.columns = [col.strip().lower().replace(" ", "_") for col in df.columns]
-        TERM_DATASET = df
+        TERM_DATASET = await run_in_threadpool(read_marito_data, version)
     return TERM_DATASET
 
 
-@router.get("/descriptive")
-async def get_descriptive_analytics():
-    df = await load_marito_data()
+# re-read the dataset after the term catalog is hot-reloaded, so analytics and search agree
+def refresh_marito_data(catalog: TermCatalog) -> None:
+    global TERM_DATASET
+    if TERM_DATASET is not None:
+        # Swap in a fully loaded DataFrame; requests in flight keep the old one
+        TERM_DATASET = read_marito_data(catalog.version)
+
+
+add_reload_listener(refresh_marito_data)
+
+
+@router.get("/descriptive", response_class=FastJSONResponse)
+async def get_descriptive_analytics(
+    request: Request, catalog: TermCatalog = Depends(deps.get_catalog)
+):
+    global DESCRIPTIVE_RESPONSE
+    df = await load_marito_data(catalog.version)
+    # Tag the statistics with the version of the dataset they are computed from, which
+    # lags the catalog until the reload listener has re-read it
+    etag = request_etag(request, str(df.attrs.get("catalog_version")))
+    matched = if_none_match(request, etag)
+    if matched:
+        return not_modified(matched)
+
+    # The statistics only change with the dataset, so compute and encode them once per load
+    cached = DESCRIPTIVE_RESPONSE
+    if cached is None or cached[0] is not df:
+        cached = DESCRIPTIVE_RESPONSE = (df, dumps(compute_descriptive_analytics(df)))
+    return FastJSONResponse(cached[1], headers=cache_headers(etag))
+
+
+def compute_descriptive_analytics(df) -> Dict[str, Any]:
 
     language_columns = [col for col in df.columns if col.endswith("_term")]
     definition_columns = [col for col in df.columns if col.endswith("_definition")]
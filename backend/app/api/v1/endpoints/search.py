@@ -4,51 +4,253 @@ Module: search.py
 This module defines the search endpoint for the API v1 router.
 It provides an HTTP GET route to search multilingual terms
 with optional filters for language, domain, and part of speech,
-and supports sorting by name or popularity, with optional pagination.
+and supports sorting by name, popularity or relevance (BM25 over term text and
+definitions), with page-number or cursor pagination. With fuzzy=true, query
+words with a typo or two still match; with match=phonetic, so do words spelled
+by ear in Nguni, Sotho-Tswana, Tshivenda and Xitsonga terms. Searches that
+find nothing suggest spelling corrections ("did you mean").
+Results can be grouped by concept, returning one row per source concept with
+its translations instead of one row per language.
+It can also return per-language, per-domain and per-part-of-speech hit counts
+for the query, so clients don't need one search per filter value, and only a
+selected set of term attributes (fields=) to keep pages small.
 
 Dependencies:
 - FastAPI
 - app.schemas.term.Term (Pydantic response model)
-- app.crud.crud_search.search_terms (search logic function)
+- app.crud.crud_search.select_page (paged, optionally concept-grouped search function)
+- app.catalog.term_json.TermJSON (cached per-term JSON, via catalog.json)
+- app.core.serialization (fast JSON response encoding)
+- app.crud.crud_search.facet_counts (facet count function)
+- app.crud.crud_search.did_you_mean (spelling corrections for empty results)
+- app.api.deps.get_catalog (shared term catalog dependency)
+- app.api.deps.require_admin_token (guards the /stats report)
 """
 
-from fastapi import APIRouter, Query
-from typing import Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from typing import Optional, Dict, Any, Literal, Tuple
 
 # from app.schemas.term import Term
-from app.crud.crud_search import search_terms
+from app.api import deps
+from app.catalog.catalog import RELEVANCE, TermCatalog
+from app.catalog.cursor import InvalidCursorError
+from app.core.config import settings
+from app.core.http_cache import (
+    cache_headers,
+    if_none_match,
+    not_modified,
+    request_etag,
+    uncached_headers,
+)
+from app.core.memory_report import process_memory
+from app.core.serialization import FastJSONResponse, dumps_array, dumps_object
+from app.crud.crud_search import (
+    did_you_mean,
+    facet_counts,
+    query_words,
+    result_cache,
+    search_flights,
+    select_page,
+)
 
 router = APIRouter()
 
 
-@router.get("/", response_model=Dict[str, Any])
+@router.get("/", response_model=Dict[str, Any], response_class=FastJSONResponse)
 async def search_endpoint(
+    request: Request,
     query: str = Query(..., description="Search term (required)"),
     language: Optional[str] = Query(None, description="Language filter"),
     domain: Optional[str] = Query(None, description="Domain filter"),
     part_of_speech: Optional[str] = Query(None, description="Part of speech filter"),
-    sort_by: str = Query("name", description="Sort by 'name' or 'popularity'"),
-    page: int = Query(1, description="Page number (default 1)"),
-    page_size: int = Query(20, description="Page size (default 20)"),
+    sort_by: str = Query(
+        "name", description="Sort by 'name', 'popularity' or 'relevance'"
+    ),
+    page: int = Query(1, ge=1, description="Page number (default 1)"),
+    page_size: int = Query(
+        20,
+        ge=1,
+        le=settings.SEARCH_MAX_PAGE_SIZE,
+        description="Page size (default 20)",
+    ),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from a previous page (overrides page)"
+    ),
+    include_facets: bool = Query(
+        False,
+        description="Also return hit counts per language, domain and part of speech",
+    ),
+    group_by: Optional[Literal["concept"]] = Query(
+        None,
+        description="'concept' returns one row per source concept with all its translations",
+    ),
+    fuzzy: bool = Query(
+        False, description="Also match query words misspelled by up to two edits"
+    ),
+    match: Literal["substring", "phonetic"] = Query(
+        "substring",
+        description="'phonetic' also matches words that sound alike in Bantu-language terms",
+    ),
+    fields: Optional[Tuple[str, ...]] = Depends(deps.get_term_fields),
+    catalog: TermCatalog = Depends(deps.get_catalog),
 ):
     """
     Search endpoint to retrieve multilingual terms with optional pagination.
 
     Args:
-        query (str): The search term (required).
+        request (Request): The incoming request (for its If-None-Match header and parameters).
+        query (str): The search term (required). Matching ignores case, diacritics and
+            punctuation ("tshivenda" finds "Tshivenḓa", "e mail" finds "e-mail"); terms
+            containing the query as typed are listed first.
         language (Optional[str]): Filter results by language.
         domain (Optional[str]): Filter results by domain.
         part_of_speech (Optional[str]): Filter results by part of speech.
-        sort_by (str): Sorting criterion ('name' or 'popularity'). Defaults to 'name'.
+        sort_by (str): Sorting criterion ('name', 'popularity' or 'relevance'). Defaults to
+            'name'. 'relevance' matches the query word by word against term text and
+            definitions and ranks by BM25 score, term text weighing more.
         page (int): Page number. Defaults to 1.
         page_size (int): Number of items per page. Defaults to 20.
+        cursor (Optional[str]): Opaque cursor from a previous response's 'next_cursor'.
+        include_facets (bool): Whether to include facet counts. Defaults to False.
+        group_by (Optional[str]): 'concept' to collapse language variants into one row per
+            concept; totals and pages then count concepts.
+        fuzzy (bool): Also match terms containing every query word give or take one
+            typo (words of 4-7 characters) or two (longer words).
+        match (str): 'substring' (default) or 'phonetic', which also matches terms
+            whose words sound like the query's words by the spelling rules of the
+            term's language ("thl"/"tlh", "tsh"/"sh", doubled letters, ...). Not
+            supported with sort_by=relevance.
+        fields (Optional[Tuple[str, ...]]): Term attributes to return (from the comma-separated
+            'fields' parameter); every attribute by default. Not supported with group_by.
+        catalog (TermCatalog): The shared term catalog (injected).
 
     Returns:
-        Dict[str, Any]: A dictionary containing 'items' (list of terms) and 'total' (total result count).
+        Dict[str, Any]: A dictionary containing 'items' (list of terms), 'total' (total result count)
+            and 'next_cursor' (cursor for the next page, or None on the last page).
+            With include_facets, also 'facets': {"language": {...}, "domain": {...}, "part_of_speech": {...}},
+            where each facet is counted with the other filters applied (facets always count terms).
+            With group_by=concept, each item is {"concept_id", "term", "matched_languages", "translations"}.
+            When nothing matches, also 'did_you_mean': up to 3 corrected queries, best first;
+            such responses carry no ETag and must be revalidated (Cache-Control: no-cache).
+            Responses carry an ETag (catalog version + parameters); a matching If-None-Match gets 304.
     """
-    results = await search_terms(query, language, domain, part_of_speech, sort_by)
-    total = len(results)
-    start = (page - 1) * page_size
-    end = start + page_size
-    paginated_results = results[start:end]
-    return {"items": paginated_results, "total": total}
+    # Results depend only on the catalog version and the parameters: answer
+    # revalidations before doing any search work.
+    etag = request_etag(request, catalog.version)
+    matched = if_none_match(request, etag)
+    if matched:
+        return not_modified(matched)
+
+    if fields is not None and group_by is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="fields cannot be combined with group_by.",
+        )
+    relevance = sort_by == RELEVANCE
+    phonetic = match == "phonetic"
+    if phonetic and relevance:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="match=phonetic cannot be combined with sort_by=relevance.",
+        )
+    try:
+        result = await select_page(
+            query,
+            language,
+            domain,
+            part_of_speech,
+            sort_by,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+            group_by=group_by,
+            catalog=catalog,
+            fuzzy=fuzzy,
+            phonetic=phonetic,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Items are spliced in from the catalog's cached per-term JSON instead of
+    # building Term models and running them through jsonable_encoder.
+    fragments = catalog.json
+    if group_by == "concept":
+        # Matching the variants of a whole page is CPU bound: keep it off the loop.
+        variants = await run_in_threadpool(
+            catalog.matched_variants_all,
+            result.positions,
+            query,
+            language,
+            domain,
+            part_of_speech,
+            relevance,
+            fuzzy,
+            phonetic,
+        )
+        items = [
+            fragments.concept(position, matched)
+            for position, matched in zip(result.positions, variants)
+        ]
+    else:
+        items = [fragments.term(position, fields) for position in result.positions]
+
+    response: Dict[str, Any] = {
+        "total": result.total,
+        "next_cursor": result.next_cursor,
+    }
+    headers = cache_headers(etag)
+    if result.total:
+        if cursor is None and page == 1:
+            # Count each search once, not once per page.
+            query_words.record(query)
+    elif query:
+        response["did_you_mean"] = await did_you_mean(
+            query, language, domain, part_of_speech, catalog=catalog
+        )
+        # Corrections are ranked by live search counts, which the ETag does not cover.
+        headers = uncached_headers()
+    if include_facets:
+        response["facets"] = await facet_counts(
+            query,
+            language,
+            domain,
+            part_of_speech,
+            catalog=catalog,
+            relevance=relevance,
+            fuzzy=fuzzy,
+            phonetic=phonetic,
+        )
+    return FastJSONResponse(
+        dumps_object(response, {"items": dumps_array(items)}),
+        headers=headers,
+    )
+
+
+@router.get(
+    "/stats",
+    response_model=Dict[str, Any],
+    dependencies=[Depends(deps.require_admin_token)],
+)
+async def search_stats_endpoint():
+    """
+    Report search result cache and request coalescing counters, and the memory
+    of the worker that answers.
+
+    The report exposes process internals, so it is guarded like the admin
+    endpoints (X-Admin-Token, see deps.require_admin_token). With several
+    workers each request may be answered by a different process; the "memory"
+    entry describes the one identified by its pid.
+
+    Returns:
+        Dict[str, Any]: {"result_cache": {size, max_entries, ttl_seconds, hits, misses,
+            evictions, expirations, invalidations}, "single_flight": {in_flight, executions,
+            coalesced}, "query_words": {size, max_words, decays}, "memory": {pid, rss, pss, shared, private, snapshot_rss}}.
+    """
+    return {
+        "result_cache": result_cache.stats(),
+        "single_flight": search_flights.stats(),
+        "query_words": query_words.stats(),
+        # Reading /proc/self/smaps takes a while on a large heap
+        "memory": (await run_in_threadpool(process_memory))._asdict(),
+    }
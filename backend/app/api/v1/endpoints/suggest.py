@@ -4,18 +4,25 @@ Module: suggest.py
 This module defines the suggestion endpoint for the API v1 router.
 It provides an HTTP GET route to retrieve lightweight autocomplete suggestions
 for multilingual terms, returning up to 10 matches where the term starts
-with the provided query string.
+with the provided query string. With fuzzy=true, misspelled words are
+tolerated when too few terms start with the query.
 
 Dependencies:
 - FastAPI
 - app.schemas.term.Term (Pydantic base model)
-- app.crud.crud_search.search_terms (search logic function)
+- app.crud.crud_search.suggest_positions (prefix lookup function)
+- app.catalog.term_json.TermJSON (cached per-term JSON, via catalog.json)
+- app.api.deps.get_catalog (shared term catalog dependency)
 """
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
-from typing import List
-from app.crud.crud_search import search_terms
+from typing import List, Optional
+from app.api import deps
+from app.catalog.catalog import TermCatalog
+from app.core.http_cache import cache_headers, if_none_match, not_modified, request_etag
+from app.core.serialization import FastJSONResponse, dumps_array
+from app.crud.crud_search import suggest_positions
 
 router = APIRouter()
 
@@ -33,22 +40,42 @@ class Suggestion(BaseModel):
     label: str
 
 
-@router.get("/", response_model=List[Suggestion])
-async def suggest_endpoint(query: str = Query(..., description="Partial search term")):
+@router.get("/", response_model=List[Suggestion], response_class=FastJSONResponse)
+async def suggest_endpoint(
+    request: Request,
+    query: str = Query(..., description="Partial search term"),
+    language: Optional[str] = Query(None, description="Language filter"),
+    fuzzy: bool = Query(
+        False, description="Fill up with matches for misspelled query words"
+    ),
+    catalog: TermCatalog = Depends(deps.get_catalog),
+):
     """
     Suggestion endpoint to retrieve autocomplete suggestions.
 
     Args:
+        request (Request): The incoming request (for its If-None-Match header and parameters).
         query (str): The partial search term provided by the frontend.
+        language (Optional[str]): Restrict suggestions to one language.
+        fuzzy (bool): If fewer than 10 terms start with the query, add terms whose words
+            match the query's words give or take a typo or two, closest first.
+        catalog (TermCatalog): The shared term catalog (injected).
 
     Returns:
         List[Suggestion]: A list of up to 10 suggestion objects where
                           the term starts with the provided query.
+                          Carries an ETag; a matching If-None-Match gets 304.
     """
-    terms = await search_terms(query)
-    suggestions = [
-        {"id": str(t.id), "label": t.term}
-        for t in terms
-        if t.term.lower().startswith(query.lower())
-    ][:10]
-    return suggestions
+    etag = request_etag(request, catalog.version)
+    matched = if_none_match(request, etag)
+    if matched:
+        return not_modified(matched)
+
+    positions = await suggest_positions(
+        query, language, limit=10, catalog=catalog, fuzzy=fuzzy
+    )
+    fragments = catalog.json
+    return FastJSONResponse(
+        dumps_array(fragments.suggestion(p) for p in positions),
+        headers=cache_headers(etag),
+    )
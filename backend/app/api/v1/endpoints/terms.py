@@ -0,0 +1,74 @@
+"""
+Module: terms.py
+
+This module defines term lookup endpoints for the API v1 router.
+It provides an HTTP GET route that resolves a term ID to the term and all of
+its language variants (the other terms of the same source concept), optionally
+with only selected attributes (fields=).
+
+Dependencies:
+- FastAPI
+- app.schemas.term.TermTranslations (Pydantic response model)
+- app.crud.crud_search.get_translations (translation lookup function)
+- app.api.deps.get_catalog (shared term catalog dependency)
+"""
+
+from typing import Optional, Tuple
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from app.api import deps
+from app.catalog.catalog import TermCatalog
+from app.core.serialization import FastJSONResponse, dumps_array, dumps_object
+from app.crud.crud_search import get_translations
+from app.schemas.term import TermTranslations
+
+router = APIRouter()
+
+
+@router.get("/{term_id}/translations", response_model=TermTranslations)
+async def term_translations_endpoint(
+    term_id: UUID,
+    fields: Optional[Tuple[str, ...]] = Depends(deps.get_term_fields),
+    catalog: TermCatalog = Depends(deps.get_catalog),
+):
+    """
+    Look up a term and its translations.
+
+    Args:
+        term_id (UUID): ID of the term.
+        fields (Optional[Tuple[str, ...]]): Term attributes to return for the term and
+            each translation; every attribute by default.
+        catalog (TermCatalog): The shared term catalog (injected).
+
+    Returns:
+        TermTranslations: The term and its variants in the other languages
+            (with fields, each term has only the selected attributes).
+
+    Raises:
+        HTTPException: 404 if no term has this ID.
+    """
+    terms = catalog.terms
+    position = terms.position_of(term_id)
+    if position is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Term not found."
+        )
+    if fields is not None:
+        # Partial terms don't validate against TermTranslations, so send the
+        # catalog's term JSON (as search does) instead of the response model
+        fragments = catalog.json
+        return FastJSONResponse(
+            dumps_object(
+                {},
+                {
+                    "term": fragments.term(position, fields),
+                    "translations": dumps_array(
+                        fragments.term(p, fields)
+                        for p in terms.translation_positions(position)
+                    ),
+                },
+            )
+        )
+    return await get_translations(term_id, catalog=catalog)
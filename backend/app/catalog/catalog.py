@@ -0,0 +1,824 @@
+"""
+Module: catalog
+
+This module defines the in-memory term catalog: an immutable snapshot of the
+multilingual terminology dataset that is built once per process and shared by
+every search and suggest request.
+
+The catalog itself knows nothing about where the data comes from; building it
+from the JSON dataset is the job of app.crud.crud_search.
+"""
+
+import heapq
+from array import array
+from bisect import bisect_right
+from itertools import chain, islice
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Set
+
+from app.catalog.facet_index import (
+    FacetIndex,
+    bitmap_from_positions,
+    popcount,
+    positions_from_bitmap,
+)
+from app.catalog.fuzzy_index import FuzzyIndex
+from app.catalog.ngram_index import NgramIndex
+from app.catalog.normalization import normalize_text
+from app.catalog.phonetic_index import PhoneticIndex
+from app.catalog.prefix_index import PrefixIndex
+from app.catalog.relevance_index import RelevanceIndex
+from app.catalog.term_json import TermJSON
+from app.catalog.term_store import TermStore
+from app.schemas.term import Term
+
+FACET_FIELDS = ("language", "domain", "part_of_speech")
+
+# Sort key ranking by BM25 score; unlike "name" and "popularity" it depends on
+# the query, so it has no precomputed order (see TermCatalog.rank_relevance).
+RELEVANCE = "relevance"
+
+
+class CatalogIndexes(NamedTuple):
+    """
+    Every index a TermCatalog searches with.
+
+    Built from the terms by build_indexes(), or read prebuilt from a binary
+    snapshot (see app.catalog.snapshot).
+    """
+
+    ngram_index: NgramIndex
+    prefix_index: PrefixIndex
+    language_prefix_indexes: Dict[str, PrefixIndex]
+    facets: Dict[str, FacetIndex]
+    sort_orders: Dict[str, Sequence[int]]
+    sort_ranks: Dict[str, Sequence[int]]
+    relevance_index: RelevanceIndex
+    fuzzy_index: FuzzyIndex
+    phonetic_index: PhoneticIndex
+
+
+def invert_order(order: Sequence[int]) -> array:
+    """
+    Invert a permutation: return ``ranks`` such that ``ranks[order[r]] == r``.
+
+    Args:
+        order (Sequence[int]): Catalog positions in sort order.
+
+    Returns:
+        array: Rank of every catalog position.
+    """
+    ranks = array("I", bytes(4 * len(order)))
+    for rank, position in enumerate(order):
+        ranks[position] = rank
+    return ranks
+
+
+def build_language_prefix_indexes(
+    keys: Sequence[str], languages: Sequence[str], name_order: Sequence[int]
+) -> Dict[str, PrefixIndex]:
+    """
+    Split the name-sorted order into one prefix index per lower-cased language.
+
+    Args:
+        keys (Sequence[str]): Normalized term text per position.
+        languages (Sequence[str]): Language per position.
+        name_order (Sequence[int]): Positions sorted by (key, position).
+
+    Returns:
+        Dict[str, PrefixIndex]: Lower-cased language -> prefix index.
+    """
+    by_language: Dict[str, List[int]] = {}
+    for position in name_order:
+        by_language.setdefault(languages[position].lower(), []).append(position)
+    return {
+        language: PrefixIndex.from_sorted([keys[i] for i in positions], positions)
+        for language, positions in by_language.items()
+    }
+
+
+def build_indexes(terms: TermStore) -> CatalogIndexes:
+    """
+    Build every catalog index from the term columns.
+
+    Args:
+        terms (TermStore): Terms in catalog order.
+
+    Returns:
+        CatalogIndexes: The built indexes.
+    """
+    ngram_index = NgramIndex(terms.texts)
+    keys = ngram_index.keys
+    positions = range(len(terms))
+
+    # Stable sorts, so ties keep catalog order (matching list.sort on the results).
+    scores = [terms.score(i) for i in positions]
+    sort_orders: Dict[str, Sequence[int]] = {
+        "name": array("I", sorted(positions, key=keys.__getitem__)),
+        "popularity": array("I", sorted(positions, key=lambda i: -scores[i])),
+    }
+    name_order = sort_orders["name"]
+
+    return CatalogIndexes(
+        ngram_index=ngram_index,
+        prefix_index=PrefixIndex.from_sorted([keys[i] for i in name_order], name_order),
+        language_prefix_indexes=build_language_prefix_indexes(
+            keys, terms.column("language"), name_order
+        ),
+        facets={field: FacetIndex(terms.column(field)) for field in FACET_FIELDS},
+        sort_orders=sort_orders,
+        sort_ranks={
+            sort_by: invert_order(order) for sort_by, order in sort_orders.items()
+        },
+        relevance_index=RelevanceIndex(terms.texts, terms.column("definition")),
+        fuzzy_index=FuzzyIndex(terms.texts),
+        phonetic_index=PhoneticIndex(terms.texts, terms.column("language")),
+    )
+
+
+class TermCatalog:
+    """
+    Immutable, process-wide snapshot of the terminology dataset.
+
+    Attributes:
+        terms (TermStore): Every term in dataset order; indexing it builds a Term.
+        version (str): Content hash of the source dataset the catalog was built from.
+        ngram_index (NgramIndex): Trigram index over term text for substring search.
+        prefix_index (PrefixIndex): Sorted prefix index over term text for autocomplete.
+        language_prefix_indexes (Dict[str, PrefixIndex]): Prefix index per lower-cased language.
+        facets (Dict[str, FacetIndex]): Bitmap index per filterable field
+            ("language", "domain", "part_of_speech").
+        sort_orders (Dict[str, Sequence[int]]): Precomputed order per sort key ("name",
+            "popularity"); ``order[rank]`` is a catalog position.
+        sort_ranks (Dict[str, Sequence[int]]): Inverse of sort_orders; ``ranks[position]`` is a rank.
+        relevance_index (RelevanceIndex): BM25 word index over term text and definitions.
+        fuzzy_index (FuzzyIndex): Typo-tolerant word index over term text.
+        phonetic_index (PhoneticIndex): Sound-alike word index over Bantu-language term text.
+        json (TermJSON): Cached response JSON of the terms, filled as they are returned.
+    """
+
+    FACET_FIELDS = FACET_FIELDS
+
+    # Matches covering at least 1/DENSE_RATIO of the catalog are paged by walking the
+    # precomputed sort order; sparser matches use a bounded heap.
+    DENSE_RATIO = 16
+
+    __slots__ = (
+        "_folded",
+        "facets",
+        "fuzzy_index",
+        "json",
+        "language_prefix_indexes",
+        "ngram_index",
+        "phonetic_index",
+        "prefix_index",
+        "relevance_index",
+        "sort_orders",
+        "sort_ranks",
+        "terms",
+        "version",
+    )
+
+    def __init__(
+        self,
+        terms: Sequence[Term],
+        version: str,
+        indexes: Optional[CatalogIndexes] = None,
+    ):
+        self.terms = TermStore.from_terms(terms)
+        self.version = version
+        if indexes is None:
+            indexes = build_indexes(self.terms)
+        (
+            self.ngram_index,
+            self.prefix_index,
+            self.language_prefix_indexes,
+            self.facets,
+            self.sort_orders,
+            self.sort_ranks,
+            self.relevance_index,
+            self.fuzzy_index,
+            self.phonetic_index,
+        ) = indexes
+        self.json = TermJSON(self.terms)
+        self._folded: Optional[bytearray] = None
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def match(
+        self, query: str, fuzzy: bool = False, phonetic: bool = False
+    ) -> List[int]:
+        """
+        Return the positions of terms whose text contains the query.
+
+        Both are compared by their normalized form (see app.catalog.normalization),
+        ignoring case, diacritics and punctuation.
+
+        Args:
+            query (str): The substring to search for.
+            fuzzy (bool): Also match terms containing, for every query word, a
+                word within its typo budget (see app.catalog.fuzzy_index).
+            phonetic (bool): Also match terms containing, for every query word, a
+                word that sounds alike in the term's language (see
+                app.catalog.phonetic_index).
+
+        Returns:
+            List[int]: Matching positions in catalog order.
+        """
+        matched = self.ngram_index.search(query)
+        extra = self._word_matches(query, fuzzy, phonetic)
+        if extra:
+            matched = sorted(extra.union(matched))
+        return matched
+
+    def _word_matches(self, query: str, fuzzy: bool, phonetic: bool) -> Set[int]:
+        # Positions matched word by word, despite typos or by sound (see match).
+        extra: Set[int] = set()
+        if fuzzy and query:
+            extra.update(self.fuzzy_index.match(query))
+        if phonetic and query:
+            extra.update(self.phonetic_index.match(query))
+        return extra
+
+    def suggest(
+        self,
+        prefix: str,
+        k: int = 10,
+        language: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> List[int]:
+        """
+        Return the positions of the first ``k`` terms (alphabetically) starting with a prefix.
+
+        Args:
+            prefix (str): The prefix to match (normalized, see match).
+            k (int): Maximum number of suggestions.
+            language (str, optional): Restrict suggestions to one language (case-insensitive).
+            fuzzy (bool): If fewer than ``k`` terms start with the prefix, fill up
+                with terms containing every word of it give or take a few typos,
+                closest first.
+
+        Returns:
+            List[int]: Matching positions ordered by normalized term text
+            (typo-tolerant matches follow the exact ones).
+        """
+        if not language:
+            found = self.prefix_index.top_k(prefix, k)
+        else:
+            index = self.language_prefix_indexes.get(language.lower())
+            found = index.top_k(prefix, k) if index is not None else []
+        if not fuzzy or len(found) >= k or not prefix:
+            return found
+
+        distances = self.fuzzy_index.match(prefix)
+        mask = self.filter_bitmap(language)
+        seen = set(found)
+        ranks = self.sort_ranks["name"]
+        extra = heapq.nsmallest(
+            k - len(found),
+            (
+                p
+                for p in distances
+                if p not in seen and (mask is None or (mask >> p) & 1)
+            ),
+            key=lambda p: (distances[p], ranks[p]),
+        )
+        return found + extra
+
+    def match_bitmap(
+        self,
+        query: str,
+        relevance: bool = False,
+        fuzzy: bool = False,
+        phonetic: bool = False,
+    ) -> int:
+        """
+        Return the query's match set as a bitmap over catalog positions.
+
+        Args:
+            query (str): Substring to match against the term text (normalized, see match).
+            relevance (bool): Match the query's words against term text and
+                definitions instead, as relevance ranking does.
+            fuzzy (bool): Tolerate typos (see match and rank_relevance).
+            phonetic (bool): Also match sound-alike words (see match); relevance
+                matching ignores it.
+
+        Returns:
+            int: Bitmap of matching positions (every position for an empty query).
+        """
+        if not query:
+            return (1 << len(self.terms)) - 1
+        if relevance:
+            if fuzzy:
+                query = self.fuzzy_index.expand(query)
+            matched = self.relevance_index.match(query)
+        else:
+            matched = self.match(query, fuzzy, phonetic)
+        return bitmap_from_positions(matched, len(self.terms))
+
+    def filter_bitmap(
+        self,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+    ) -> Optional[int]:
+        """
+        Combine the requested facet filters into one bitmap.
+
+        Args:
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+
+        Returns:
+            Optional[int]: Bitmap of positions passing every filter, or None if no filter was given.
+        """
+        mask: Optional[int] = None
+        for field, value in (
+            ("language", language),
+            ("domain", domain),
+            ("part_of_speech", part_of_speech),
+        ):
+            if value:
+                bits = self.facets[field].bitmap(value)
+                mask = bits if mask is None else mask & bits
+        return mask
+
+    def search(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+        fuzzy: bool = False,
+        phonetic: bool = False,
+    ) -> List[int]:
+        """
+        Return the positions of terms matching the query and every given filter.
+
+        Args:
+            query (str): Substring to match against the term text (normalized, see match).
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+            fuzzy (bool): Also match query words with typos (see match).
+            phonetic (bool): Also match sound-alike query words (see match).
+
+        Returns:
+            List[int]: Matching positions in catalog order.
+        """
+        mask = self.filter_bitmap(language, domain, part_of_speech)
+        if mask is None:
+            return self.match(query, fuzzy, phonetic)
+        if not query:
+            return positions_from_bitmap(mask)
+        matched = self.match_bitmap(query, fuzzy=fuzzy, phonetic=phonetic)
+        return positions_from_bitmap(matched & mask)
+
+    def facet_counts(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+        relevance: bool = False,
+        fuzzy: bool = False,
+        phonetic: bool = False,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Count query matches per facet value.
+
+        Each facet is counted with every *other* filter applied, so the counts
+        show how many results a user would get by changing that one filter.
+
+        Args:
+            query (str): Substring to match against the term text (normalized, see match).
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+            relevance (bool): Count the relevance match set (see match_bitmap).
+            fuzzy (bool): Count the typo-tolerant match set (see match_bitmap).
+            phonetic (bool): Count the sound-alike match set (see match_bitmap).
+
+        Returns:
+            Dict[str, Dict[str, int]]: Field -> {display value: hit count}, highest count
+            first. Values with no hits are omitted.
+        """
+        matched = self.match_bitmap(query, relevance, fuzzy, phonetic)
+        filters = {
+            "language": language,
+            "domain": domain,
+            "part_of_speech": part_of_speech,
+        }
+        counts: Dict[str, Dict[str, int]] = {}
+        for field, index in self.facets.items():
+            mask = matched
+            for other, value in filters.items():
+                if other != field and value:
+                    mask &= self.facets[other].bitmap(value)
+            field_counts = []
+            if mask:
+                for key, bits in index.bitmaps.items():
+                    hits = popcount(mask & bits)
+                    if hits:
+                        field_counts.append((index.labels[key], hits))
+            field_counts.sort(key=lambda item: (-item[1], item[0]))
+            counts[field] = dict(field_counts)
+        return counts
+
+    def rank_relevance(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+        fuzzy: bool = False,
+    ) -> array:
+        """
+        Return the terms matching any query word, most relevant first.
+
+        Args:
+            query (str): Free text matched word by word against term text and definitions.
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+            fuzzy (bool): Also score the term words within each query word's typo budget.
+
+        Returns:
+            array: Matching positions by descending BM25 score, ties in catalog
+            order. An empty query has nothing to score, so every term passing
+            the filters is returned in catalog order.
+        """
+        mask = self.filter_bitmap(language, domain, part_of_speech)
+        if not query:
+            return array("I", self.search(query, language, domain, part_of_speech))
+        if fuzzy:
+            query = self.fuzzy_index.expand(query)
+        return self.relevance_index.rank(query, mask)
+
+    def did_you_mean(
+        self,
+        query: str,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+        k: int = 3,
+        searches: Optional[Callable[[str], int]] = None,
+    ) -> List[str]:
+        """
+        Suggest spelling corrections for a query that found nothing.
+
+        Args:
+            query (str): The query.
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+            k (int): Maximum number of corrections.
+            searches (Callable[[str], int], optional): How often users searched for a word.
+
+        Returns:
+            List[str]: Corrected queries whose words occur together in a term
+            passing the filters, best first (see FuzzyIndex.corrections).
+        """
+        mask = self.filter_bitmap(language, domain, part_of_speech)
+        return self.fuzzy_index.corrections(query, k, searches, mask)
+
+    def inexact_matches(self, positions: Sequence[int], query: str) -> Set[int]:
+        """
+        Return the matches whose text contains the query only once both are normalized.
+
+        Exact matches contain the query as typed (ignoring case only); results
+        list them first, so searching "ṱhoho" ranks "ṱhoho" above "thoho" and
+        "e-mail" ranks "e-mail" above "e mail".
+
+        Args:
+            positions (Sequence[int]): Positions matching the query.
+            query (str): The query.
+
+        Returns:
+            Set[int]: The positions that are not exact matches.
+        """
+        needle = query.lower()
+        if not needle:
+            return set()
+        texts = self.terms.texts
+        if normalize_text(query) != needle:
+            return {p for p in positions if needle not in texts[p].lower()}
+        # A plain query can be checked against the key of every text that
+        # normalization leaves as is, without lower-casing the text.
+        keys, folded = self.ngram_index.keys, self._folded_texts()
+        return {
+            p
+            for p in positions
+            if needle not in (texts[p].lower() if folded[p] else keys[p])
+        }
+
+    def _folded_texts(self) -> bytearray:
+        # Per position: whether normalization changes the text beyond lower-casing.
+        if self._folded is None:
+            keys = self.ngram_index.keys
+            self._folded = bytearray(
+                text.lower() != key for text, key in zip(self.terms.texts, keys)
+            )
+        return self._folded
+
+    def rank(self, position: int, sort_by: str, query: str = "") -> int:
+        """
+        Return the rank of a position in a sort order.
+
+        Unknown sort keys fall back to catalog order, where the rank is the position.
+        Given the query, matches that are not exact (see inexact_matches) rank
+        after every exact one.
+
+        Args:
+            position (int): Catalog position.
+            sort_by (str): Sort key ("name" or "popularity").
+            query (str): The query the position matched.
+
+        Returns:
+            int: The position's rank.
+        """
+        ranks = self.sort_ranks.get(sort_by)
+        rank = ranks[position] if ranks is not None else position
+        if query and self.inexact_matches([position], query):
+            rank += len(self.terms)
+        return rank
+
+    def page(
+        self,
+        positions: Sequence[int],
+        sort_by: str,
+        limit: int,
+        offset: int = 0,
+        after_rank: Optional[int] = None,
+        query: str = "",
+    ) -> List[int]:
+        """
+        Select one page of positions in sort order without sorting the whole match set.
+
+        Args:
+            positions (Sequence[int]): Matching positions in ascending order.
+            sort_by (str): Sort key ("name" or "popularity"); anything else keeps catalog order.
+            limit (int): Page size.
+            offset (int): Number of leading items to skip.
+            after_rank (int, optional): Only consider items ranked after this (cursor paging).
+            query (str): The query the positions matched; exact matches come first (see rank).
+
+        Returns:
+            List[int]: Up to `limit` positions in sort order.
+        """
+        inexact = self.inexact_matches(positions, query)
+        if inexact:
+            return self._page_tiered(
+                positions, inexact, sort_by, limit, offset, after_rank
+            )
+        ranks = self.sort_ranks.get(sort_by)
+        if ranks is None:
+            if after_rank is not None:
+                positions = positions[bisect_right(positions, after_rank) :]
+            return list(positions[offset : offset + limit])
+
+        start = 0 if after_rank is None else after_rank + 1
+        if len(positions) * self.DENSE_RATIO >= len(self.terms):
+            # Dense match: walk the precomputed order and keep members.
+            member = bytearray(len(self.terms))
+            for position in positions:
+                member[position] = 1
+            matches = (
+                p for p in islice(self.sort_orders[sort_by], start, None) if member[p]
+            )
+            return list(islice(matches, offset, offset + limit))
+
+        # Sparse match: bounded heap over the candidates, O(m log k).
+        candidates: Sequence[int] = positions
+        if after_rank is not None:
+            candidates = [p for p in positions if ranks[p] >= start]
+        return heapq.nsmallest(offset + limit, candidates, key=ranks.__getitem__)[
+            offset:
+        ]
+
+    def _page_tiered(
+        self,
+        positions: Sequence[int],
+        inexact: Set[int],
+        sort_by: str,
+        limit: int,
+        offset: int,
+        after_rank: Optional[int],
+    ) -> List[int]:
+        # page() with exact matches first: every inexact match ranks len(terms) later.
+        size = len(self.terms)
+        ranks = self.sort_ranks.get(sort_by)
+        start = 0 if after_rank is None else after_rank + 1
+        if ranks is not None and len(positions) * self.DENSE_RATIO >= size:
+            # Dense match: walk the precomputed order once per tier.
+            tier = bytearray(size)
+            for position in positions:
+                tier[position] = 1
+            for position in inexact:
+                tier[position] = 2
+            order = self.sort_orders[sort_by]
+            matches = chain(
+                (p for p in islice(order, start, None) if tier[p] == 1),
+                (p for p in islice(order, max(start - size, 0), None) if tier[p] == 2),
+            )
+            return list(islice(matches, offset, offset + limit))
+
+        def tiered(position: int) -> int:
+            rank = ranks[position] if ranks is not None else position
+            return rank + size if position in inexact else rank
+
+        candidates: Sequence[int] = positions
+        if after_rank is not None:
+            candidates = [p for p in positions if tiered(p) >= start]
+        return heapq.nsmallest(offset + limit, candidates, key=tiered)[offset:]
+
+    def rank_all(
+        self, positions: Sequence[int], sort_by: str, query: str = ""
+    ) -> array:
+        """
+        Order a whole match set by a sort key.
+
+        Args:
+            positions (Sequence[int]): Matching positions in ascending order.
+            sort_by (str): Sort key ("name" or "popularity"); anything else keeps catalog order.
+            query (str): The query the positions matched; exact matches come first (see rank).
+
+        Returns:
+            array: The positions in sort order.
+        """
+        ranks = self.sort_ranks.get(sort_by)
+        inexact = self.inexact_matches(positions, query)
+        if ranks is None:
+            if inexact:
+                # Stable partition: each tier keeps catalog order.
+                positions = [p for p in positions if p not in inexact] + sorted(inexact)
+            return array("I", positions)
+        if not inexact:
+            return array("I", sorted(positions, key=ranks.__getitem__))
+        size = len(self.terms)
+        return array(
+            "I",
+            sorted(positions, key=lambda p: ranks[p] + size * (p in inexact)),
+        )
+
+    def collapse_concepts(self, ranked: Sequence[int]) -> array:
+        """
+        Keep only the best-ranked term of every concept (translation group).
+
+        Args:
+            ranked (Sequence[int]): Positions in sort order.
+
+        Returns:
+            array: One position per concept, in the same order; each concept is
+            represented by its first term in ``ranked``.
+        """
+        group_of = self.terms.group_of
+        seen = bytearray(self.terms.group_count)
+        concepts = array("I")
+        for position in ranked:
+            group = group_of[position]
+            if not seen[group]:
+                seen[group] = 1
+                concepts.append(position)
+        return concepts
+
+    def matched_variants(
+        self,
+        position: int,
+        query: str,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+        relevance: bool = False,
+        fuzzy: bool = False,
+        phonetic: bool = False,
+    ) -> List[int]:
+        """
+        Return the terms of a position's concept that match a query and filters.
+
+        Args:
+            position (int): Any term of the concept.
+            query (str): Substring to match (normalized, see match).
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+            relevance (bool): Match the query's words against term text and
+                definitions instead, as relevance ranking does.
+            fuzzy (bool): Tolerate typos in the query words.
+            phonetic (bool): Also match sound-alike query words (not with relevance).
+
+        Returns:
+            List[int]: Matching positions of the concept, in catalog order.
+        """
+        return self.matched_variants_all(
+            [position],
+            query,
+            language,
+            domain,
+            part_of_speech,
+            relevance,
+            fuzzy,
+            phonetic,
+        )[0]
+
+    def matched_variants_all(
+        self,
+        positions: Sequence[int],
+        query: str,
+        language: Optional[str] = None,
+        domain: Optional[str] = None,
+        part_of_speech: Optional[str] = None,
+        relevance: bool = False,
+        fuzzy: bool = False,
+        phonetic: bool = False,
+    ) -> List[List[int]]:
+        """
+        Return the matching terms of the concept of every position (see matched_variants).
+
+        The query is matched once for all the positions, so a page of concepts
+        costs one search rather than one per row.
+
+        Args:
+            positions (Sequence[int]): Any term of each concept (e.g. a page of concepts).
+            query (str): Substring to match (normalized, see match).
+            language (str, optional): Language filter.
+            domain (str, optional): Domain filter.
+            part_of_speech (str, optional): Part of speech filter.
+            relevance (bool): Match the query's words against term text and
+                definitions instead, as relevance ranking does.
+            fuzzy (bool): Tolerate typos in the query words.
+            phonetic (bool): Also match sound-alike query words (not with relevance).
+
+        Returns:
+            List[List[int]]: Per position, the matching positions of its concept,
+            in catalog order.
+        """
+        keys = self.ngram_index.keys
+        mask = self.filter_bitmap(language, domain, part_of_speech)
+        terms = self.terms
+        if relevance and query:
+            if fuzzy:
+                query = self.fuzzy_index.expand(query)
+            matched = set(self.relevance_index.match(query))
+
+            def matches(members: Sequence[int]) -> List[int]:
+                return [p for p in members if p in matched]
+
+        else:
+            # Typo and sound-alike lookups are done once, not once per concept.
+            needle = normalize_text(query)
+            extra = self._word_matches(query, fuzzy, phonetic)
+            if needle or not query.strip():
+
+                def matches(members: Sequence[int]) -> List[int]:
+                    return [p for p in members if needle in keys[p] or p in extra]
+
+            else:
+                # Only punctuation or symbols: no text contains it (see NgramIndex.search).
+                def matches(members: Sequence[int]) -> List[int]:
+                    return [p for p in members if p in extra]
+
+        variants = []
+        for position in positions:
+            members = terms.group_members(terms.group_of[position])
+            variants.append(
+                [p for p in matches(members) if mask is None or (mask >> p) & 1]
+            )
+        return variants
+
+    def page_ranked(
+        self,
+        ranked: Sequence[int],
+        sort_by: str,
+        limit: int,
+        offset: int = 0,
+        after_rank: Optional[int] = None,
+        query: str = "",
+    ) -> List[int]:
+        """
+        Cut one page from a match set already in sort order (see rank_all).
+
+        Args:
+            ranked (Sequence[int]): Positions in sort order.
+            sort_by (str): The sort key `ranked` is ordered by.
+            limit (int): Page size.
+            offset (int): Number of leading items to skip.
+            after_rank (int, optional): Only return items ranked after this (cursor paging).
+            query (str): The query `ranked` was ordered for (see rank_all).
+
+        Returns:
+            List[int]: Up to `limit` positions in sort order.
+        """
+        start = 0
+        if after_rank is not None:
+            # Binary search for the first item ranked after the cursor.
+            high = len(ranked)
+            while start < high:
+                middle = (start + high) // 2
+                if self.rank(ranked[middle], sort_by, query) <= after_rank:
+                    start = middle + 1
+                else:
+                    high = middle
+        start += offset
+        return list(ranked[start : start + limit])
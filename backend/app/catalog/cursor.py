@@ -0,0 +1,65 @@
+"""
+Module: cursor
+
+This module encodes and decodes the opaque pagination cursors returned by the
+search endpoint as ``next_cursor``.
+
+A cursor records the sort order and the rank (position in that precomputed
+order) of the last item returned, so the next page resumes right after it
+without re-sorting. Cursors are bound to the catalog version they were issued
+for; ranks are meaningless once the catalog changes.
+"""
+
+import base64
+import binascii
+import json
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed, stale, or was issued for another sort order."""
+
+
+def encode_cursor(version: str, sort_by: str, rank: int) -> str:
+    """
+    Encode a pagination cursor.
+
+    Args:
+        version (str): Catalog version the rank refers to.
+        sort_by (str): Sort order the rank refers to.
+        rank (int): Rank of the last item already returned.
+
+    Returns:
+        str: URL-safe opaque cursor token.
+    """
+    payload = json.dumps({"v": version, "s": sort_by, "r": rank}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, version: str, sort_by: str) -> int:
+    """
+    Decode a pagination cursor and validate it against the current request.
+
+    Args:
+        token (str): Cursor token from a previous response.
+        version (str): Current catalog version.
+        sort_by (str): Sort order of the current request.
+
+    Returns:
+        int: Rank of the last item already returned.
+
+    Raises:
+        InvalidCursorError: If the token is malformed, stale or for another sort order.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_version, cursor_sort, rank = payload["v"], payload["s"], payload["r"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Malformed cursor.") from e
+    if not isinstance(rank, int) or rank < 0:
+        raise InvalidCursorError("Malformed cursor.")
+    if cursor_version != version:
+        raise InvalidCursorError("Cursor has expired; the catalog has changed.")
+    if cursor_sort != sort_by:
+        raise InvalidCursorError("Cursor was issued for a different sort order.")
+    return rank
@@ -0,0 +1,136 @@
+"""
+Module: facet_index
+
+This module provides bitmap facet indexes for the catalog's categorical filters
+(language, domain and part of speech).
+
+Each facet value maps to a Python int used as a bitset over catalog positions:
+bit ``i`` is set when the term at position ``i`` has that value. Combining
+filters is then a bitwise AND, and counting matches is a popcount.
+
+Facet values are normalized once here (surrounding whitespace stripped, inner
+whitespace collapsed, case folded to lower), so messy dataset values such as
+"Labour " and request values such as "labour" select the same bitmap.
+"""
+
+from typing import Dict, Iterable, List, Sequence
+
+# Bit offsets set in each possible byte value, for fast bitmap -> positions decoding.
+_BYTE_BITS = [tuple(bit for bit in range(8) if byte >> bit & 1) for byte in range(256)]
+
+
+def normalize_facet_value(value: str) -> str:
+    """
+    Normalize a facet value for lookup.
+
+    Args:
+        value (str): Raw value from the dataset or a request.
+
+    Returns:
+        str: The value with whitespace collapsed and stripped, lower-cased.
+    """
+    return " ".join(value.split()).lower()
+
+
+def bitmap_from_positions(positions: Iterable[int], size: int) -> int:
+    """
+    Build a bitmap with the given positions set.
+
+    Args:
+        positions (Iterable[int]): Positions to set; each must be < size.
+        size (int): Number of positions the bitmap covers.
+
+    Returns:
+        int: The bitmap.
+    """
+    buffer = bytearray((size + 7) // 8)
+    for position in positions:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def positions_from_bitmap(bits: int) -> List[int]:
+    """
+    List the positions set in a bitmap.
+
+    Args:
+        bits (int): The bitmap.
+
+    Returns:
+        List[int]: Set positions in ascending order.
+    """
+    positions: List[int] = []
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index << 3
+            positions.extend(base + bit for bit in _BYTE_BITS[byte])
+    return positions
+
+
+def popcount(bits: int) -> int:
+    """
+    Count the positions set in a bitmap.
+
+    Args:
+        bits (int): The bitmap.
+
+    Returns:
+        int: Number of set bits.
+    """
+    # int.bit_count() would do, but needs Python 3.10.
+    return bin(bits).count("1")  # noqa: FURB161
+
+
+class FacetIndex:
+    """
+    Bitmaps of catalog positions for every normalized value of one facet.
+
+    Attributes:
+        bitmaps (Dict[str, int]): Normalized value -> bitmap of positions with that value.
+        labels (Dict[str, str]): Normalized value -> display form (first seen, stripped).
+    """
+
+    def __init__(self, values: Sequence[str]):
+        positions_by_value: Dict[str, List[int]] = {}
+        self.labels: Dict[str, str] = {}
+        for position, value in enumerate(values):
+            key = normalize_facet_value(value)
+            positions_by_value.setdefault(key, []).append(position)
+            self.labels.setdefault(key, value.strip())
+        size = len(values)
+        self.bitmaps: Dict[str, int] = {
+            key: bitmap_from_positions(positions, size)
+            for key, positions in positions_by_value.items()
+        }
+
+    def bitmap(self, value: str) -> int:
+        """
+        Return the bitmap for a facet value, or an empty bitmap if it is unknown.
+
+        Args:
+            value (str): The facet value (normalized before lookup).
+
+        Returns:
+            int: Bitmap of positions having that value.
+        """
+        return self.bitmaps.get(normalize_facet_value(value), 0)
+
+    @classmethod
+    def from_bitmaps(
+        cls, bitmaps: Dict[str, int], labels: Dict[str, str]
+    ) -> "FacetIndex":
+        """
+        Wrap prebuilt bitmaps (e.g. read from a catalog snapshot).
+
+        Args:
+            bitmaps (Dict[str, int]): Normalized value -> bitmap.
+            labels (Dict[str, str]): Normalized value -> display form.
+
+        Returns:
+            FacetIndex: The index.
+        """
+        index = cls.__new__(cls)
+        index.bitmaps = bitmaps
+        index.labels = labels
+        return index
@@ -0,0 +1,373 @@
+"""
+Module: fuzzy_index
+
+This module provides typo-tolerant word lookup for ``fuzzy=true`` searches,
+using a SymSpell-style deletion dictionary over the words of every term.
+
+Two words within edit distance ``d`` share a string reachable from each by at
+most ``d`` character deletions. The index stores those deletions for every
+word once, at build time; a lookup generates the deletions of the query word
+and only verifies the words they point at. The cost depends on the query's
+length, not on the size of the vocabulary. As in SymSpell, deletions are
+taken from the first PREFIX_LENGTH characters only, which bounds the index
+size for long words.
+
+Deletions are kept as one sorted block of fixed-width UTF-8 keys searched by
+bisection, so the index is a few flat buffers rather than hundreds of
+thousands of small strings, and can be stored in a catalog snapshot.
+"""
+
+import math
+from array import array
+from bisect import bisect_left
+from itertools import islice, product
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Union
+
+from app.catalog.relevance_index import tokenize
+
+# Deletions are generated from at most this many leading characters of a word.
+PREFIX_LENGTH = 7
+MAX_DISTANCE = 2
+
+# Corrections combine at most this many candidates per query word.
+CANDIDATES_PER_WORD = 3
+
+Buffer = Union[bytes, "array[Any]", "memoryview[Any]"]
+
+
+def max_distance(word: str) -> int:
+    """
+    Return how many typos a query word may contain.
+
+    Words of up to 3 characters must match exactly (one edit turns them into
+    too many other words), words of 4 to 7 may have one typo, longer words two.
+
+    Args:
+        word (str): The query word.
+
+    Returns:
+        int: The allowed edit distance.
+    """
+    if len(word) <= 3:
+        return 0
+    return 1 if len(word) <= 7 else MAX_DISTANCE
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    Return the optimal string alignment distance between two strings.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit.
+
+    Args:
+        a (str): First string.
+        b (str): Second string.
+        limit (int): Distances above this are not computed exactly.
+
+    Returns:
+        int: The distance, or ``limit + 1`` if it exceeds ``limit``.
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, before[j - 2] + 1)
+            current[j] = value
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+    return min(previous[-1], limit + 1)
+
+
+def _deletions(word: str, distance: int) -> Set[str]:
+    # The word and every string obtained by deleting up to `distance` characters.
+    found = {word}
+    frontier = {word}
+    for _ in range(distance):
+        frontier = {w[:i] + w[i + 1 :] for w in frontier for i in range(len(w))}
+        found |= frontier
+    return found
+
+
+def _index_distance(length: int) -> int:
+    # Deletions a word needs in the index: enough for the longest query that may
+    # reach it (a query `d` characters longer, if that query is allowed `d` typos).
+    return max(
+        d
+        for d in range(MAX_DISTANCE + 1)
+        if d == 0 or max_distance("x" * (length + d)) >= d
+    )
+
+
+# Beyond PREFIX_LENGTH + MAX_DISTANCE characters every word gets MAX_DISTANCE.
+_INDEX_DISTANCES = [_index_distance(n) for n in range(PREFIX_LENGTH + MAX_DISTANCE)]
+
+
+class _Keys(Sequence[bytes]):
+    """Fixed-width keys of a flat buffer, as a sequence bisect can search."""
+
+    def __init__(self, blob: Buffer, width: int):
+        self.blob = blob
+        self.width = width
+
+    def __len__(self) -> int:
+        return len(self.blob) // self.width if self.width else 0
+
+    def __getitem__(self, i: Any) -> Any:
+        return bytes(self.blob[i * self.width : (i + 1) * self.width])
+
+
+class FuzzyIndex:
+    """
+    Deletion dictionary over the words of term text.
+
+    Attributes:
+        words (List[str]): Sorted vocabulary; a word's ID is its index.
+        offsets (Sequence[int]): Word ``w`` occurs in the terms at
+            ``postings[offsets[w]:offsets[w + 1]]``.
+        postings (Sequence[int]): Ascending catalog positions per word.
+        keys (Buffer): Sorted distinct deletion keys, UTF-8 padded with NULs to
+            ``key_width`` bytes.
+        key_offsets (Sequence[int]): Key ``k`` leads to the words at
+            ``key_words[key_offsets[k]:key_offsets[k + 1]]``.
+        key_words (Sequence[int]): Word IDs per key.
+        key_width (int): Bytes per key.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            texts (Sequence[str]): Term text per position.
+        """
+        by_word: Dict[str, List[int]] = {}
+        for position, text in enumerate(texts):
+            for word in dict.fromkeys(tokenize(text)):
+                by_word.setdefault(word, []).append(position)
+        words = sorted(by_word)
+
+        offsets = array("I", [0])
+        postings = array("I")
+        for word in words:
+            postings.extend(by_word[word])
+            offsets.append(len(postings))
+
+        by_key: Dict[str, List[int]] = {}
+        for word_id, word in enumerate(words):
+            distance = _INDEX_DISTANCES[min(len(word), len(_INDEX_DISTANCES) - 1)]
+            for key in _deletions(word[:PREFIX_LENGTH], distance):
+                ids = by_key.get(key)
+                if ids is None:
+                    by_key[key] = [word_id]
+                else:
+                    ids.append(word_id)
+
+        # Code point order is UTF-8 byte order, so sorted str keys are sorted bytes.
+        encoded = [key.encode("utf-8") for key in sorted(by_key)]
+        width = max(map(len, encoded), default=0)
+        key_offsets = array("I", [0])
+        key_words = array("I")
+        for key in sorted(by_key):
+            key_words.extend(by_key[key])
+            key_offsets.append(len(key_words))
+
+        self.words = words
+        self.offsets: Sequence[int] = offsets
+        self.postings: Sequence[int] = postings
+        self.keys: Buffer = b"".join(key.ljust(width, b"\0") for key in encoded)
+        self.key_offsets: Sequence[int] = key_offsets
+        self.key_words: Sequence[int] = key_words
+        self.key_width = width
+        self._keys = _Keys(self.keys, width)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        words: List[str],
+        offsets: Sequence[int],
+        postings: Sequence[int],
+        keys: Buffer,
+        key_offsets: Sequence[int],
+        key_words: Sequence[int],
+        key_width: int,
+    ) -> "FuzzyIndex":
+        """
+        Wrap prebuilt arrays (e.g. read from a catalog snapshot).
+
+        Args:
+            words (List[str]): Sorted vocabulary.
+            offsets (Sequence[int]): Posting list boundaries per word ID.
+            postings (Sequence[int]): Concatenated posting lists.
+            keys (Buffer): Sorted, padded deletion keys.
+            key_offsets (Sequence[int]): Word list boundaries per key.
+            key_words (Sequence[int]): Concatenated word lists.
+            key_width (int): Bytes per key.
+
+        Returns:
+            FuzzyIndex: The index, without rebuilding it.
+        """
+        index = cls.__new__(cls)
+        index.words = words
+        index.offsets = offsets
+        index.postings = postings
+        index.keys = keys
+        index.key_offsets = key_offsets
+        index.key_words = key_words
+        index.key_width = key_width
+        index._keys = _Keys(keys, key_width)
+        return index
+
+    def positions(self, word_id: int) -> Sequence[int]:
+        """Return the positions of the terms containing a word, ascending."""
+        return self.postings[self.offsets[word_id] : self.offsets[word_id + 1]]
+
+    def lookup(self, word: str, limit: Optional[int] = None) -> Dict[int, int]:
+        """
+        Find the indexed words within a query word's typo budget (see max_distance).
+
+        Args:
+            word (str): A lower-cased query word.
+            limit (int, optional): Edit distance to allow instead of the word's typo budget.
+
+        Returns:
+            Dict[int, int]: Word ID -> edit distance, including an exact match (distance 0).
+        """
+        if limit is None:
+            limit = max_distance(word)
+        keys, width, offsets = self._keys, self.key_width, self.key_offsets
+        candidates: Set[int] = set()
+        for deletion in _deletions(word[:PREFIX_LENGTH], limit):
+            key = deletion.encode("utf-8")
+            if len(key) > width:
+                continue
+            key = key.ljust(width, b"\0")
+            i = bisect_left(keys, key)
+            if i < len(keys) and keys[i] == key:
+                candidates.update(self.key_words[offsets[i] : offsets[i + 1]])
+
+        found = {}
+        for word_id in candidates:
+            distance = edit_distance(word, self.words[word_id], limit)
+            if distance <= limit:
+                found[word_id] = distance
+        return found
+
+    def match(self, query: str) -> Dict[int, int]:
+        """
+        Find the terms containing, for every query word, a word within its typo budget.
+
+        Args:
+            query (str): Free text.
+
+        Returns:
+            Dict[int, int]: Position -> total edit distance over the query words.
+        """
+        matched: Dict[int, int] = {}
+        for n, word in enumerate(dict.fromkeys(tokenize(query))):
+            distances: Dict[int, int] = {}
+            for word_id, distance in self.lookup(word).items():
+                for position in self.positions(word_id):
+                    if distance < distances.get(position, distance + 1):
+                        distances[position] = distance
+            if n == 0:
+                matched = distances
+            else:
+                matched = {
+                    p: matched[p] + d for p, d in distances.items() if p in matched
+                }
+            if not matched:
+                break
+        return matched
+
+    def expand(self, query: str) -> str:
+        """
+        Return the query with every word followed by the indexed words within its typo budget.
+
+        Args:
+            query (str): Free text.
+
+        Returns:
+            str: Space-separated words, for word-based matching such as relevance ranking.
+        """
+        words = tokenize(query)
+        for word in list(words):
+            words.extend(self.words[w] for w in self.lookup(word))
+        return " ".join(dict.fromkeys(words))
+
+    def corrections(
+        self,
+        query: str,
+        k: int = 3,
+        searches: Optional[Callable[[str], int]] = None,
+        mask: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Suggest spelling corrections of a query ("did you mean").
+
+        Each query word is replaced by an indexed word within its typo budget;
+        3-letter words, which searches must match exactly, may have one typo here.
+        Corrections are ranked by total edit distance, then by how common their
+        words are: in how many terms they occur (in any language) and how often
+        they have been searched for. Only corrections whose words occur
+        together in at least one term are returned.
+
+        Args:
+            query (str): The query that found nothing.
+            k (int): Maximum number of corrections.
+            searches (Callable[[str], int], optional): Number of searches for a word.
+            mask (int, optional): Bitmap of the positions allowed (e.g. facet filters).
+
+        Returns:
+            List[str]: Up to ``k`` corrected queries (lower-cased words), best first.
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        if not words:
+            return []
+
+        def weight(word_id: int) -> float:
+            frequency = self.offsets[word_id + 1] - self.offsets[word_id]
+            searched = searches(self.words[word_id]) if searches else 0
+            return math.log1p(frequency) + math.log1p(searched)
+
+        options = []
+        for word in words:
+            found = self.lookup(word, max(max_distance(word), int(len(word) == 3)))
+            if not found:
+                return []
+            ranked = sorted(found, key=lambda w: (found[w], -weight(w)))
+            options.append(
+                [(w, found[w], weight(w)) for w in ranked[:CANDIDATES_PER_WORD]]
+            )
+
+        combinations = sorted(
+            product(*options),
+            key=lambda combo: (
+                sum(distance for _, distance, _ in combo),
+                -sum(w for _, _, w in combo),
+            ),
+        )
+        suggestions = (
+            " ".join(self.words[word_id] for word_id, _, _ in combo)
+            for combo in combinations
+            if any(distance for _, distance, _ in combo)
+            and self._co_occur([word_id for word_id, _, _ in combo], mask)
+        )
+        return list(islice(suggestions, k))
+
+    def _co_occur(self, word_ids: Sequence[int], mask: Optional[int]) -> bool:
+        # Whether one term (passing the mask) contains every word.
+        postings = sorted((self.positions(w) for w in word_ids), key=len)
+        shared = set(postings[0])
+        for positions in postings[1:]:
+            shared.intersection_update(positions)
+            if not shared:
+                return False
+        return any(mask is None or (mask >> p) & 1 for p in shared)
@@ -0,0 +1,121 @@
+"""
+Module: ngram_index
+
+This module provides a character n-gram (trigram by default) inverted index used
+for substring search over term text.
+
+Keys and queries are compared by their normalized form (see
+app.catalog.normalization), and matching keeps the semantics of a plain
+``normalize_text(query) in normalize_text(term)`` scan: the index only narrows
+the candidate set, and every candidate is verified with the same substring
+check before it is returned.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Sequence
+
+from app.catalog.normalization import normalize_text
+
+
+def ngrams(text: str, n: int) -> Iterator[str]:
+    """
+    Yield every contiguous n-character slice of a string.
+
+    Args:
+        text (str): The string to slice.
+        n (int): Length of each slice.
+
+    Returns:
+        Iterator[str]: The n-grams, in order of appearance (may repeat).
+    """
+    for i in range(len(text) - n + 1):
+        yield text[i : i + n]
+
+
+class NgramIndex:
+    """
+    Inverted index from n-grams to the positions of the keys containing them.
+
+    Attributes:
+        n (int): The n-gram length.
+        keys (List[str]): Normalized key per position (the verification text).
+        postings (Dict[str, Sequence[int]]): n-gram -> ascending positions of keys containing it.
+    """
+
+    # Stop intersecting once the next posting list is this many times larger than
+    # the current candidate set; verifying the candidates directly is cheaper.
+    INTERSECT_RATIO = 8
+
+    def __init__(self, keys: Sequence[str], n: int = 3):
+        self.n = n
+        self.keys: List[str] = [normalize_text(key) for key in keys]
+        postings: Dict[str, array] = {}
+        for position, key in enumerate(self.keys):
+            for gram in set(ngrams(key, n)):
+                posting = postings.get(gram)
+                if posting is None:
+                    posting = postings[gram] = array("I")
+                posting.append(position)
+        self.postings: Dict[str, Sequence[int]] = dict(postings)
+
+    @classmethod
+    def from_postings(
+        cls, keys: List[str], postings: Dict[str, Sequence[int]], n: int = 3
+    ) -> "NgramIndex":
+        """
+        Wrap prebuilt posting lists (e.g. read from a catalog snapshot).
+
+        Args:
+            keys (List[str]): Normalized key per position.
+            postings (Dict[str, Sequence[int]]): n-gram -> ascending positions.
+            n (int): The n-gram length the postings were built with.
+
+        Returns:
+            NgramIndex: The index, without rebuilding postings.
+        """
+        index = cls.__new__(cls)
+        index.n = n
+        index.keys = keys
+        index.postings = postings
+        return index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find the positions of all keys containing the query as a substring.
+
+        Args:
+            query (str): The substring to look for (compared normalized).
+
+        Returns:
+            List[int]: Matching positions in ascending order.
+        """
+        needle = normalize_text(query)
+        if not needle:
+            # An empty query matches everything; one of only punctuation or symbols
+            # (e.g. "--") has nothing left to look for, so it matches nothing.
+            return [] if query.strip() else list(range(len(self.keys)))
+        if len(needle) < self.n:
+            # Too short to have an n-gram; fall back to scanning the normalized keys.
+            return [i for i, key in enumerate(self.keys) if needle in key]
+
+        posting_lists = []
+        for gram in set(ngrams(needle, self.n)):
+            posting = self.postings.get(gram)
+            if posting is None:
+                return []
+            posting_lists.append(posting)
+        posting_lists.sort(key=len)
+
+        candidates = set(posting_lists[0])
+        for posting in posting_lists[1:]:
+            if len(posting) > self.INTERSECT_RATIO * len(candidates):
+                break
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+
+        keys = self.keys
+        return sorted(i for i in candidates if needle in keys[i])
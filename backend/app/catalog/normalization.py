@@ -0,0 +1,54 @@
+"""
+Module: normalization
+
+This module defines the search key of term text and queries.
+
+normalize_text() folds away the differences users do not type consistently:
+
+- diacritics and compatibility forms (NFKD, then combining marks dropped), so
+  Tshivenda "ḓ", "ṅ" and "ṱ" match "d", "n" and "t";
+- case (casefold, which also folds e.g. "ß" to "ss");
+- apostrophes, which are dropped ("'", "’", "ʼ", ...);
+- hyphens, slashes, brackets and any other punctuation or symbol, which
+  become spaces, and runs of whitespace, which collapse to one space.
+
+Keys are computed once per term when the catalog is built; queries are
+normalized the same way before matching.
+"""
+
+import string
+import unicodedata
+
+# Dropped rather than turned into a space, so "ng'ombe" matches "ngombe".
+APOSTROPHES = frozenset("'`´ʹʻʼʽ‘’‛′")
+
+_ASCII_FOLD = str.maketrans(
+    {c: None if c in APOSTROPHES else " " for c in string.punctuation}
+)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Return the search key of a text.
+
+    Args:
+        text (str): Term text or a query, in any language.
+
+    Returns:
+        str: Casefolded text without diacritics, apostrophes or punctuation,
+        with single spaces between words and none at either end.
+    """
+    if text.isascii():
+        folded = text.lower().translate(_ASCII_FOLD)
+    else:
+        decomposed = unicodedata.normalize("NFKD", text.casefold())
+        folded = "".join(_fold_char(c) for c in decomposed)
+    return " ".join(folded.split())
+
+
+def _fold_char(c: str) -> str:
+    if unicodedata.combining(c) or c in APOSTROPHES:
+        return ""
+    if unicodedata.category(c)[0] in "PS":
+        return " "
+    return c
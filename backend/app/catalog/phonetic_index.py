@@ -0,0 +1,204 @@
+"""
+Module: phonetic_index
+
+This module provides sound-alike matching for ``match=phonetic`` searches in
+the Nguni, Sotho-Tswana, Tshivenda and Xitsonga terms, which contributors
+often spell by ear ("tlh"/"thl", "sh"/"tsh", doubled vowels).
+
+Every word is reduced to a phonetic key by the rule set of its term's
+language: an ordered list of spelling substitutions applied to the normalized
+word (see app.catalog.normalization), after which runs of one letter collapse
+to a single letter. Words with the same key sound alike. Languages are mapped
+to rule sets in PHONETIC_LANGUAGES; languages without a rule set (English,
+Afrikaans) are not indexed.
+
+The index maps each (rule set, key) pair to the terms containing a word with
+that key, so a lookup is one dictionary probe per query word and rule set,
+whatever the size of the catalog.
+"""
+
+import hashlib
+import re
+from array import array
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from app.catalog.facet_index import normalize_facet_value
+from app.catalog.relevance_index import tokenize
+
+Rules = Tuple[Tuple[str, str], ...]
+
+# Spelling variants heard as one sound in every supported language, applied in
+# order: clusters first, then aspiration, which is often not written.
+_SHARED: Rules = (
+    ("thl", "tlh"),
+    ("tsh", "sh"),
+    ("kh", "k"),
+    ("ph", "p"),
+    ("th", "t"),
+)
+
+# Rule set name -> substitutions.
+PHONETIC_RULES: Dict[str, Rules] = {
+    # isiNdebele and siSwati "tj", isiXhosa "ty" ~ isiZulu "tsh".
+    "nguni": (("tj", "sh"), ("ty", "sh")) + _SHARED,
+    # Setswana "kg" ~ Sesotho "kh"; Setswana "jw" and Sepedi "bj" ~ Sesotho "j".
+    "sotho-tswana": (("kg", "k"), ("jw", "j"), ("bj", "j")) + _SHARED,
+    "venda": (("vh", "v"), ("fh", "f")) + _SHARED,
+    # Xitsonga writes "sh" as "x".
+    "tsonga": (("x", "sh"),) + _SHARED,
+}
+
+# Normalized language -> rule set name.
+PHONETIC_LANGUAGES: Dict[str, str] = {
+    "isizulu": "nguni",
+    "isixhosa": "nguni",
+    "siswati": "nguni",
+    "isindebele": "nguni",
+    "sesotho": "sotho-tswana",
+    "setswana": "sotho-tswana",
+    "sepedi": "sotho-tswana",
+    "tshivenda": "venda",
+    "xitsonga": "tsonga",
+}
+
+_REPEATS = re.compile(r"(.)\1+")
+
+
+def rule_set(language: str) -> Optional[str]:
+    """Return the name of a language's rule set, or None if it has none."""
+    return PHONETIC_LANGUAGES.get(normalize_facet_value(language))
+
+
+def phonetic_key(word: str, rules: str) -> str:
+    """
+    Return the phonetic key of a word.
+
+    Args:
+        word (str): A normalized word (see tokenize).
+        rules (str): Rule set name (a key of PHONETIC_RULES).
+
+    Returns:
+        str: The word with the rule set's substitutions applied and repeated
+        letters collapsed.
+    """
+    for old, new in PHONETIC_RULES[rules]:
+        word = word.replace(old, new)
+    return _REPEATS.sub(r"\1", word)
+
+
+def rules_digest() -> str:
+    """
+    Return a fingerprint of the rule tables.
+
+    Snapshots record it, so a snapshot built with other rules is not used.
+    """
+    tables = repr((sorted(PHONETIC_RULES.items()), sorted(PHONETIC_LANGUAGES.items())))
+    return hashlib.sha256(tables.encode("utf-8")).hexdigest()[:16]
+
+
+class PhoneticIndex:
+    """
+    Inverted index from phonetic keys to the terms containing them.
+
+    Attributes:
+        keys (List[str]): Sorted ``"<rule set> <key>"`` entries; an entry's ID is its index.
+        offsets (Sequence[int]): Entry ``k`` occurs in the terms at
+            ``postings[offsets[k]:offsets[k + 1]]``.
+        postings (Sequence[int]): Ascending catalog positions per entry.
+    """
+
+    def __init__(self, texts: Sequence[str], languages: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            texts (Sequence[str]): Term text per position.
+            languages (Sequence[str]): Language per position.
+        """
+        rule_sets: Dict[str, Optional[str]] = {}
+        by_key: Dict[str, List[int]] = {}
+        for position, (text, language) in enumerate(zip(texts, languages)):
+            rules = rule_sets.get(language)
+            if language not in rule_sets:
+                rules = rule_sets[language] = rule_set(language)
+            if rules is None:
+                continue
+            for word in dict.fromkeys(tokenize(text)):
+                key = f"{rules} {phonetic_key(word, rules)}"
+                positions = by_key.setdefault(key, [])
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+
+        keys = sorted(by_key)
+        offsets = array("I", [0])
+        postings = array("I")
+        for key in keys:
+            postings.extend(by_key[key])
+            offsets.append(len(postings))
+
+        self.keys = keys
+        self.offsets: Sequence[int] = offsets
+        self.postings: Sequence[int] = postings
+        self._ids = {key: i for i, key in enumerate(keys)}
+
+    @classmethod
+    def from_arrays(
+        cls, keys: List[str], offsets: Sequence[int], postings: Sequence[int]
+    ) -> "PhoneticIndex":
+        """
+        Wrap prebuilt arrays (e.g. read from a catalog snapshot).
+
+        Args:
+            keys (List[str]): Sorted entries.
+            offsets (Sequence[int]): Posting list boundaries per entry ID.
+            postings (Sequence[int]): Concatenated posting lists.
+
+        Returns:
+            PhoneticIndex: The index, without rebuilding it.
+        """
+        index = cls.__new__(cls)
+        index.keys = keys
+        index.offsets = offsets
+        index.postings = postings
+        index._ids = {key: i for i, key in enumerate(keys)}
+        return index
+
+    def lookup(self, word: str) -> List[int]:
+        """
+        Find the terms containing a word that sounds like the given one.
+
+        The word is keyed by every rule set, and each key only reaches terms
+        in the languages of its rule set.
+
+        Args:
+            word (str): A normalized query word.
+
+        Returns:
+            List[int]: Matching positions in ascending order.
+        """
+        found: List[int] = []
+        for rules in PHONETIC_RULES:
+            key_id = self._ids.get(f"{rules} {phonetic_key(word, rules)}")
+            if key_id is not None:
+                found.extend(
+                    self.postings[self.offsets[key_id] : self.offsets[key_id + 1]]
+                )
+        return sorted(set(found))
+
+    def match(self, query: str) -> List[int]:
+        """
+        Find the terms containing, for every query word, a sound-alike word.
+
+        Args:
+            query (str): Free text.
+
+        Returns:
+            List[int]: Matching positions in ascending order.
+        """
+        matched: Optional[Set[int]] = None
+        for word in dict.fromkeys(tokenize(query)):
+            found = self.lookup(word)
+            matched = set(found) if matched is None else matched.intersection(found)
+            if not matched:
+                return []
+        return sorted(matched) if matched else []
@@ -0,0 +1,225 @@
+"""
+Module: pos_tags
+
+This module handles part-of-speech tags for the English terms of the dataset.
+
+Tagging is done offline by a build command that runs every English term through
+spaCy in one batched ``nlp.pipe`` pass and writes the results to a versioned
+artifact next to the dataset::
+
+    PYTHONPATH=. python -m app.catalog.pos_tags [--n-process 4]
+
+At runtime the catalog reads that artifact (after checking it was built from
+the same dataset bytes), so the API process only loads spaCy for terms the
+artifact does not cover.
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from app.core.startup_report import startup_report
+
+logger = logging.getLogger(__name__)
+
+SPACY_MODEL = "en_core_web_sm"
+
+# Pipeline components that do not contribute to token.pos_ in en_core_web_sm.
+DISABLED_COMPONENTS = ["parser", "ner", "lemmatizer"]
+
+# Bump when the artifact layout or the tag mapping changes.
+POS_TAGS_FORMAT_VERSION = 1
+
+_SPACY_TO_POS = {
+    "NOUN": "noun",
+    "VERB": "verb",
+    "ADJ": "adjective",
+    "ADV": "adverb",
+}
+
+_nlp: Any = None
+_nlp_lock = threading.Lock()
+
+
+def get_nlp() -> Any:
+    """
+    Return the spaCy pipeline, loading it on first use.
+
+    Returns:
+        spacy.language.Language: The loaded pipeline.
+    """
+    global _nlp
+    if _nlp is None:
+        with _nlp_lock:
+            if _nlp is None:
+                logger.info(f"Loading spaCy model '{SPACY_MODEL}'...")
+                with startup_report.phase(f"spacy.load({SPACY_MODEL})"):
+                    import spacy
+
+                    _nlp = spacy.load(SPACY_MODEL)
+    return _nlp
+
+
+def is_taggable(text: Optional[str]) -> bool:
+    """Only non-empty ASCII (English) text is sent to the tagger."""
+    return bool(text and text.isascii())
+
+
+def pos_from_doc(doc: Any) -> str:
+    """
+    Map the first token of a spaCy Doc to one of our part-of-speech labels.
+
+    Args:
+        doc (spacy.tokens.Doc): The tagged text.
+
+    Returns:
+        str: "noun", "verb", "adjective", "adverb" or "unknown".
+    """
+    if doc is None or len(doc) == 0:
+        return "unknown"
+    return _SPACY_TO_POS.get(doc[0].pos_, "unknown")
+
+
+def pos_tags_path(data_file: Path) -> Path:
+    """
+    Return the path of the POS artifact belonging to a dataset file.
+
+    Args:
+        data_file (Path): The dataset JSON file.
+
+    Returns:
+        Path: ``<dataset stem>.pos.json`` in the same directory.
+    """
+    data_file = Path(data_file)
+    return data_file.with_name(f"{data_file.stem}.pos.json")
+
+
+def tag_texts(
+    texts: Iterable[str], n_process: int = 1, batch_size: int = 256
+) -> Dict[str, str]:
+    """
+    Tag many English texts in one batched spaCy pass.
+
+    Args:
+        texts (Iterable[str]): Texts to tag; duplicates and non-taggable texts are skipped.
+        n_process (int): Number of worker processes for nlp.pipe.
+        batch_size (int): Texts per batch.
+
+    Returns:
+        Dict[str, str]: Text -> part-of-speech label.
+    """
+    unique = sorted({text for text in texts if is_taggable(text)})
+    nlp = get_nlp()
+    with nlp.select_pipes(
+        disable=[c for c in DISABLED_COMPONENTS if c in nlp.pipe_names]
+    ):
+        docs = nlp.pipe(unique, n_process=n_process, batch_size=batch_size)
+        return {text: pos_from_doc(doc) for text, doc in zip(unique, docs)}
+
+
+def build_pos_tags(
+    data_file: Path,
+    output: Optional[Path] = None,
+    n_process: int = 1,
+    batch_size: int = 256,
+) -> Path:
+    """
+    Tag every English term of a dataset and write the POS artifact.
+
+    Args:
+        data_file (Path): The dataset JSON file.
+        output (Path, optional): Artifact path; defaults to pos_tags_path(data_file).
+        n_process (int): Number of worker processes for nlp.pipe.
+        batch_size (int): Texts per batch.
+
+    Returns:
+        Path: The written artifact.
+    """
+    import spacy
+
+    raw_bytes = Path(data_file).read_bytes()
+    rows = json.loads(raw_bytes)
+    tags = tag_texts(
+        (row.get("eng term") or "" for row in rows),
+        n_process=n_process,
+        batch_size=batch_size,
+    )
+    nlp = get_nlp()
+    artifact = {
+        "format_version": POS_TAGS_FORMAT_VERSION,
+        "source_sha256": hashlib.sha256(raw_bytes).hexdigest(),
+        "model": SPACY_MODEL,
+        "model_version": nlp.meta.get("version"),
+        "spacy_version": spacy.__version__,
+        "tags": tags,
+    }
+    output = Path(output) if output else pos_tags_path(data_file)
+    tmp = output.with_name(output.name + ".tmp")
+    tmp.write_text(json.dumps(artifact, ensure_ascii=False, indent=1, sort_keys=True))
+    tmp.replace(output)
+    return output
+
+
+def load_pos_tags(data_file: Path, source_sha256: str) -> Optional[Dict[str, str]]:
+    """
+    Read the POS artifact of a dataset if it is present and up to date.
+
+    Args:
+        data_file (Path): The dataset JSON file.
+        source_sha256 (str): SHA-256 of the dataset bytes being loaded.
+
+    Returns:
+        Optional[Dict[str, str]]: English term -> part of speech, or None if the
+        artifact is missing, from another format version or built from other data.
+    """
+    path = pos_tags_path(data_file)
+    if not path.exists():
+        logger.info(
+            f"No POS artifact at {path}; parts of speech will be tagged at load."
+        )
+        return None
+    try:
+        artifact = json.loads(path.read_text())
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable POS artifact {path}: {e}")
+        return None
+    if artifact.get("format_version") != POS_TAGS_FORMAT_VERSION:
+        logger.warning(f"Ignoring POS artifact {path}: unsupported format version.")
+        return None
+    if artifact.get("source_sha256") != source_sha256:
+        logger.warning(
+            f"Ignoring POS artifact {path}: built from a different dataset. "
+            "Rebuild it with `make pos-tags`."
+        )
+        return None
+    return artifact["tags"]
+
+
+def main() -> None:
+    from app.crud.crud_search import DATA_FILE
+
+    parser = argparse.ArgumentParser(
+        description="Tag the English terms of the dataset and write the POS artifact."
+    )
+    parser.add_argument("--data-file", type=Path, default=DATA_FILE)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--n-process", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    output = build_pos_tags(
+        args.data_file.resolve(),
+        output=args.output,
+        n_process=args.n_process,
+        batch_size=args.batch_size,
+    )
+    print(f"Wrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Module: prefix_index
+
+This module provides a sorted-key prefix index used for autocomplete.
+
+Keys are normalized (see app.catalog.normalization) and kept in sorted order
+alongside their catalog positions, so the first ``k`` keys starting with a
+prefix are found with one binary search followed by a scan of at most ``k``
+entries: O(log n + k).
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import List, Optional, Sequence
+
+from app.catalog.normalization import normalize_text
+
+
+class PrefixIndex:
+    """
+    Sorted (key, position) pairs supporting top-k prefix lookups.
+
+    Ties between equal keys are broken by catalog position, which matches a
+    stable sort of the catalog by normalized term text.
+
+    Attributes:
+        keys (List[str]): Normalized keys in ascending order.
+        positions (Sequence[int]): Catalog position of each entry in ``keys``.
+    """
+
+    def __init__(self, keys: Sequence[str], positions: Optional[Sequence[int]] = None):
+        if positions is None:
+            positions = range(len(keys))
+        entries = sorted(zip((normalize_text(key) for key in keys), positions))
+        self.keys: List[str] = [key for key, _ in entries]
+        self.positions: Sequence[int] = array("I", (p for _, p in entries))
+
+    @classmethod
+    def from_sorted(cls, keys: List[str], positions: Sequence[int]) -> "PrefixIndex":
+        """
+        Wrap keys that are already normalized and sorted by (key, position).
+
+        Args:
+            keys (List[str]): Sorted normalized keys.
+            positions (Sequence[int]): Catalog position of each key.
+
+        Returns:
+            PrefixIndex: The index, without re-sorting.
+        """
+        index = cls.__new__(cls)
+        index.keys = keys
+        index.positions = positions
+        return index
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def top_k(self, prefix: str, k: int) -> List[int]:
+        """
+        Return the positions of the first ``k`` keys (in key order) starting with a prefix.
+
+        Args:
+            prefix (str): The prefix to match (compared normalized).
+            k (int): Maximum number of positions to return.
+
+        Returns:
+            List[int]: Catalog positions ordered by key.
+        """
+        prefix = normalize_text(prefix)
+        keys = self.keys
+        start = bisect_left(keys, prefix)
+        end = min(start + k, len(keys))
+        result = []
+        for i in range(start, end):
+            if not keys[i].startswith(prefix):
+                break
+            result.append(self.positions[i])
+        return result
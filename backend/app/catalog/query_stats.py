@@ -0,0 +1,71 @@
+"""
+Module: query_stats
+
+This module defines QueryWordCounts, a bounded count of the words users
+search for, used to rank spelling corrections ("did you mean") towards what
+people actually look up.
+
+Only queries that found something are counted, so misspellings do not
+reinforce themselves. When more than ``max_words`` distinct words have been
+seen, every count is halved and words that drop to zero are forgotten: the
+counts stay bounded and favour recent traffic.
+"""
+
+import threading
+from typing import Dict
+
+from app.catalog.relevance_index import tokenize
+
+
+class QueryWordCounts:
+    """
+    Thread-safe, bounded counts of the words of searched queries.
+
+    Attributes:
+        max_words (int): Distinct words kept before counts are decayed; 0 disables counting.
+    """
+
+    def __init__(self, max_words: int = 10_000):
+        self.max_words = max_words
+        self._lock = threading.Lock()
+        self._counts: Dict[str, int] = {}
+        self.decays = 0
+
+    def record(self, query: str) -> None:
+        """
+        Count the words of a query.
+
+        Args:
+            query (str): A query that returned results.
+        """
+        if self.max_words <= 0:
+            return
+        words = set(tokenize(query))
+        with self._lock:
+            counts = self._counts
+            for word in words:
+                counts[word] = counts.get(word, 0) + 1
+            if len(counts) > self.max_words:
+                self._counts = {w: c // 2 for w, c in counts.items() if c > 1}
+                self.decays += 1
+
+    def count(self, word: str) -> int:
+        """Return how often a (lower-cased) word has been searched for."""
+        return self._counts.get(word, 0)
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return counters for monitoring.
+
+        Returns:
+            Dict[str, int]: Distinct words counted, the limit, and how often counts were halved.
+        """
+        with self._lock:
+            return {
+                "size": len(self._counts),
+                "max_words": self.max_words,
+                "decays": self.decays,
+            }
@@ -0,0 +1,230 @@
+"""
+Module: relevance_index
+
+This module provides a word-level inverted index with BM25 scoring, used for
+``sort_by=relevance`` searches over term text and definitions.
+
+Each term is one document with two fields: its own text (weighted by
+TERM_BOOST, so a query word in the term name counts more than one in its
+definition) and its English definition. The fields are combined BM25F-style:
+per word, the weighted frequencies are added before saturation.
+
+Query words are matched whole (after normalization), so every posting's BM25
+contribution is query-independent and is computed once at build time. At
+query time, scoring is a single vectorized ``numpy.bincount`` over the
+concatenated posting lists of the query's words. numpy is imported on the
+first relevance query, not at startup.
+"""
+
+import math
+import re
+from array import array
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from app.catalog.normalization import normalize_text
+
+if TYPE_CHECKING:
+    import numpy
+
+_WORD = re.compile(r"\w+")
+
+# Flat numeric storage: an array, or a memoryview cast over a mapped snapshot.
+Buffer = Union["array[Any]", "memoryview[Any]"]
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into normalized words (see app.catalog.normalization).
+
+    Args:
+        text (str): Text in any language.
+
+    Returns:
+        List[str]: The words, in order of appearance (may repeat).
+    """
+    return _WORD.findall(normalize_text(text))
+
+
+class RelevanceIndex:
+    """
+    BM25 inverted index over term text and definitions.
+
+    Attributes:
+        size (int): Number of documents (catalog positions).
+        words (Dict[str, int]): Word -> word ID.
+        offsets (Sequence[int]): Word ``w``'s postings are
+            ``postings[offsets[w]:offsets[w + 1]]``.
+        postings (Buffer): Ascending positions ("I") of the documents containing each word.
+        impacts (Buffer): BM25 contribution ("f") of the word to each posting's document.
+    """
+
+    # BM25 parameters: term frequency saturation and length normalization.
+    K1 = 1.2
+    B = 0.75
+    # Weight of a word in the term text relative to one in the definition.
+    TERM_BOOST = 3.0
+
+    def __init__(self, texts: Sequence[str], definitions: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            texts (Sequence[str]): Term text per position.
+            definitions (Sequence[str]): Definition per position. Terms of one
+                concept share a definition, so each distinct definition is
+                tokenized once.
+        """
+        definition_counts: Dict[str, Tuple[Dict[str, int], int]] = {}
+        documents: List[Dict[str, float]] = []
+        lengths: List[float] = []
+        for text, definition in zip(texts, definitions):
+            counted = definition_counts.get(definition)
+            if counted is None:
+                words = tokenize(definition)
+                counted = definition_counts[definition] = (_count(words), len(words))
+            counts, length = counted
+            weighted: Dict[str, float] = dict(counts)
+            text_words = tokenize(text)
+            for word in text_words:
+                weighted[word] = weighted.get(word, 0) + self.TERM_BOOST
+            documents.append(weighted)
+            lengths.append(length + self.TERM_BOOST * len(text_words))
+
+        size = len(documents)
+        average = (sum(lengths) / size) if size else 0.0
+        by_word: Dict[str, List[int]] = {}
+        for position, weighted in enumerate(documents):
+            for word in weighted:
+                by_word.setdefault(word, []).append(position)
+
+        k1, b = self.K1, self.B
+        offsets = array("I", [0])
+        postings = array("I")
+        impacts = array("f")
+        for word, positions in by_word.items():
+            df = len(positions)
+            idf = math.log(1 + (size - df + 0.5) / (df + 0.5))
+            for position in positions:
+                tf = documents[position][word]
+                norm = k1 * (1 - b + b * lengths[position] / average)
+                impacts.append(idf * tf * (k1 + 1) / (tf + norm))
+            postings.extend(positions)
+            offsets.append(len(postings))
+
+        self.size = size
+        self.words = {word: i for i, word in enumerate(by_word)}
+        self.offsets: Sequence[int] = offsets
+        self.postings: Buffer = postings
+        self.impacts: Buffer = impacts
+        self._arrays: Optional[Tuple[Any, Any]] = None
+
+    @classmethod
+    def from_arrays(
+        cls,
+        size: int,
+        words: Sequence[str],
+        offsets: Sequence[int],
+        postings: Buffer,
+        impacts: Buffer,
+    ) -> "RelevanceIndex":
+        """
+        Wrap prebuilt arrays (e.g. read from a catalog snapshot).
+
+        Args:
+            size (int): Number of documents.
+            words (Sequence[str]): Word per word ID.
+            offsets (Sequence[int]): Posting list boundaries per word ID.
+            postings (Buffer): Concatenated posting lists ("I").
+            impacts (Buffer): BM25 contribution per posting ("f").
+
+        Returns:
+            RelevanceIndex: The index, without rebuilding it.
+        """
+        index = cls.__new__(cls)
+        index.size = size
+        index.words = {word: i for i, word in enumerate(words)}
+        index.offsets = offsets
+        index.postings = postings
+        index.impacts = impacts
+        index._arrays = None
+        return index
+
+    def _numpy_arrays(self) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+        # numpy views of the postings and impacts (zero-copy over arrays and mapped snapshots).
+        if self._arrays is None:
+            import numpy as np
+
+            self._arrays = (
+                np.frombuffer(self.postings, dtype=np.uint32),
+                np.frombuffer(self.impacts, dtype=np.float32),
+            )
+        return self._arrays
+
+    def scores(self, query: str) -> Optional["numpy.ndarray"]:
+        """
+        Score every document against a query.
+
+        Args:
+            query (str): Free text; each distinct word counts once.
+
+        Returns:
+            Optional[numpy.ndarray]: BM25 score per position (0 for documents
+            without any query word), or None if no query word is indexed.
+        """
+        import numpy as np
+
+        postings, impacts = self._numpy_arrays()
+        spans = [
+            (self.offsets[w], self.offsets[w + 1])
+            for w in (self.words.get(word) for word in set(tokenize(query)))
+            if w is not None
+        ]
+        if not spans:
+            return None
+        positions = np.concatenate([postings[start:end] for start, end in spans])
+        weights = np.concatenate([impacts[start:end] for start, end in spans])
+        return np.bincount(positions, weights=weights, minlength=self.size)
+
+    def rank(self, query: str, mask: Optional[int] = None) -> array:
+        """
+        Return the documents matching any query word, best first.
+
+        Args:
+            query (str): Free text.
+            mask (int, optional): Bitmap of the positions allowed (e.g. facet filters).
+
+        Returns:
+            array: Matching positions by descending score; ties keep catalog order.
+        """
+        import numpy as np
+
+        ranked = array("I")
+        scores = self.scores(query)
+        if scores is None:
+            return ranked
+        candidates = np.flatnonzero(scores)
+        if mask is not None:
+            candidates = candidates[self._allowed(mask)[candidates]]
+        order = np.argsort(-scores[candidates], kind="stable")
+        ranked.frombytes(candidates[order].astype(np.uint32).tobytes())
+        return ranked
+
+    def match(self, query: str) -> List[int]:
+        """Return the positions of documents containing any query word, ascending."""
+        import numpy as np
+
+        scores = self.scores(query)
+        return [] if scores is None else np.flatnonzero(scores).tolist()
+
+    def _allowed(self, mask: int) -> "numpy.ndarray":
+        import numpy as np
+
+        packed = np.frombuffer(mask.to_bytes((self.size + 7) // 8, "little"), np.uint8)
+        return np.unpackbits(packed, bitorder="little")[: self.size].astype(bool)
+
+
+def _count(words: Sequence[str]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for word in words:
+        counts[word] = counts.get(word, 0) + 1
+    return counts
@@ -0,0 +1,192 @@
+"""
+Module: result_cache
+
+This module provides a bounded, in-process cache of search results.
+
+Entries hold ranked lists of catalog positions (term IDs within one catalog
+version), never serialized payloads, so a cached result is a few bytes per hit
+and pages of any size can be cut from it. Entries expire after a TTL, the least
+recently used entry is evicted when the cache is full, and the whole cache is
+dropped as soon as it sees a different catalog version.
+"""
+
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+from app.catalog.facet_index import normalize_facet_value
+
+CacheKey = Tuple[Hashable, ...]
+
+
+def make_cache_key(
+    query: str,
+    language: Optional[str],
+    domain: Optional[str],
+    part_of_speech: Optional[str],
+    sort_by: str,
+    group_by: Optional[str] = None,
+    fuzzy: bool = False,
+    phonetic: bool = False,
+) -> CacheKey:
+    """
+    Build a cache key from search parameters.
+
+    Parameters are normalized the same way the catalog compares them, so
+    requests that return the same results share one entry.
+
+    Args:
+        query (str): Search query (matched case-insensitively).
+        language (str, optional): Language filter.
+        domain (str, optional): Domain filter.
+        part_of_speech (str, optional): Part of speech filter.
+        sort_by (str): Sort key.
+        group_by (str, optional): Result grouping ("concept"), if any.
+        fuzzy (bool): Whether typo-tolerant matching was requested.
+        phonetic (bool): Whether sound-alike matching was requested.
+
+    Returns:
+        CacheKey: A hashable key.
+    """
+    return (
+        query.lower(),
+        normalize_facet_value(language or ""),
+        normalize_facet_value(domain or ""),
+        normalize_facet_value(part_of_speech or ""),
+        sort_by,
+        group_by,
+        fuzzy,
+        phonetic,
+    )
+
+
+class SearchResultCache:
+    """
+    LRU + TTL cache of ranked result ID lists, scoped to one catalog version.
+
+    Attributes:
+        max_entries (int): Maximum number of cached queries; 0 disables the cache.
+        ttl_seconds (float): Lifetime of an entry.
+        hits, misses, evictions, expirations, invalidations (int): Running counters.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[CacheKey, Tuple[float, array]] = OrderedDict()
+        self._version: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def _check_version(self, version: str) -> None:
+        # Caller holds the lock.
+        if version != self._version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self._version = version
+
+    def get(self, version: str, key: CacheKey) -> Optional[array]:
+        """
+        Look up a cached result.
+
+        Args:
+            version (str): Version of the catalog the caller is searching.
+            key (CacheKey): Key from make_cache_key().
+
+        Returns:
+            Optional[array]: Ranked catalog positions, or None on a miss.
+        """
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, ids = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return ids
+
+    def contains(self, version: str, key: CacheKey) -> bool:
+        """
+        Check whether a live result is cached, without counting a hit or miss.
+
+        Args:
+            version (str): Version of the catalog the caller is searching.
+            key (CacheKey): Key from make_cache_key().
+
+        Returns:
+            bool: True if get() would currently return a result.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return (
+                version == self._version
+                and entry is not None
+                and entry[0] > self._clock()
+            )
+
+    def put(self, version: str, key: CacheKey, ids: array) -> None:
+        """
+        Store a result, evicting the least recently used entry if the cache is full.
+
+        Args:
+            version (str): Version of the catalog the result was computed from.
+            key (CacheKey): Key from make_cache_key().
+            ids (array): Ranked catalog positions. Treated as read-only once stored.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = (self._clock() + self.ttl_seconds, ids)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Report cache counters.
+
+        Returns:
+            Dict[str, int]: Size, limits and hit/miss/eviction/expiration/invalidation counts.
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": int(self.ttl_seconds),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
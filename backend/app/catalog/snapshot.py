@@ -0,0 +1,455 @@
+"""
+Module: snapshot
+
+This module reads and writes binary catalog snapshots: a single file holding
+every column of a TermCatalog plus its prebuilt indexes, so a cold start can
+skip JSON parsing, pydantic validation and index construction.
+
+The snapshot is generated from the dataset by a build command and written next
+to it as ``<dataset>.catalog.bin``::
+
+    PYTHONPATH=. python -m app.catalog.snapshot
+
+File layout (all integers in native byte order, recorded in the header)::
+
+    MAGIC (8 bytes) | format version (u32) | header length (u32)
+    header (UTF-8 JSON: source hash, catalog version, section table)
+    sections, each 8-byte aligned
+
+Sections are raw ``array`` buffers or NUL-joined UTF-8 strings. The file is
+memory-mapped read-only, and numeric sections (sort orders, n-gram, relevance,
+fuzzy and phonetic postings) are used in place as ``memoryview`` casts instead
+of being copied.
+"""
+
+import argparse
+import json
+import logging
+import mmap
+import struct
+import sys
+from array import array
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from app.catalog.catalog import (
+    CatalogIndexes,
+    TermCatalog,
+    build_language_prefix_indexes,
+)
+from app.catalog.facet_index import FacetIndex
+from app.catalog.fuzzy_index import FuzzyIndex
+from app.catalog.ngram_index import NgramIndex
+from app.catalog.normalization import normalize_text
+from app.catalog.phonetic_index import PhoneticIndex, rules_digest
+from app.catalog.prefix_index import PrefixIndex
+from app.catalog.relevance_index import RelevanceIndex
+from app.catalog.term_store import TABLE_FIELDS, TermStore
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"MVCATSNP"
+
+# Bump when the section layout changes; older snapshots are then ignored.
+SNAPSHOT_FORMAT_VERSION = 6
+
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 8
+_SEPARATOR = "\x00"
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot is missing, corrupt, outdated or cannot represent a catalog."""
+
+
+def snapshot_path(data_file: Path) -> Path:
+    """
+    Return where the snapshot of a dataset lives.
+
+    Args:
+        data_file (Path): The dataset JSON file.
+
+    Returns:
+        Path: ``<dataset stem>.catalog.bin`` next to the dataset.
+    """
+    data_file = Path(data_file)
+    return data_file.with_name(data_file.stem + ".catalog.bin")
+
+
+def _encode_strings(values: Sequence[str]) -> bytes:
+    for value in values:
+        if _SEPARATOR in value:
+            raise SnapshotError(f"Cannot store string containing NUL: {value!r}")
+    return _SEPARATOR.join(values).encode("utf-8")
+
+
+def _decode_strings(blob: memoryview, count: int) -> List[str]:
+    if count == 0:
+        return []
+    values = str(blob, "utf-8").split(_SEPARATOR)
+    if len(values) != count:
+        raise SnapshotError(f"Expected {count} strings, found {len(values)}.")
+    return values
+
+
+def _collect_sections(catalog: TermCatalog) -> Tuple[Dict[str, Any], Dict[str, bytes]]:
+    terms = catalog.terms
+    if terms.extras:
+        raise SnapshotError(
+            "Catalog has terms with related terms, comments or translations outside "
+            "their group; snapshots only hold dataset terms."
+        )
+
+    sections: Dict[str, bytes] = {}
+    counts: Dict[str, int] = {}
+
+    def put_strings(name: str, values: Sequence[str]) -> None:
+        sections[name] = _encode_strings(values)
+        counts[name] = len(values)
+
+    sections["ids"] = terms.ids
+    put_strings("term", terms.texts)
+    for field in TABLE_FIELDS:
+        put_strings(f"{field}.table", terms.tables[field])
+        sections[f"{field}.index"] = array("I", terms.indexes[field]).tobytes()
+    sections["group_of"] = array("I", terms.group_of).tobytes()
+    sections["group_starts"] = array("I", terms.group_starts).tobytes()
+    sections["group_positions"] = array("I", terms.group_positions).tobytes()
+    sections["upvotes"] = array("q", terms.upvotes).tobytes()
+    sections["downvotes"] = array("q", terms.downvotes).tobytes()
+
+    grams = list(catalog.ngram_index.postings)
+    offsets = array("I", [0])
+    flat = array("I")
+    for gram in grams:
+        flat.extend(catalog.ngram_index.postings[gram])
+        offsets.append(len(flat))
+    put_strings("ngram.grams", grams)
+    sections["ngram.offsets"] = offsets.tobytes()
+    sections["ngram.postings"] = flat.tobytes()
+
+    relevance = catalog.relevance_index
+    put_strings("relevance.words", list(relevance.words))
+    sections["relevance.offsets"] = array("I", relevance.offsets).tobytes()
+    sections["relevance.postings"] = array("I", relevance.postings).tobytes()
+    sections["relevance.impacts"] = array("f", relevance.impacts).tobytes()
+
+    fuzzy = catalog.fuzzy_index
+    put_strings("fuzzy.words", fuzzy.words)
+    sections["fuzzy.offsets"] = array("I", fuzzy.offsets).tobytes()
+    sections["fuzzy.postings"] = array("I", fuzzy.postings).tobytes()
+    sections["fuzzy.keys"] = bytes(fuzzy.keys)
+    sections["fuzzy.key_offsets"] = array("I", fuzzy.key_offsets).tobytes()
+    sections["fuzzy.key_words"] = array("I", fuzzy.key_words).tobytes()
+
+    phonetic = catalog.phonetic_index
+    put_strings("phonetic.keys", phonetic.keys)
+    sections["phonetic.offsets"] = array("I", phonetic.offsets).tobytes()
+    sections["phonetic.postings"] = array("I", phonetic.postings).tobytes()
+
+    for sort_by, order in catalog.sort_orders.items():
+        sections[f"order.{sort_by}"] = array("I", order).tobytes()
+        sections[f"rank.{sort_by}"] = array("I", catalog.sort_ranks[sort_by]).tobytes()
+
+    width = (len(terms) + 7) // 8
+    for field, facet in catalog.facets.items():
+        keys = list(facet.bitmaps)
+        put_strings(f"facet.{field}.keys", keys)
+        put_strings(f"facet.{field}.labels", [facet.labels[k] for k in keys])
+        sections[f"facet.{field}.bitmaps"] = b"".join(
+            facet.bitmaps[k].to_bytes(width, "little") for k in keys
+        )
+
+    meta = {
+        "count": len(terms),
+        "ngram_n": catalog.ngram_index.n,
+        "sort_keys": list(catalog.sort_orders),
+        "facet_fields": list(catalog.facets),
+        "fuzzy_key_width": fuzzy.key_width,
+        "phonetic_rules": rules_digest(),
+        "string_counts": counts,
+    }
+    return meta, sections
+
+
+def write_snapshot(
+    catalog: TermCatalog,
+    path: Path,
+    source_sha256: str,
+    pos_tags_sha256: Optional[str] = None,
+) -> Path:
+    """
+    Write a catalog and its indexes to a snapshot file.
+
+    The file is written next to its destination and then renamed over it, so
+    processes that have the previous snapshot mapped keep a consistent view.
+
+    Args:
+        catalog (TermCatalog): The catalog to store.
+        path (Path): Destination file.
+        source_sha256 (str): SHA-256 of the dataset the catalog was built from.
+        pos_tags_sha256 (str, optional): SHA-256 of the POS artifact used, if any.
+
+    Returns:
+        Path: The written snapshot.
+    """
+    meta, sections = _collect_sections(catalog)
+    table: Dict[str, List[int]] = {}
+    offset = 0
+    for name, data in sections.items():
+        offset += -offset % _ALIGNMENT
+        table[name] = [offset, len(data)]
+        offset += len(data)
+    header = json.dumps(
+        {
+            **meta,
+            "byteorder": sys.byteorder,
+            "source_sha256": source_sha256,
+            "pos_tags_sha256": pos_tags_sha256,
+            "catalog_version": catalog.version,
+            "sections": table,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    ).encode("utf-8")
+    header += b" " * (-(_PREAMBLE.size + len(header)) % _ALIGNMENT)
+
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_PREAMBLE.pack(MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)))
+        f.write(header)
+        position = 0
+        for name, data in sections.items():
+            start = table[name][0]
+            f.write(b"\x00" * (start - position))
+            f.write(data)
+            position = start + len(data)
+    tmp.replace(path)
+    return path
+
+
+def read_snapshot(
+    path: Path, source_sha256: str, pos_tags_sha256: Optional[str] = None
+) -> TermCatalog:
+    """
+    Load a catalog from a snapshot file.
+
+    Args:
+        path (Path): The snapshot file.
+        source_sha256 (str): SHA-256 of the dataset being served; the snapshot
+            must have been built from the same bytes.
+        pos_tags_sha256 (str, optional): SHA-256 of the POS artifact being used,
+            if any; the snapshot must have been built with the same artifact.
+
+    Returns:
+        TermCatalog: The catalog, with indexes read from the snapshot.
+
+    Raises:
+        SnapshotError: If the file is missing, corrupt, from another format
+            version or byte order, or built from a different dataset, POS
+            artifact or set of phonetic rules.
+    """
+    try:
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise SnapshotError(f"Cannot map snapshot {path}: {e}") from e
+    view = memoryview(mapped)
+
+    try:
+        magic, format_version, header_length = _PREAMBLE.unpack_from(view)
+        header_end = _PREAMBLE.size + header_length
+        header = json.loads(str(view[_PREAMBLE.size : header_end], "utf-8"))
+    except (struct.error, ValueError) as e:
+        raise SnapshotError(f"Corrupt snapshot header in {path}: {e}") from e
+    if magic != MAGIC:
+        raise SnapshotError(f"{path} is not a catalog snapshot.")
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(f"{path} has unsupported format version {format_version}.")
+    try:
+        if header["byteorder"] != sys.byteorder:
+            raise SnapshotError(
+                f"{path} was written on a {header['byteorder']}-endian host."
+            )
+        if header["source_sha256"] != source_sha256:
+            raise SnapshotError(f"{path} was built from a different dataset.")
+        if header.get("pos_tags_sha256") != pos_tags_sha256:
+            raise SnapshotError(f"{path} was built with a different POS artifact.")
+        if header.get("phonetic_rules") != rules_digest():
+            raise SnapshotError(f"{path} was built with different phonetic rules.")
+
+        return _build_catalog(_Sections(view[header_end:], header, path))
+    except SnapshotError:
+        raise
+    except (AttributeError, IndexError, KeyError, TypeError, ValueError) as e:
+        # A header entry missing or of the wrong type, or a malformed section.
+        raise SnapshotError(f"Corrupt snapshot {path}: {e!r}") from e
+
+
+class _Sections:
+    """Typed access to the sections of a mapped snapshot."""
+
+    def __init__(self, data: memoryview, header: Dict[str, Any], path: Path):
+        self.data = data
+        self.header = header
+        self.path = path
+
+    def raw(self, name: str) -> memoryview:
+        offset, length = self.header["sections"][name]
+        if offset + length > len(self.data):
+            raise SnapshotError(f"Section {name} of {self.path} is truncated.")
+        return self.data[offset : offset + length]
+
+    def ints(self, name: str) -> "memoryview[int]":
+        return self.raw(name).cast("I")
+
+    def counters(self, name: str) -> "memoryview[int]":
+        return self.raw(name).cast("q")
+
+    def floats(self, name: str) -> "memoryview[float]":
+        return self.raw(name).cast("f")
+
+    def strings(self, name: str) -> List[str]:
+        return _decode_strings(self.raw(name), self.header["string_counts"][name])
+
+
+def _build_catalog(sections: _Sections) -> TermCatalog:
+    header = sections.header
+    ints, strings = sections.ints, sections.strings
+    count: int = header["count"]
+
+    ids = bytes(sections.raw("ids"))
+    if len(ids) != 16 * count:
+        raise SnapshotError(f"Expected {count} IDs in {sections.path}.")
+    texts = strings("term")
+    terms = TermStore(
+        ids=ids,
+        texts=texts,
+        tables={field: strings(f"{field}.table") for field in TABLE_FIELDS},
+        indexes={field: ints(f"{field}.index") for field in TABLE_FIELDS},
+        upvotes=sections.counters("upvotes"),
+        downvotes=sections.counters("downvotes"),
+        group_of=ints("group_of"),
+        group_starts=ints("group_starts"),
+        group_positions=ints("group_positions"),
+    )
+
+    keys = [normalize_text(text) for text in texts]
+    grams = strings("ngram.grams")
+    offsets = ints("ngram.offsets")
+    flat = ints("ngram.postings")
+    postings: Dict[str, Sequence[int]] = {
+        gram: flat[offsets[i] : offsets[i + 1]] for i, gram in enumerate(grams)
+    }
+
+    sort_orders: Dict[str, Sequence[int]] = {
+        sort_by: ints(f"order.{sort_by}") for sort_by in header["sort_keys"]
+    }
+    sort_ranks: Dict[str, Sequence[int]] = {
+        sort_by: ints(f"rank.{sort_by}") for sort_by in header["sort_keys"]
+    }
+    name_order = sort_orders["name"]
+
+    width = (count + 7) // 8
+    facets: Dict[str, FacetIndex] = {}
+    for field in header["facet_fields"]:
+        facet_keys = strings(f"facet.{field}.keys")
+        labels = strings(f"facet.{field}.labels")
+        blob = sections.raw(f"facet.{field}.bitmaps")
+        facets[field] = FacetIndex.from_bitmaps(
+            {
+                key: int.from_bytes(blob[i * width : (i + 1) * width], "little")
+                for i, key in enumerate(facet_keys)
+            },
+            dict(zip(facet_keys, labels)),
+        )
+
+    indexes = CatalogIndexes(
+        ngram_index=NgramIndex.from_postings(keys, postings, n=header["ngram_n"]),
+        prefix_index=PrefixIndex.from_sorted([keys[i] for i in name_order], name_order),
+        language_prefix_indexes=build_language_prefix_indexes(
+            keys, terms.column("language"), name_order
+        ),
+        facets=facets,
+        sort_orders=sort_orders,
+        sort_ranks=sort_ranks,
+        relevance_index=RelevanceIndex.from_arrays(
+            count,
+            strings("relevance.words"),
+            ints("relevance.offsets"),
+            ints("relevance.postings"),
+            sections.floats("relevance.impacts"),
+        ),
+        fuzzy_index=FuzzyIndex.from_arrays(
+            strings("fuzzy.words"),
+            ints("fuzzy.offsets"),
+            ints("fuzzy.postings"),
+            sections.raw("fuzzy.keys"),
+            ints("fuzzy.key_offsets"),
+            ints("fuzzy.key_words"),
+            header["fuzzy_key_width"],
+        ),
+        phonetic_index=PhoneticIndex.from_arrays(
+            strings("phonetic.keys"),
+            ints("phonetic.offsets"),
+            ints("phonetic.postings"),
+        ),
+    )
+    return TermCatalog(terms, version=header["catalog_version"], indexes=indexes)
+
+
+@contextmanager
+def build_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on ``<snapshot>.lock`` for the enclosed block.
+
+    Workers that start together take this lock around "read the snapshot or
+    build and write it", so only the first one builds from JSON and the rest
+    map its output. Where ``fcntl`` is unavailable (Windows) or the lock file
+    cannot be created (e.g. a read-only dataset directory) no lock is taken;
+    the atomic rename in write_snapshot() still keeps readers safe, and a
+    snapshot that cannot be written leaves each worker with its own catalog.
+
+    Args:
+        path (Path): The snapshot file.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        yield
+        return
+    lock_path = path.with_name(path.name + ".lock")
+    with ExitStack() as stack:
+        try:
+            lock_file = stack.enter_context(open(lock_path, "a"))
+        except OSError as e:
+            logger.warning(f"Cannot lock {lock_path}; building without a lock: {e}")
+            yield
+            return
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def main() -> None:
+    from app.crud.crud_search import DATA_FILE, build_catalog
+
+    parser = argparse.ArgumentParser(
+        description="Build the binary catalog snapshot of the dataset."
+    )
+    parser.add_argument("--data-file", type=Path, default=DATA_FILE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    data_file = args.data_file.resolve()
+    catalog = build_catalog(data_file, use_snapshot=False, save_snapshot=True)
+    output = snapshot_path(data_file)
+    print(f"Wrote {output} ({len(catalog)} terms, version {catalog.version})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Module: term_json
+
+This module defines TermJSON, the per-catalog cache of pre-encoded JSON for
+terms.
+
+A term's JSON only changes when the catalog does, so each term is encoded the
+first time a response includes it and its bytes are reused after that. The
+cache belongs to one TermCatalog and is dropped with it on reload. It holds at
+most one fragment of each kind per term, so its size is bounded by the
+dataset; only terms that have actually been returned take memory.
+"""
+
+from typing import Any, Callable, Dict, Optional, Sequence
+
+from app.catalog.term_store import TermStore
+from app.core.serialization import dumps, dumps_array, dumps_object
+
+
+class TermJSON:
+    """
+    Encoded JSON fragments for the terms of one catalog, built on first use.
+
+    Every fragment encodes exactly what FastAPI would send for the
+    corresponding response model:
+
+    - term(): app.schemas.term.Term
+    - variant(): app.schemas.term.TermVariant
+    - suggestion(): the suggest endpoint's {"id", "label"}
+    - concept(): app.schemas.term.ConceptMatch
+
+    Concurrent requests may encode the same term twice; both produce the same
+    bytes, so the race is harmless and no lock is taken.
+    """
+
+    def __init__(self, terms: TermStore):
+        self.terms = terms
+        self._terms: Dict[int, bytes] = {}
+        self._variants: Dict[int, bytes] = {}
+        self._suggestions: Dict[int, bytes] = {}
+        self._concepts: Dict[int, bytes] = {}
+
+    def __len__(self) -> int:
+        """Number of cached fragments of any kind."""
+        return (
+            len(self._terms)
+            + len(self._variants)
+            + len(self._suggestions)
+            + len(self._concepts)
+        )
+
+    def term(self, position: int, fields: Optional[Sequence[str]] = None) -> bytes:
+        """
+        Return the JSON of the term at a position.
+
+        Args:
+            position (int): Catalog position.
+            fields (Sequence[str], optional): Term attributes to include, in order;
+                all of them by default. Only full terms are cached, since the
+                number of possible field selections is large.
+
+        Returns:
+            bytes: The encoded term.
+        """
+        if fields is None:
+            return _cached(self._terms, position, self._encode_term)
+        values = self._term_values(position)
+        return dumps({name: values[name] for name in fields})
+
+    def variant(self, position: int) -> bytes:
+        """Return the JSON of the term at a position as a concept variant."""
+        return _cached(self._variants, position, self._encode_variant)
+
+    def suggestion(self, position: int) -> bytes:
+        """Return the JSON of the term at a position as an autocomplete suggestion."""
+        return _cached(self._suggestions, position, self._encode_suggestion)
+
+    def concept(self, position: int, matched: Sequence[int]) -> bytes:
+        """
+        Return the JSON of a concept-grouped search result.
+
+        Args:
+            position (int): The concept's best-ranked matching term.
+            matched (Sequence[int]): Positions of the concept's matching terms.
+
+        Returns:
+            bytes: The encoded ConceptMatch.
+        """
+        terms = self.terms
+        group = terms.group_of[position]
+        head = _cached(self._concepts, group, self._encode_concept_head)
+        members = terms.group_members(group)
+        tail = dumps_object(
+            {},
+            {
+                "term": self.variant(position),
+                "matched_languages": dumps(
+                    [terms.value("language", p) for p in matched]
+                ),
+                "translations": dumps_array(
+                    self.variant(p) for p in members if p != position
+                ),
+            },
+        )
+        # Splice the cached concept fields and the per-request members together.
+        return head[:-1] + b"," + tail[1:]
+
+    def _encode_term(self, position: int) -> bytes:
+        return dumps(self._term_values(position))
+
+    def _term_values(self, position: int) -> Dict[str, Any]:
+        terms = self.terms
+        extra = terms.extras.get(position, {})
+        return {
+            "id": terms.id(position),
+            "term": terms.texts[position],
+            "definition": terms.value("definition", position),
+            "language": terms.value("language", position),
+            "domain": terms.value("domain", position),
+            "part_of_speech": terms.value("part_of_speech", position),
+            "translations": terms.translations(position),
+            "example": terms.value("example", position),
+            "related_terms": list(extra.get("related_terms", ())),
+            "upvotes": terms.upvotes[position],
+            "downvotes": terms.downvotes[position],
+            "comments": list(extra.get("comments", ())),
+        }
+
+    def _encode_variant(self, position: int) -> bytes:
+        terms = self.terms
+        return dumps(
+            {
+                "id": terms.id(position),
+                "term": terms.texts[position],
+                "language": terms.value("language", position),
+                "upvotes": terms.upvotes[position],
+                "downvotes": terms.downvotes[position],
+            }
+        )
+
+    def _encode_suggestion(self, position: int) -> bytes:
+        terms = self.terms
+        return dumps({"id": terms.id(position), "label": terms.texts[position]})
+
+    def _encode_concept_head(self, group: int) -> bytes:
+        terms = self.terms
+        first = terms.group_members(group)[0]
+        return dumps(
+            {
+                "concept_id": terms.id(first),
+                "definition": terms.value("definition", first),
+                "domain": terms.value("domain", first),
+                "part_of_speech": terms.value("part_of_speech", first),
+            }
+        )
+
+
+def _cached(cache: Dict[int, bytes], key: int, encode: Callable[[int], bytes]) -> bytes:
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = cache[key] = encode(key)
+    return fragment
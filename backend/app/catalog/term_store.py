@@ -0,0 +1,335 @@
+"""
+Module: term_store
+
+This module defines TermStore, the compact in-memory representation of the
+catalog's terms.
+
+Instead of one pydantic Term per language row (each carrying a list of ~10
+translation UUIDs and its own copies of the domain and language strings), the
+store keeps columns:
+
+- IDs as one ``bytes`` blob of 16-byte UUIDs
+- term text as a list of strings
+- low-cardinality fields (definition, language, domain, part of speech,
+  example) as a string table plus an integer index per term
+- votes as ``array('q')``
+- translation groups once per source concept: the group of every term plus the
+  members of every group
+
+Term objects are only materialized when indexed (``store[i]``), i.e. for the
+results actually returned. TermStore is a ``Sequence[Term]``, so code that
+reads ``catalog.terms[i]`` keeps working.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple, Union, overload
+from uuid import UUID
+
+from app.schemas.term import Term
+
+# Fields stored as a string table plus an index per term.
+TABLE_FIELDS = ("definition", "language", "domain", "part_of_speech", "example")
+
+
+class TermStore(Sequence[Term]):
+    """
+    Column store of terms, materializing Term models on access.
+
+    Attributes:
+        ids (bytes): 16-byte UUID of every term, concatenated.
+        texts (List[str]): Term text per position.
+        tables (Dict[str, List[str]]): Distinct values per TABLE_FIELDS field.
+        indexes (Dict[str, Sequence[int]]): Per field, the table index of every term.
+        upvotes (Sequence[int]): Upvotes per position.
+        downvotes (Sequence[int]): Downvotes per position.
+        group_of (Sequence[int]): Translation group of every term.
+        group_starts (Sequence[int]): Group g's members are
+            ``group_positions[group_starts[g]:group_starts[g + 1]]``.
+        group_positions (Sequence[int]): Positions of group members, grouped.
+            Together with group_starts this is the concept table: one entry per
+            source concept, listing its term in every language.
+        extras (Dict[int, Dict[str, list]]): Per position, fields that cannot be
+            derived from the columns (translations outside the term's group,
+            related terms, comments).
+    """
+
+    __slots__ = (
+        "_positions",
+        "downvotes",
+        "extras",
+        "group_of",
+        "group_positions",
+        "group_starts",
+        "ids",
+        "indexes",
+        "tables",
+        "texts",
+        "upvotes",
+    )
+
+    def __init__(
+        self,
+        ids: bytes,
+        texts: List[str],
+        tables: Dict[str, List[str]],
+        indexes: Dict[str, Sequence[int]],
+        upvotes: Sequence[int],
+        downvotes: Sequence[int],
+        group_of: Sequence[int],
+        group_starts: Sequence[int],
+        group_positions: Sequence[int],
+        extras: Optional[Dict[int, Dict[str, list]]] = None,
+    ):
+        self.ids = ids
+        self.texts = texts
+        self.tables = tables
+        self.indexes = indexes
+        self.upvotes = upvotes
+        self.downvotes = downvotes
+        self.group_of = group_of
+        self.group_starts = group_starts
+        self.group_positions = group_positions
+        self.extras = extras or {}
+        self._positions: Optional[Dict[bytes, int]] = None
+
+    @classmethod
+    def from_terms(cls, terms: Sequence[Term]) -> "TermStore":
+        """
+        Build a store from Term models.
+
+        Terms that list each other as translations (in store order) share a
+        group; anything the groups cannot express is kept per term in ``extras``.
+
+        Args:
+            terms (Sequence[Term]): Terms in catalog order.
+
+        Returns:
+            TermStore: The store.
+        """
+        if isinstance(terms, TermStore):
+            return terms
+        positions = {t.id: i for i, t in enumerate(terms)}
+        builder = TermStoreBuilder()
+        group_ids: Dict[int, int] = {}
+        for i, t in enumerate(terms):
+            first = min([i] + [positions.get(uid, i) for uid in t.translations])
+            group = group_ids.setdefault(first, len(group_ids))
+            builder.append(
+                t.id,
+                t.term,
+                group=group,
+                definition=t.definition,
+                language=t.language,
+                domain=t.domain,
+                part_of_speech=t.part_of_speech,
+                example=t.example,
+                upvotes=t.upvotes,
+                downvotes=t.downvotes,
+            )
+        store = builder.build()
+        for i, t in enumerate(terms):
+            extra: Dict[str, list] = {}
+            if store.translations(i) != t.translations:
+                extra["translations"] = list(t.translations)
+            if t.related_terms:
+                extra["related_terms"] = list(t.related_terms)
+            if t.comments:
+                extra["comments"] = list(t.comments)
+            if extra:
+                store.extras[i] = extra
+        return store
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @overload
+    def __getitem__(self, index: int) -> Term: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Term]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Term, List[Term]]:
+        if isinstance(index, slice):
+            return [self.materialize(i) for i in range(len(self))[index]]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("term position out of range")
+        return self.materialize(index)
+
+    def __iter__(self) -> Iterator[Term]:
+        return (self.materialize(i) for i in range(len(self)))
+
+    def id(self, position: int) -> UUID:
+        """Return the UUID of the term at a position."""
+        return UUID(bytes=self.ids[16 * position : 16 * position + 16])
+
+    def position_of(self, term_id: UUID) -> Optional[int]:
+        """
+        Return the position of a term by ID, or None if it is not in the store.
+
+        The ID -> position map is built on first use.
+        """
+        positions = self._positions
+        if positions is None:
+            ids = self.ids
+            positions = self._positions = {
+                ids[offset : offset + 16]: offset // 16
+                for offset in range(0, len(ids), 16)
+            }
+        return positions.get(term_id.bytes)
+
+    def value(self, field: str, position: int) -> str:
+        """Return a TABLE_FIELDS value of the term at a position."""
+        return self.tables[field][self.indexes[field][position]]
+
+    def column(self, field: str) -> List[str]:
+        """Return ``field`` ("term" or a TABLE_FIELDS field) for every term."""
+        if field == "term":
+            return self.texts
+        table = self.tables[field]
+        return [table[i] for i in self.indexes[field]]
+
+    def score(self, position: int) -> int:
+        """Return upvotes minus downvotes of the term at a position."""
+        return self.upvotes[position] - self.downvotes[position]
+
+    @property
+    def group_count(self) -> int:
+        """Number of translation groups (source concepts)."""
+        return len(self.group_starts) - 1
+
+    def group_members(self, group: int) -> Sequence[int]:
+        """Return the positions of every term in a translation group."""
+        return self.group_positions[
+            self.group_starts[group] : self.group_starts[group + 1]
+        ]
+
+    def translation_positions(self, position: int) -> List[int]:
+        """Return the positions of the term's translations that are in the store."""
+        extra = self.extras.get(position)
+        if extra is not None and "translations" in extra:
+            found = (self.position_of(uid) for uid in extra["translations"])
+            return [p for p in found if p is not None]
+        return [p for p in self.group_members(self.group_of[position]) if p != position]
+
+    def translations(self, position: int) -> List[UUID]:
+        """Return the translation IDs of the term at a position."""
+        extra = self.extras.get(position)
+        if extra is not None and "translations" in extra:
+            return list(extra["translations"])
+        return [
+            self.id(p)
+            for p in self.group_members(self.group_of[position])
+            if p != position
+        ]
+
+    def materialize(self, position: int) -> Term:
+        """
+        Build the Term model for a position.
+
+        Values come from validated input, so the model is constructed without
+        re-validation.
+        """
+        extra = self.extras.get(position, {})
+        return Term.model_construct(
+            id=self.id(position),
+            term=self.texts[position],
+            definition=self.value("definition", position),
+            language=self.value("language", position),
+            domain=self.value("domain", position),
+            part_of_speech=self.value("part_of_speech", position),
+            translations=self.translations(position),
+            example=self.value("example", position),
+            related_terms=list(extra.get("related_terms", ())),
+            upvotes=self.upvotes[position],
+            downvotes=self.downvotes[position],
+            comments=list(extra.get("comments", ())),
+        )
+
+
+class TermStoreBuilder:
+    """
+    Appends terms one at a time and builds a TermStore.
+
+    Groups must be numbered 0, 1, 2, ... in order of first use.
+    """
+
+    def __init__(self) -> None:
+        self._ids = bytearray()
+        self._texts: List[str] = []
+        self._tables: Dict[str, Dict[str, int]] = {f: {} for f in TABLE_FIELDS}
+        self._indexes: Dict[str, array] = {f: array("I") for f in TABLE_FIELDS}
+        self._upvotes = array("q")
+        self._downvotes = array("q")
+        self._group_of = array("I")
+
+    def append(
+        self,
+        term_id: UUID,
+        term: str,
+        group: int,
+        definition: str = "",
+        language: str = "",
+        domain: str = "",
+        part_of_speech: str = "",
+        example: str = "",
+        upvotes: int = 0,
+        downvotes: int = 0,
+    ) -> int:
+        """
+        Add a term.
+
+        Returns:
+            int: The position of the new term.
+        """
+        values = (definition, language, domain, part_of_speech, example)
+        for field, value in zip(TABLE_FIELDS, values):
+            table = self._tables[field]
+            self._indexes[field].append(table.setdefault(value, len(table)))
+        self._ids += term_id.bytes
+        self._texts.append(term)
+        self._upvotes.append(upvotes)
+        self._downvotes.append(downvotes)
+        self._group_of.append(group)
+        return len(self._texts) - 1
+
+    def build(self) -> TermStore:
+        """Return the store of every term appended so far."""
+        group_starts, group_positions = group_table(self._group_of)
+        return TermStore(
+            ids=bytes(self._ids),
+            texts=self._texts,
+            tables={f: list(table) for f, table in self._tables.items()},
+            indexes=dict(self._indexes),
+            upvotes=self._upvotes,
+            downvotes=self._downvotes,
+            group_of=self._group_of,
+            group_starts=group_starts,
+            group_positions=group_positions,
+        )
+
+
+def group_table(group_of: Sequence[int]) -> Tuple[array, array]:
+    """
+    Invert "group of every position" into the members of every group.
+
+    Args:
+        group_of (Sequence[int]): Group per position, numbered from 0.
+
+    Returns:
+        Tuple[array, array]: (group_starts, group_positions), with the members of
+        each group in position order.
+    """
+    groups = max(group_of, default=-1) + 1
+    counts = array("I", bytes(4 * (groups + 1)))
+    for group in group_of:
+        counts[group + 1] += 1
+    for g in range(groups):
+        counts[g + 1] += counts[g]
+    group_starts = array("I", counts)
+    group_positions = array("I", bytes(4 * len(group_of)))
+    for position, group in enumerate(group_of):
+        group_positions[counts[group]] = position
+        counts[group] += 1
+    return group_starts, group_positions
@@ -0,0 +1,97 @@
+"""
+Module: watcher
+
+This module defines FileWatcher, a daemon thread that polls a few files for
+changes and calls back when any of them changes. It is used to hot-reload the
+term catalog when the dataset (or its POS artifact) is replaced on disk.
+
+Polling ``os.stat`` is used instead of inotify so it works the same on every
+platform and inside containers with mounted volumes.
+"""
+
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (mtime in ns, size) per watched path, or None while a path does not exist.
+Signature = Tuple[Optional[Tuple[int, int]], ...]
+
+
+class FileWatcher:
+    """
+    Calls ``on_change`` from a background thread whenever a watched file changes.
+
+    Attributes:
+        paths (Tuple[Path, ...]): Files being watched.
+        interval (float): Seconds between polls.
+    """
+
+    def __init__(
+        self,
+        paths: Sequence[Path],
+        on_change: Callable[[], object],
+        interval: float,
+    ):
+        self.paths = tuple(Path(p) for p in paths)
+        self.interval = interval
+        self._on_change = on_change
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._signature = self.signature()
+
+    def signature(self) -> Signature:
+        """Return the current (mtime, size) of every watched path."""
+        signature: List[Optional[Tuple[int, int]]] = []
+        for path in self.paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def poll(self) -> bool:
+        """
+        Check the files once and call ``on_change`` if they changed since the last poll.
+
+        A failing callback is logged and not retried until the files change again,
+        so a half-written dataset does not trigger a rebuild on every poll.
+
+        Returns:
+            bool: True if a change was detected.
+        """
+        signature = self.signature()
+        if signature == self._signature:
+            return False
+        self._signature = signature
+        logger.info(f"Change detected in {', '.join(map(str, self.paths))}")
+        try:
+            self._on_change()
+        except Exception:
+            logger.exception("Error handling file change")
+        return True
+
+    def start(self) -> None:
+        """Start polling in a daemon thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="catalog-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop polling and wait for the thread to finish."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.poll()
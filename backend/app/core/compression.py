@@ -0,0 +1,253 @@
+# app/core/compression.py
+"""
+Module: compression
+
+Negotiated response compression.
+
+CompressionMiddleware compresses responses above a size threshold with the
+best encoding the client accepts: brotli when the optional ``brotli`` package
+is installed, otherwise gzip. Search pages are highly repetitive (every
+language row repeats the English definition), so either encoding shrinks them
+several times over for clients on slow links.
+
+The responder works on the plain ASGI messages of the response: it holds back
+the response start until the first body chunk shows whether the body is large
+enough to compress, leaves already encoded, partial and excluded content types
+(e.g. images, event streams) alone, adds ``Vary: Accept-Encoding`` and fixes up
+``Content-Length``, and compresses large chunks off the event loop. Strong
+ETags of compressed responses get the coding as a suffix
+(app.core.http_cache.encoded_etag).
+"""
+
+import zlib
+from typing import Any, Optional, Sequence
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.http_cache import encoded_etag
+
+try:
+    import brotli  # type: ignore[import]
+except ImportError:  # pragma: no cover - exercised only without brotli
+    brotli = None
+
+# gzip level 6 and brotli quality 5 compress search pages nearly as well as the
+# maximum levels at a fraction of the CPU time.
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+# Bodies at least this large are compressed in a worker thread.
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+# Media types (or type prefixes) that are already compressed or must not be buffered.
+EXCLUDED_CONTENT_TYPES = (
+    "application/gzip",
+    "application/x-gzip",
+    "application/zip",
+    "audio/",
+    "font/woff",
+    "image/",
+    "text/event-stream",
+    "video/",
+)
+
+
+def available_encodings() -> Sequence[str]:
+    """Return the supported content codings, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, available: Sequence[str]) -> Optional[str]:
+    """
+    Pick the content coding for a response from an Accept-Encoding header.
+
+    The coding with the highest q-value wins; ties go to the order of
+    ``available``. ``*`` stands for any coding not listed explicitly, and q=0
+    refuses a coding.
+
+    Args:
+        accept_encoding (str): The request's Accept-Encoding header.
+        available (Sequence[str]): Codings the server can produce, most preferred first.
+
+    Returns:
+        Optional[str]: The chosen coding, or None to send the body uncompressed.
+    """
+    weights = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        weights[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in available:
+        quality = weights.get(coding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+class Compressor:
+    """Incremental brotli or gzip compression of one response body."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        self._stream: Any = (
+            brotli.Compressor(quality=BROTLI_QUALITY)
+            if encoding == "br"
+            else zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        )
+
+    def compress(self, body: bytes, final: bool) -> bytes:
+        """
+        Compress the next chunk of the body.
+
+        Args:
+            body (bytes): The chunk.
+            final (bool): Whether it is the last chunk; otherwise the output is
+                flushed so the client can decode everything sent so far.
+
+        Returns:
+            bytes: The compressed chunk.
+        """
+        if self.encoding == "br":
+            compressed = self._stream.process(body)
+            return compressed + (
+                self._stream.finish() if final else self._stream.flush()
+            )
+        compressed = self._stream.compress(body)
+        return compressed + (
+            self._stream.flush() if final else self._stream.flush(zlib.Z_SYNC_FLUSH)
+        )
+
+
+def is_excluded(content_type: str) -> bool:
+    """Whether responses of a Content-Type are sent as they are."""
+    media_type = content_type.partition(";")[0].strip().lower()
+    return media_type.startswith(EXCLUDED_CONTENT_TYPES)
+
+
+class CompressionResponder:
+    """
+    Sends one response, compressed with the negotiated coding if it is large enough.
+
+    With no coding (the client accepts none we offer) large bodies are sent as
+    they are, still marked ``Vary: Accept-Encoding``.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int, encoding: Optional[str]):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encoding = encoding
+        self.send: Send
+        self.start: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[Compressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] == 206
+                or is_excluded(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Hold the start back until the first chunk shows how to send the body.
+                self.start = message
+            return
+        if self.passthrough or message["type"] != "http.response.body":
+            await self._send_start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            if len(body) < self.minimum_size and not more_body:
+                await self._send_start()
+                await self.send(message)
+                return
+            headers = MutableHeaders(raw=self.start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            if self.encoding is not None:
+                self.compressor = Compressor(self.encoding)
+                headers["Content-Encoding"] = self.encoding
+                if more_body or self.start.get("trailers", False):
+                    if "content-length" in headers:
+                        del headers["Content-Length"]
+            if self.compressor is not None:
+                body = await self._compress(body, final=not more_body)
+                if not more_body and "content-length" in headers:
+                    headers["Content-Length"] = str(len(body))
+            await self._send_start()
+        elif self.compressor is not None:
+            body = await self._compress(body, final=not more_body)
+        await self.send({**message, "body": body})
+
+    async def _send_start(self) -> None:
+        if self.start is not None:
+            start, self.start = self.start, None
+            await self.send(start)
+
+    async def _compress(self, body: bytes, final: bool) -> bytes:
+        assert self.compressor is not None
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            # Compressing large bodies inline would block the event loop.
+            return await anyio.to_thread.run_sync(self.compressor.compress, body, final)
+        return self.compressor.compress(body, final)
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least ``minimum_size`` bytes with brotli or gzip.
+
+    Attributes:
+        minimum_size (int): Smaller responses are sent uncompressed.
+        encodings (Sequence[str]): Codings offered, most preferred first.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.encodings = available_encodings()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        encoding = negotiate_encoding(
+            headers.get("Accept-Encoding", ""), self.encodings
+        )
+        responder = CompressionResponder(self.app, self.minimum_size, encoding)
+
+        async def send_with_etag(message: Message) -> None:
+            # A compressed body is a different representation: give it its own ETag.
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(raw=message["headers"])
+                coding = headers.get("content-encoding")
+                etag = headers.get("etag")
+                if coding and coding in self.encodings and etag:
+                    headers["ETag"] = encoded_etag(etag, coding)
+            await send(message)
+
+        await responder(scope, receive, send_with_etag)
@@ -30,6 +30,53 @@ class Settings(BaseSettings):
 
     GITHUB_ORGANIZATION: str = os.getenv("GITHUB_ORGANIZATION", "cos301-se-2025")
 
+    # Upper bound for the search endpoint's page_size parameter
+    SEARCH_MAX_PAGE_SIZE: int = int(os.getenv("SEARCH_MAX_PAGE_SIZE", "1000"))
+
+    # Load heavy, lazily imported dependencies (pandas, analytics dataset) in a
+    # background task after startup instead of on the first request that needs them
+    WARM_UP_ON_STARTUP: bool = os.getenv("WARM_UP_ON_STARTUP", "false").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
+
+    # Search result cache: number of distinct queries kept (0 disables it) and entry lifetime
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "1024"))
+    SEARCH_CACHE_TTL_SECONDS: float = float(
+        os.getenv("SEARCH_CACHE_TTL_SECONDS", "300")
+    )
+    # Distinct searched words counted to rank "did you mean" corrections (0 disables counting)
+    QUERY_WORD_COUNTS_MAX_WORDS: int = int(
+        os.getenv("QUERY_WORD_COUNTS_MAX_WORDS", "10000")
+    )
+
+    # Compress responses of at least this many bytes with brotli (if installed) or gzip,
+    # as negotiated with the client; 0 compresses every response, -1 disables compression
+    RESPONSE_COMPRESSION_MIN_BYTES: int = int(
+        os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024")
+    )
+
+    # Cache-Control max-age of search, suggest and analytics responses; clients revalidate
+    # with If-None-Match afterwards (ETags change with the catalog version)
+    HTTP_CACHE_MAX_AGE_SECONDS: int = int(os.getenv("HTTP_CACHE_MAX_AGE_SECONDS", "60"))
+
+    # Build the catalog snapshot at startup if it is missing or stale, and serve from
+    # the memory-mapped file, so multiple workers share one copy of the indexes
+    CATALOG_SHARED_SNAPSHOT: bool = os.getenv(
+        "CATALOG_SHARED_SNAPSHOT", "false"
+    ).lower() in ("1", "true", "yes")
+
+    # Terminology dataset served by search (defaults to the bundled Mock_Data file)
+    CATALOG_DATA_FILE: Optional[str] = os.getenv("CATALOG_DATA_FILE")
+    # Poll the dataset (and its POS artifact) for changes and hot-reload the catalog;
+    # 0 disables the watcher
+    CATALOG_WATCH_INTERVAL_SECONDS: float = float(
+        os.getenv("CATALOG_WATCH_INTERVAL_SECONDS", "0")
+    )
+    # Shared secret for /admin endpoints (sent as X-Admin-Token); unset disables them
+    ADMIN_API_TOKEN: Optional[str] = os.getenv("ADMIN_API_TOKEN")
+
     # Let Pydantic-Settings load this as a plain string, or None if not set
     # We will parse it into a list in the __init__ or a validator.
     # For environment variables, pydantic-settings will load it as a string.
@@ -0,0 +1,110 @@
+# app/core/http_cache.py
+"""
+Module: http_cache
+
+HTTP caching headers for responses that depend only on the catalog version
+and the request's query parameters (search, suggest, analytics).
+
+- request_etag() derives a strong ETag from the catalog version, the path and
+  the normalized query parameters, without computing the response.
+- if_none_match() checks a request's If-None-Match header against it, so an
+  endpoint can answer 304 Not Modified before doing any search work.
+- cache_headers() returns the ETag and Cache-Control headers for a 200.
+- uncached_headers() is for responses that also depend on mutable state (e.g.
+  search statistics), which must be revalidated every time and get no ETag.
+
+A compressed response is a different representation, so the compression
+middleware tags it ``"<etag>-<coding>"`` (see encoded_etag). If-None-Match
+accepts both forms.
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+from fastapi import Request, Response, status
+
+from app.core.config import settings
+
+# Content codings whose suffix may follow an ETag (see encoded_etag).
+ENCODING_SUFFIXES = ("-br", "-gzip")
+
+
+def request_etag(request: Request, version: str) -> str:
+    """
+    Build the strong ETag of a GET response.
+
+    Query parameters are sorted and blank ones dropped, so equivalent URLs
+    share one ETag.
+
+    Args:
+        request (Request): The incoming request.
+        version (str): Version of the data the response is computed from.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    params = sorted((k, v) for k, v in request.query_params.multi_items() if v != "")
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(version.encode())
+    digest.update(b"\0" + request.url.path.rstrip("/").encode())
+    for key, value in params:
+        digest.update(b"\0" + key.encode() + b"=" + value.encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def encoded_etag(etag: str, coding: str) -> str:
+    """Return the ETag of the ``coding``-encoded representation of a response."""
+    if etag.startswith("W/") or not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{coding}"'
+
+
+def if_none_match(request: Request, etag: str) -> Optional[str]:
+    """
+    Check the request's If-None-Match header against an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, and treats
+    the tags of compressed representations as matching the uncompressed one.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The response's (uncompressed) ETag.
+
+    Returns:
+        Optional[str]: The matching tag as the client sent it, or None if the
+        client's copy is stale or it sent no If-None-Match.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return None
+    for tag in header.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return etag
+        opaque = tag.removeprefix("W/")
+        if opaque == etag:
+            return tag
+        for suffix in ENCODING_SUFFIXES:
+            if opaque == f'{etag[:-1]}{suffix}"':
+                return tag
+    return None
+
+
+def cache_headers(etag: str) -> Dict[str, str]:
+    """Return the ETag and Cache-Control headers of a cacheable response."""
+    return {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}",
+    }
+
+
+def uncached_headers() -> Dict[str, str]:
+    """Return the Cache-Control header of a response that must not be reused unvalidated."""
+    return {"Cache-Control": "no-cache"}
+
+
+def not_modified(etag: str) -> Response:
+    """Return a 304 Not Modified response for a matching If-None-Match."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag)
+    )
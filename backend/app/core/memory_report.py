@@ -0,0 +1,171 @@
+# app/core/memory_report.py
+"""
+Module: memory_report
+
+Measures how much memory each API worker costs, for sizing instances.
+
+- process_memory() reads /proc/<pid>/smaps for one process and splits its
+  resident memory into shared and private pages, plus the part of it that is
+  the memory-mapped catalog snapshot (shared by every worker on the host).
+- The command line starts N worker processes that each load the catalog the
+  way the API does, then prints their memory side by side::
+
+    PYTHONPATH=. python -m app.core.memory_report --workers 4
+
+The per-worker cost of adding a worker is its private memory; the total for a
+host is the sum of the workers' PSS (proportional set size), which counts each
+shared page once.
+"""
+
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_SUFFIX = ".catalog.bin"
+
+
+class MemoryUsage(NamedTuple):
+    """Memory of one process, in bytes. Fields are None where /proc is unavailable."""
+
+    pid: int
+    rss: Optional[int]
+    pss: Optional[int]
+    shared: Optional[int]
+    private: Optional[int]
+    snapshot_rss: Optional[int]
+
+
+def process_memory(pid: Optional[int] = None) -> MemoryUsage:
+    """
+    Measure the resident memory of a process.
+
+    Args:
+        pid (int, optional): Process to measure; defaults to the current process.
+
+    Returns:
+        MemoryUsage: RSS, PSS, shared and private resident bytes, and the resident
+        bytes of mapped catalog snapshots. Off Linux only the peak RSS of the
+        current process is known.
+    """
+    pid = os.getpid() if pid is None else pid
+    smaps = Path(f"/proc/{pid}/smaps")
+    try:
+        lines = smaps.read_text().splitlines()
+    except OSError:
+        return MemoryUsage(pid, _peak_rss(), None, None, None, None)
+
+    totals: Dict[str, int] = {}
+    snapshot_rss = 0
+    in_snapshot = False
+    for line in lines:
+        fields = line.split()
+        if not fields:
+            continue
+        if not fields[0].endswith(":"):
+            # Mapping header: "address perms offset dev inode [path]"
+            in_snapshot = len(fields) >= 6 and fields[5].endswith(SNAPSHOT_SUFFIX)
+            continue
+        if len(fields) == 3 and fields[2] == "kB":
+            key = fields[0][:-1]
+            kib = int(fields[1])
+            totals[key] = totals.get(key, 0) + kib
+            if in_snapshot and key == "Rss":
+                snapshot_rss += kib
+
+    return MemoryUsage(
+        pid=pid,
+        rss=totals.get("Rss", 0) * 1024,
+        pss=totals.get("Pss", 0) * 1024,
+        shared=(totals.get("Shared_Clean", 0) + totals.get("Shared_Dirty", 0)) * 1024,
+        private=(totals.get("Private_Clean", 0) + totals.get("Private_Dirty", 0))
+        * 1024,
+        snapshot_rss=snapshot_rss * 1024,
+    )
+
+
+def _peak_rss() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:
+        return None
+    # ru_maxrss is in KiB on Linux and bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+def _load_and_measure(ready: Any, done: Any, results: Any) -> None:
+    from app.crud.crud_search import get_catalog
+
+    get_catalog()
+    ready.wait()  # measure once every worker has loaded, so shared pages are shared
+    results.put(process_memory())
+    done.wait()
+
+
+def measure_workers(workers: int) -> List[MemoryUsage]:
+    """
+    Start worker processes that load the catalog and measure each of them.
+
+    Workers are spawned (not forked), like uvicorn's, so they share nothing
+    but what the OS shares: the interpreter binary, libraries and mapped files.
+
+    Args:
+        workers (int): Number of worker processes.
+
+    Returns:
+        List[MemoryUsage]: One measurement per worker.
+    """
+    import multiprocessing
+
+    context = multiprocessing.get_context("spawn")
+    ready = context.Barrier(workers)
+    done = context.Barrier(workers + 1)
+    results = context.Queue()
+    processes = [
+        context.Process(target=_load_and_measure, args=(ready, done, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    usages = [results.get() for _ in processes]
+    done.wait()
+    for process in processes:
+        process.join()
+    return sorted(usages)
+
+
+def _mib(value: Optional[int]) -> str:
+    return "n/a" if value is None else f"{value / 2**20:.1f}"
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Measure the memory of N API workers after loading the catalog."
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    args = parser.parse_args()
+
+    usages = measure_workers(args.workers)
+    print(
+        f"{'pid':>8} {'RSS MiB':>9} {'PSS MiB':>9} {'shared':>9} {'private':>9} "
+        f"{'snapshot':>9}"
+    )
+    for u in usages:
+        print(
+            f"{u.pid:>8} {_mib(u.rss):>9} {_mib(u.pss):>9} {_mib(u.shared):>9} "
+            f"{_mib(u.private):>9} {_mib(u.snapshot_rss):>9}"
+        )
+    if all(u.pss is not None for u in usages):
+        total = sum(u.pss or 0 for u in usages)
+        private = sum(u.private or 0 for u in usages) // len(usages)
+        print(f"Total for {len(usages)} workers (sum of PSS): {_mib(total)} MiB")
+        print(f"Cost of each additional worker (mean private): {_mib(private)} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# app/core/serialization.py
+"""
+Module: serialization
+
+Fast JSON encoding for API responses.
+
+FastAPI's default path runs ``jsonable_encoder`` over every returned object
+(walking pydantic models, UUIDs and lists in Python) before ``json.dumps``
+encodes the result again. The hot read endpoints skip that by returning a
+FastJSONResponse whose body is encoded here:
+
+- dumps() encodes plain Python values with orjson when it is installed and
+  falls back to the standard library otherwise; both produce compact UTF-8.
+- dumps_object() and dumps_array() splice already-encoded JSON fragments
+  (e.g. cached per-term JSON, see app.catalog.term_json) into a response
+  without decoding them again.
+"""
+
+import json
+from datetime import date, datetime
+from typing import Any, Iterable, Mapping
+from uuid import UUID
+
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON encoders don't know natively."""
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if hasattr(value, "item"):
+        # numpy / pandas scalars, e.g. from DataFrame aggregations
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(value: Any) -> bytes:
+    """
+    Encode a value as compact UTF-8 JSON.
+
+    Args:
+        value (Any): JSON-compatible data; UUIDs, dates, pydantic models and
+            numpy scalars are converted as FastAPI would.
+
+    Returns:
+        bytes: The encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        value,
+        default=_default,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def dumps_array(fragments: Iterable[bytes]) -> bytes:
+    """Join already-encoded JSON values into a JSON array."""
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def dumps_object(fields: Mapping[str, Any], raw: Mapping[str, bytes]) -> bytes:
+    """
+    Encode a JSON object from plain fields followed by already-encoded members.
+
+    Args:
+        fields (Mapping[str, Any]): Members to encode with dumps().
+        raw (Mapping[str, bytes]): Members whose values are already JSON.
+
+    Returns:
+        bytes: The encoded object, with ``fields`` first and ``raw`` after them.
+    """
+    parts = [dumps(dict(fields))[1:-1]] if fields else []
+    parts.extend(dumps(key) + b":" + value for key, value in raw.items())
+    return b"{" + b",".join(parts) + b"}"
+
+
+class FastJSONResponse(Response):
+    """
+    JSON response encoded with dumps().
+
+    ``bytes`` content is taken to be encoded JSON already and sent unchanged.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
@@ -0,0 +1,84 @@
+# app/core/single_flight.py
+"""
+Module: single_flight
+
+Coalesces identical concurrent computations.
+
+When many clients send the same request at once (a popular query typed by
+many users), SingleFlight runs the computation once and hands its result (or
+exception) to every caller that asked while it was in flight. Nothing is kept
+after the computation finishes; caching results is the job of the search
+result cache.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time; concurrent callers share it.
+
+    The computation runs in its own task, so a caller that goes away (e.g. a
+    client disconnect cancelling its request) does not cancel it for the
+    others. Results are shared, not copied, so they must not be mutated.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Tuple[int, Hashable], asyncio.Future[Any]] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, compute: Callable[[], Awaitable[T]]) -> T:
+        """
+        Return the result of ``compute()``, sharing a computation already in flight for ``key``.
+
+        Args:
+            key (Hashable): Identifies equivalent computations.
+            compute (Callable[[], Awaitable[T]]): Starts the computation.
+
+        Returns:
+            T: The result of the (possibly shared) computation.
+        """
+        loop = asyncio.get_running_loop()
+        # Tasks belong to one event loop; keep each loop's flights apart.
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._calls.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(compute())
+                self._calls[flight_key] = task
+                task.add_done_callback(lambda t: self._finish(flight_key, t))
+                self.executions += 1
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _finish(
+        self, flight_key: Tuple[int, Hashable], task: "asyncio.Future[Any]"
+    ) -> None:
+        with self._lock:
+            if self._calls.get(flight_key) is task:
+                del self._calls[flight_key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away.
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return counters for monitoring.
+
+        Returns:
+            Dict[str, int]: Computations in flight, computations started, and
+            calls that joined one already in flight.
+        """
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "executions": self.executions,
+                "coalesced": self.coalesced,
+            }
@@ -0,0 +1,179 @@
+# app/core/startup_report.py
+"""
+Module: startup_report
+
+Measures what the API process spends its cold start on.
+
+- StartupReport records named initialization phases (catalog build, table
+  creation, lazily loaded dependencies such as spaCy and pandas). The app logs
+  the report when startup completes.
+- measure_imports() runs ``python -X importtime`` on a module in a fresh
+  interpreter and breaks the import cost down per package.
+
+Command line (from the backend directory)::
+
+    PYTHONPATH=. python -m app.core.startup_report [--budget-ms 1500]
+"""
+
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Modules that must stay out of the import path of app.main; they are loaded on first use.
+LAZY_MODULES = ("spacy", "pandas")
+
+
+class StartupReport:
+    """
+    Collects the duration of named startup and initialization phases.
+
+    Attributes:
+        phases (List[Tuple[str, float]]): (phase name, seconds), in completion order.
+    """
+
+    def __init__(self) -> None:
+        self.phases: List[Tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a finished phase."""
+        with self._lock:
+            self.phases.append((name, seconds))
+        logger.info(f"Startup phase '{name}' took {seconds * 1000:.1f} ms")
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as one phase (recorded even if it raises)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return phase name -> milliseconds."""
+        with self._lock:
+            return {name: round(seconds * 1000, 1) for name, seconds in self.phases}
+
+    def log(self) -> None:
+        """Log every recorded phase, slowest first."""
+        with self._lock:
+            phases = sorted(self.phases, key=lambda phase: -phase[1])
+        lines = [f"  {seconds * 1000:9.1f} ms  {name}" for name, seconds in phases]
+        logger.info("Startup report:\n" + "\n".join(lines))
+
+
+# Process-wide report used by app.main and by lazily loaded dependencies.
+startup_report = StartupReport()
+
+
+class ImportTiming(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def measure_imports(
+    module: str = "app.main", python: Optional[str] = None
+) -> List[ImportTiming]:
+    """
+    Import a module in a fresh interpreter and return ``-X importtime`` timings.
+
+    Args:
+        module (str): Module to import.
+        python (str, optional): Interpreter to use; defaults to the current one.
+
+    Returns:
+        List[ImportTiming]: One entry per imported module.
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, sys.path)))
+    completed = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    timings = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        timings.append(ImportTiming(name.strip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def summarize_by_package(timings: List[ImportTiming]) -> Dict[str, int]:
+    """
+    Sum the self import time of each top-level package (app modules are kept separate).
+
+    Args:
+        timings (List[ImportTiming]): Output of measure_imports().
+
+    Returns:
+        Dict[str, int]: Package -> microseconds, most expensive first.
+    """
+    totals: Dict[str, int] = {}
+    for timing in timings:
+        parts = timing.module.split(".")
+        package = ".".join(parts[:4]) if parts[0] == "app" else parts[0]
+        totals[package] = totals.get(package, 0) + timing.self_us
+    return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Break down the import and initialization cost of the API."
+    )
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=None,
+        help="Exit with status 1 if importing the module takes longer than this.",
+    )
+    parser.add_argument(
+        "--with-catalog",
+        action="store_true",
+        help="Also time building the term catalog in this process.",
+    )
+    args = parser.parse_args()
+
+    timings = measure_imports(args.module)
+    total_ms = max(t.cumulative_us for t in timings) / 1000
+    print(f"Importing {args.module}: {total_ms:.1f} ms ({len(timings)} modules)\n")
+    print("Self import time per package:")
+    for package, micros in list(summarize_by_package(timings).items())[: args.top]:
+        print(f"  {micros / 1000:9.1f} ms  {package}")
+
+    loaded = {t.module for t in timings}
+    eager = [name for name in LAZY_MODULES if name in loaded]
+    if eager:
+        print(f"\nWARNING: lazily loaded modules imported eagerly: {', '.join(eager)}")
+
+    if args.with_catalog:
+        from app.crud.crud_search import build_catalog
+
+        with startup_report.phase("build term catalog"):
+            build_catalog()
+        print("\nInitialization phases:")
+        for name, millis in startup_report.as_dict().items():
+            print(f"  {millis:9.1f} ms  {name}")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"\nImport budget exceeded: {total_ms:.1f} ms > {args.budget_ms:.1f} ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
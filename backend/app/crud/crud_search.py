@@ -2,24 +2,68 @@
 Module: crud_search
 
 This module provides functions to load, filter, and sort multilingual terminology data
-from a JSON dataset file. It defines two key functions:
+from a JSON dataset file. It defines the following key functions:
 - load_terms(): loads raw data and converts it into Term model objects.
-- search_terms(): applies search queries, filters, and sorting to the loaded terms.
+- build_catalog(): builds an immutable TermCatalog from the dataset file or its snapshot.
+- get_catalog(): returns the process-wide catalog, building it on first use.
+- reload_catalog(): rebuilds the catalog from the dataset and swaps it in atomically.
+- watch_catalog(): reloads the catalog in the background when the dataset changes.
+- search_terms(): applies search queries, filters, and sorting to the catalog.
+- search_page(): returns one sorted page of results plus a cursor for the next one.
+- search_concepts_page(): the same, with language variants collapsed into one row per concept.
+- select_page(): selects a page of either kind as catalog positions, without building models.
+- suggest_terms(): returns autocomplete matches from the catalog's prefix index.
+- suggest_positions(): the same, as catalog positions.
+- facet_counts(): counts query matches per language, domain and part of speech.
+- did_you_mean(): suggests spelling corrections for queries that found nothing.
+- get_translations(): returns a term and all its language variants by ID.
 
 Note:
 - Builds one Term per language per entry.
 - Links translations by UUID across languages.
+- Term UUIDs are derived from (language, source row, term) so they are stable
+  across requests, restarts and workers.
+- The dataset is read once per process (and again on reload); requests only read
+  the shared catalog.
 """
 
+import hashlib
 import json
-import spacy
-from uuid import uuid4
+import logging
+import threading
+from array import array
+from contextlib import nullcontext
+from uuid import NAMESPACE_URL, UUID, uuid5
 from pathlib import Path
-from typing import List, Optional, Dict
-from app.schemas.term import Term
+from typing import Any, Callable, List, NamedTuple, Optional, Dict, Sequence, Tuple
+from fastapi.concurrency import run_in_threadpool
+from app.catalog.catalog import RELEVANCE, TermCatalog
+from app.catalog.normalization import normalize_text
+from app.catalog.cursor import decode_cursor, encode_cursor
+from app.catalog.pos_tags import (
+    get_nlp,
+    is_taggable,
+    load_pos_tags,
+    pos_from_doc,
+    pos_tags_path,
+    tag_texts,
+)
+from app.catalog.query_stats import QueryWordCounts
+from app.catalog.result_cache import SearchResultCache, make_cache_key
+from app.catalog.snapshot import (
+    SnapshotError,
+    build_lock,
+    read_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+from app.catalog.term_store import TermStore, TermStoreBuilder
+from app.catalog.watcher import FileWatcher
+from app.core.config import settings
+from app.core.single_flight import SingleFlight
+from app.schemas.term import ConceptMatch, Term, TermTranslations, TermVariant
 
-# Load spaCy
-nlp = spacy.load("en_core_web_sm")
+logger = logging.getLogger(__name__)
 
 LANGUAGE_KEYS = {
     "eng term": "English",
@@ -35,64 +79,338 @@ LANGUAGE_KEYS = {
     "tso term ": "Xitsonga",
 }
 
+# Namespace for name-based (UUIDv5) term identifiers. Changing it changes every term ID.
+TERM_ID_NAMESPACE = uuid5(
+    NAMESPACE_URL, "https://github.com/COS301-SE-2025/Mavito/terms"
+)
+
 DATA_FILE = (
-    Path(__file__).resolve().parents[2]
+    Path(settings.CATALOG_DATA_FILE)
+    if settings.CATALOG_DATA_FILE
+    else Path(__file__).resolve().parents[2]
     / "../Mock_Data"
     / "multilingual_statistical_terminology_clean.json"
 )
 
 
-async def load_terms() -> List[Term]:
+def _build_store(
+    raw_data: List[Dict[str, Any]], pos_tags: Optional[Dict[str, str]] = None
+) -> TermStore:
     """
-    Load terms from the multilingual statistical terminology JSON file.
+    Convert raw dataset rows into a compact TermStore.
+
+    For each input record, adds one term per language; the terms of a record
+    form one translation group, so they are all translations of each other.
+
+    Args:
+        raw_data (List[Dict[str, Any]]): Rows parsed from the JSON dataset.
+        pos_tags (Dict[str, str], optional): Precomputed English term -> part of speech
+            (see app.catalog.pos_tags); terms missing from it are tagged with spaCy,
+            all in one batched pass.
+
+    Returns:
+        TermStore: The terms of every row, in row and language order.
+    """
+    untagged = [
+        item["eng term"]
+        for item in raw_data
+        if is_taggable(item.get("eng term"))
+        and (pos_tags is None or item["eng term"] not in pos_tags)
+    ]
+    if untagged:
+        logger.info(f"Tagging {len(untagged)} English terms without a POS artifact.")
+        pos_tags = {**(pos_tags or {}), **tag_texts(untagged)}
+
+    builder = TermStoreBuilder()
+    group = 0
+
+    for row_index, item in enumerate(raw_data):
+        if not any(item.get(lang_key) for lang_key in LANGUAGE_KEYS):
+            continue
+
+        eng_term = item.get("eng term")
+        if not eng_term:
+            detected_pos = "Unknown"
+        else:
+            # Texts the tagger skips (e.g. non-ASCII) are "unknown", as in detect_part_of_speech
+            detected_pos = (pos_tags or {}).get(eng_term, "unknown")
+
+        definition = item.get("eng definition ", "").strip()
+        domain = item.get("category", "General").strip()
+        for lang_key, lang_name in LANGUAGE_KEYS.items():
+            term_value = item.get(lang_key)
+            if term_value:
+                builder.append(
+                    term_id(lang_key, row_index, term_value),
+                    term_value,
+                    group=group,
+                    definition=definition,
+                    language=lang_name,
+                    domain=domain,
+                    part_of_speech=detected_pos,
+                )
+        group += 1
+
+    return builder.build()
+
+
+def _build_terms(
+    raw_data: List[Dict[str, Any]], pos_tags: Optional[Dict[str, str]] = None
+) -> List[Term]:
+    """
+    Convert raw dataset rows into Term objects.
 
     For each input record, generates one Term object per language,
     linking all terms as translations of each other.
 
+    Args:
+        raw_data (List[Dict[str, Any]]): Rows parsed from the JSON dataset.
+        pos_tags (Dict[str, str], optional): Precomputed English term -> part of speech.
+
+    Returns:
+        List[Term]: A list of Term model objects populated from the rows.
+    """
+    return list(_build_store(raw_data, pos_tags))
+
+
+def term_id(lang_key: str, row_index: int, term_value: str) -> UUID:
+    """
+    Derive the deterministic ID of a term.
+
+    Args:
+        lang_key (str): Dataset column the term came from (e.g. "zul term").
+        row_index (int): Index of the source row in the dataset.
+        term_value (str): The term text.
+
+    Returns:
+        UUID: A name-based UUID that is identical for the same inputs in every process.
+    """
+    lang_code = lang_key.split()[0]
+    return uuid5(TERM_ID_NAMESPACE, f"{lang_code}:{row_index}:{term_value}")
+
+
+async def load_terms() -> List[Term]:
+    """
+    Load terms from the multilingual statistical terminology JSON file.
+
+    This always re-reads the dataset from disk. Request handlers should use
+    get_catalog() instead, which shares one parsed copy across the process.
+
     Returns:
         List[Term]: A list of Term model objects populated from the JSON data.
     """
     with open(DATA_FILE) as f:
         raw_data = json.load(f)
 
-    terms: List[Term] = []
+    return _build_terms(raw_data)
 
-    for item in raw_data:
-        # Pre-generate UUIDs per language for cross-linking translations
-        language_uuid_map = {
-            lang_key: uuid4() for lang_key in LANGUAGE_KEYS.keys() if item.get(lang_key)
-        }
 
-        eng_term = item.get("eng term")
-        detected_pos = detect_part_of_speech(eng_term) if eng_term else "Unknown"
+def build_catalog(
+    data_file: Path = DATA_FILE,
+    use_snapshot: bool = True,
+    save_snapshot: bool = False,
+) -> TermCatalog:
+    """
+    Build an immutable TermCatalog from a dataset file.
 
-        # Build Term objects per language
-        for lang_key, lang_name in LANGUAGE_KEYS.items():
-            term_value = item.get(lang_key)
-            if term_value:
-                term_uuid = language_uuid_map[lang_key]
-                translation_uuids = [
-                    uid for key, uid in language_uuid_map.items() if key != lang_key
-                ]
-
-                terms.append(
-                    Term(
-                        id=term_uuid,
-                        term=term_value,
-                        definition=item.get("eng definition ", "").strip(),
-                        language=lang_name,
-                        domain=item.get("category", "General"),
-                        part_of_speech=detected_pos,
-                        translations=translation_uuids,
-                        example="",
-                        related_terms=[],
-                        upvotes=0,
-                        downvotes=0,
-                        comments=[],
-                    )
+    The catalog version is a hash of the dataset and POS artifact contents
+    (see catalog_version), so two processes reading the same files agree on it. If the dataset has an up-to-date
+    binary snapshot (see app.catalog.snapshot) the catalog is mapped from it;
+    otherwise it is built from the JSON. Parts of speech come from the
+    dataset's POS artifact when it matches the file, so spaCy is not needed.
+
+    With save_snapshot, a catalog built from JSON is written as the new
+    snapshot and then mapped back, under a file lock. This is how several
+    workers share one copy of the indexes: the first to start builds the
+    snapshot, and every worker maps the same file, whose pages the OS keeps
+    once in its page cache.
+
+    Args:
+        data_file (Path): Path to the JSON dataset.
+        use_snapshot (bool): Whether to load from the binary snapshot if present.
+        save_snapshot (bool): Whether to write the snapshot when it is missing or stale.
+
+    Returns:
+        TermCatalog: The fully built catalog.
+    """
+    data_file = Path(data_file)
+    raw_bytes = data_file.read_bytes()
+    digest = hashlib.sha256(raw_bytes).hexdigest()
+    pos_digest = _file_sha256(pos_tags_path(data_file))
+    version = catalog_version(digest, pos_digest)
+    snapshot = snapshot_path(data_file)
+
+    with build_lock(snapshot) if save_snapshot else nullcontext():
+        if use_snapshot and snapshot.exists():
+            try:
+                loaded = read_snapshot(snapshot, digest, pos_digest)
+                if loaded.version != version:
+                    raise SnapshotError(f"{snapshot} has an outdated catalog version.")
+                return loaded
+            except SnapshotError as e:
+                logger.warning(
+                    f"Ignoring catalog snapshot: {e} Rebuild it with `make snapshot`."
                 )
 
-    return terms
+        pos_tags = load_pos_tags(data_file, digest)
+        terms = _build_store(json.loads(raw_bytes), pos_tags)
+        catalog = TermCatalog(terms, version=version)
+        if save_snapshot:
+            try:
+                write_snapshot(catalog, snapshot, digest, pos_digest)
+                # Serve from the mapping just written, like the other workers will.
+                return read_snapshot(snapshot, digest, pos_digest)
+            except (OSError, SnapshotError) as e:
+                logger.warning(f"Could not save catalog snapshot {snapshot}: {e}")
+        return catalog
+
+
+def catalog_version(source_sha256: str, pos_tags_sha256: Optional[str]) -> str:
+    """
+    Derive the catalog version from the files the catalog is built from.
+
+    Args:
+        source_sha256 (str): SHA-256 of the dataset.
+        pos_tags_sha256 (str, optional): SHA-256 of the POS artifact, if there is one.
+
+    Returns:
+        str: 16 hex digits; changes whenever the dataset or the POS artifact does.
+    """
+    if pos_tags_sha256 is None:
+        return source_sha256[:16]
+    combined = f"{source_sha256}:{pos_tags_sha256}".encode("ascii")
+    return hashlib.sha256(combined).hexdigest()[:16]
+
+
+def _file_sha256(path: Path) -> Optional[str]:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+_catalog: Optional[TermCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_catalog() -> TermCatalog:
+    """
+    Return the process-wide term catalog, building it on first use.
+
+    The catalog is normally built during application startup by load_catalog();
+    the lazy path only exists for callers that run without the app (e.g. tests).
+
+    Returns:
+        TermCatalog: The shared catalog instance.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = build_catalog(save_snapshot=settings.CATALOG_SHARED_SNAPSHOT)
+    return _catalog
+
+
+async def load_catalog() -> TermCatalog:
+    """
+    Build the process-wide catalog in a worker thread.
+
+    Parsing the dataset and tagging parts of speech is CPU bound, so this keeps
+    the event loop free while the application starts.
+
+    Returns:
+        TermCatalog: The shared catalog instance.
+    """
+    return await run_in_threadpool(get_catalog)
+
+
+ReloadListener = Callable[[TermCatalog], None]
+
+_reload_listeners: List[ReloadListener] = []
+_reload_lock = threading.Lock()
+
+
+def add_reload_listener(listener: ReloadListener) -> None:
+    """
+    Register a callback to run after reload_catalog() swaps in a new catalog.
+
+    Listeners run in the reloading thread, in registration order; use them to
+    refresh other data derived from the dataset.
+
+    Args:
+        listener (Callable[[TermCatalog], None]): Called with the new catalog.
+    """
+    _reload_listeners.append(listener)
+
+
+def reload_catalog(
+    data_file: Path = DATA_FILE, force: bool = False
+) -> Tuple[TermCatalog, bool]:
+    """
+    Rebuild the catalog from the dataset and swap it in atomically.
+
+    The new catalog is fully built before the swap, while requests keep being
+    served from the current one. Requests that already hold the old catalog
+    finish on it; later requests see the new one. Concurrent reloads are
+    serialized.
+
+    Only the calling process is reloaded; with several workers each one
+    reloads itself (see watch_catalog()). If neither the dataset nor its POS
+    artifact changed since the current catalog was built, nothing is rebuilt.
+
+    Args:
+        data_file (Path): Path to the JSON dataset.
+        force (bool): Rebuild and swap even if the catalog version did not change.
+
+    Returns:
+        Tuple[TermCatalog, bool]: The catalog now being served, and whether it was swapped.
+    """
+    global _catalog
+    with _reload_lock:
+        current = _catalog
+        if not force and current is not None:
+            digest = _file_sha256(Path(data_file))
+            pos_digest = _file_sha256(pos_tags_path(Path(data_file)))
+            if digest and current.version == catalog_version(digest, pos_digest):
+                return current, False
+
+        catalog = build_catalog(
+            data_file, save_snapshot=settings.CATALOG_SHARED_SNAPSHOT
+        )
+        if not force and current is not None and current.version == catalog.version:
+            return current, False
+        with _catalog_lock:
+            _catalog = catalog
+        logger.info(
+            f"Term catalog reloaded: {len(catalog)} terms (version "
+            f"{current.version if current is not None else None} -> {catalog.version})."
+        )
+        for listener in _reload_listeners:
+            try:
+                listener(catalog)
+            except Exception as e:
+                logger.error(f"Error in catalog reload listener: {e}", exc_info=True)
+        return catalog, True
+
+
+def watch_catalog(interval: float, data_file: Path = DATA_FILE) -> FileWatcher:
+    """
+    Start a background thread that reloads the catalog when the dataset changes.
+
+    Args:
+        interval (float): Seconds between checks of the dataset and its POS artifact.
+        data_file (Path): Path to the JSON dataset.
+
+    Returns:
+        FileWatcher: The running watcher; call stop() on shutdown.
+    """
+    watcher = FileWatcher(
+        [data_file, pos_tags_path(data_file)],
+        on_change=lambda: reload_catalog(data_file),
+        interval=interval,
+    )
+    watcher.start()
+    return watcher
 
 
 async def search_terms(
@@ -101,44 +419,601 @@ async def search_terms(
     domain: Optional[str] = None,
     part_of_speech: Optional[str] = None,
     sort_by: str = "name",
+    catalog: Optional[TermCatalog] = None,
+    fuzzy: bool = False,
+    phonetic: bool = False,
 ) -> List[Term]:
     """
     Search terms matching a query string, with optional filtering and sorting.
 
     Args:
         query (str): The search query to match against the term name.
-        language (str, optional): Language filter (case-insensitive).
-        domain (str, optional): Domain filter (case-insensitive).
-        part_of_speech (str, optional): Part of speech filter (case-insensitive).
-        sort_by (str): Sorting criteria; either 'name' (alphabetical) or 'popularity' (upvotes - downvotes).
+        language (str, optional): Language filter (case- and whitespace-insensitive).
+        domain (str, optional): Domain filter (case- and whitespace-insensitive).
+        part_of_speech (str, optional): Part of speech filter (case- and whitespace-insensitive).
+        sort_by (str): Sorting criteria; 'name' (alphabetical), 'popularity'
+            (upvotes - downvotes) or 'relevance' (BM25 over term text and definitions).
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+        fuzzy (bool): Also match query words misspelled by up to two edits.
+        phonetic (bool): Also match sound-alike query words in Bantu-language terms
+            (not with relevance sorting).
 
     Returns:
         List[Term]: A list of Term objects matching the query and filters, sorted accordingly.
     """
-    terms = await load_terms()
+    if catalog is None:
+        catalog = get_catalog()
+    terms = catalog.terms
 
-    # Filter by query in term name
-    filtered = [t for t in terms if query.lower() in t.term.lower()]
+    if sort_by == RELEVANCE:
+        ranked = catalog.rank_relevance(query, language, domain, part_of_speech, fuzzy)
+        return [terms[i] for i in ranked]
 
-    # Apply optional filters
-    if language:
-        filtered = [t for t in filtered if t.language.lower() == language.lower()]
-    if domain:
-        filtered = [t for t in filtered if t.domain.lower() == domain.lower()]
-    if part_of_speech:
-        filtered = [
-            t for t in filtered if t.part_of_speech.lower() == part_of_speech.lower()
-        ]
+    # Match the query (trigram index) and intersect with the facet bitmaps
+    positions = catalog.search(query, language, domain, part_of_speech, fuzzy, phonetic)
+    filtered = [terms[i] for i in positions]
 
     # Sort results
     if sort_by == "name":
-        filtered.sort(key=lambda t: t.term.lower())
+        filtered.sort(key=lambda t: normalize_text(t.term))
     elif sort_by == "popularity":
         filtered.sort(key=lambda t: t.upvotes - t.downvotes, reverse=True)
 
+    # Exact matches first (stable, so each tier keeps the sort order)
+    inexact = {terms.id(i) for i in catalog.inexact_matches(positions, query)}
+    if inexact:
+        filtered.sort(key=lambda t: t.id in inexact)
+
     return filtered
 
 
+# Ranked result IDs of recent searches, shared by all requests in this process.
+result_cache = SearchResultCache(
+    max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEARCH_CACHE_TTL_SECONDS,
+)
+
+# Page selections in progress, shared by identical concurrent searches.
+search_flights = SingleFlight()
+
+# Words of queries that found results, for ranking "did you mean" corrections.
+query_words = QueryWordCounts(max_words=settings.QUERY_WORD_COUNTS_MAX_WORDS)
+
+
+class SearchPage(NamedTuple):
+    """
+    One page of search results.
+
+    Attributes:
+        items (List[Term]): Terms on this page, in sort order.
+        total (int): Number of terms matching the query and filters.
+        next_cursor (Optional[str]): Cursor for the following page, or None on the last page.
+    """
+
+    items: List[Term]
+    total: int
+    next_cursor: Optional[str]
+
+
+async def search_page(
+    query: str,
+    language: Optional[str] = None,
+    domain: Optional[str] = None,
+    part_of_speech: Optional[str] = None,
+    sort_by: str = "name",
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    catalog: Optional[TermCatalog] = None,
+    fuzzy: bool = False,
+    phonetic: bool = False,
+) -> SearchPage:
+    """
+    Return one page of search results without sorting the full match set.
+
+    Ranked result IDs are kept in the process-wide result cache, so repeated
+    queries and later pages are a slice of the cached list. With the cache
+    disabled, the page is selected from the catalog's precomputed sort orders
+    (a bounded heap for sparse matches, an ordered scan for dense ones).
+    Either way, only the terms on the page are returned.
+
+    Args:
+        query (str): The search query to match against the term name.
+        language (str, optional): Language filter.
+        domain (str, optional): Domain filter.
+        part_of_speech (str, optional): Part of speech filter.
+        sort_by (str): 'name', 'popularity' or 'relevance'; anything else keeps dataset order.
+        page (int): 1-based page number, used when no cursor is given.
+        page_size (int): Number of items per page.
+        cursor (str, optional): next_cursor from a previous page; takes precedence over page.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+        fuzzy (bool): Also match query words misspelled by up to two edits.
+        phonetic (bool): Also match sound-alike query words in Bantu-language terms
+            (not with relevance sorting).
+
+    Returns:
+        SearchPage: The page items, total match count and the next page's cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, stale or for another sort order.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    selected, total, next_cursor = await select_page(
+        query,
+        language,
+        domain,
+        part_of_speech,
+        sort_by,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        catalog=catalog,
+        fuzzy=fuzzy,
+        phonetic=phonetic,
+    )
+    terms = catalog.terms
+    return SearchPage([terms[i] for i in selected], total, next_cursor)
+
+
+class ConceptPage(NamedTuple):
+    """
+    One page of concept-grouped search results.
+
+    Attributes:
+        items (List[ConceptMatch]): Concepts on this page, in sort order.
+        total (int): Number of concepts with at least one matching term.
+        next_cursor (Optional[str]): Cursor for the following page, or None on the last page.
+    """
+
+    items: List[ConceptMatch]
+    total: int
+    next_cursor: Optional[str]
+
+
+async def search_concepts_page(
+    query: str,
+    language: Optional[str] = None,
+    domain: Optional[str] = None,
+    part_of_speech: Optional[str] = None,
+    sort_by: str = "name",
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    catalog: Optional[TermCatalog] = None,
+    fuzzy: bool = False,
+    phonetic: bool = False,
+) -> ConceptPage:
+    """
+    Return one page of search results grouped by source concept.
+
+    Each concept appears once, at the rank of its best-ranked matching term,
+    with the languages whose term matched and all of its other language
+    variants. Fields the variants share (definition, domain, part of speech)
+    are sent once per concept. Totals and pagination count concepts, not terms.
+
+    Args:
+        query (str): The search query to match against the term name.
+        language (str, optional): Language filter.
+        domain (str, optional): Domain filter.
+        part_of_speech (str, optional): Part of speech filter.
+        sort_by (str): 'name', 'popularity' or 'relevance'; anything else keeps dataset order.
+        page (int): 1-based page number, used when no cursor is given.
+        page_size (int): Number of concepts per page.
+        cursor (str, optional): next_cursor from a previous concept page.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+        fuzzy (bool): Also match query words misspelled by up to two edits.
+        phonetic (bool): Also match sound-alike query words in Bantu-language terms
+            (not with relevance sorting).
+
+    Returns:
+        ConceptPage: The page items, total concept count and the next page's cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, stale, for another sort
+            order or from an ungrouped search.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    selected, total, next_cursor = await select_page(
+        query,
+        language,
+        domain,
+        part_of_speech,
+        sort_by,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        group_by="concept",
+        catalog=catalog,
+        fuzzy=fuzzy,
+        phonetic=phonetic,
+    )
+
+    terms = catalog.terms
+    variants = await run_in_threadpool(
+        catalog.matched_variants_all,
+        selected,
+        query,
+        language,
+        domain,
+        part_of_speech,
+        sort_by == RELEVANCE,
+        fuzzy,
+        phonetic,
+    )
+    items = []
+    for position, matched in zip(selected, variants):
+        group = terms.group_members(terms.group_of[position])
+        items.append(
+            ConceptMatch(
+                concept_id=terms.id(group[0]),
+                definition=terms.value("definition", group[0]),
+                domain=terms.value("domain", group[0]),
+                part_of_speech=terms.value("part_of_speech", group[0]),
+                term=_variant(terms, position),
+                matched_languages=[terms.value("language", p) for p in matched],
+                translations=[_variant(terms, p) for p in group if p != position],
+            )
+        )
+    return ConceptPage(items, total, next_cursor)
+
+
+def _variant(terms: TermStore, position: int) -> TermVariant:
+    return TermVariant(
+        id=terms.id(position),
+        term=terms.texts[position],
+        language=terms.value("language", position),
+        upvotes=terms.upvotes[position],
+        downvotes=terms.downvotes[position],
+    )
+
+
+class PositionPage(NamedTuple):
+    """
+    One page of search results as catalog positions.
+
+    Attributes:
+        positions (Sequence[int]): Catalog positions on this page, in sort order.
+            With group_by="concept", each is the best-ranked matching term of one concept.
+        total (int): Number of matching terms (or concepts).
+        next_cursor (Optional[str]): Cursor for the following page, or None on the last page.
+    """
+
+    positions: Sequence[int]
+    total: int
+    next_cursor: Optional[str]
+
+
+async def select_page(
+    query: str,
+    language: Optional[str] = None,
+    domain: Optional[str] = None,
+    part_of_speech: Optional[str] = None,
+    sort_by: str = "name",
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    group_by: Optional[str] = None,
+    catalog: Optional[TermCatalog] = None,
+    fuzzy: bool = False,
+    phonetic: bool = False,
+) -> PositionPage:
+    """
+    Select one page of search results without building Term models.
+
+    This is the common core of search_page and search_concepts_page; the search
+    endpoint uses it directly to encode the page from cached JSON fragments.
+    Searches missing from the result cache run in a worker thread, and
+    concurrent calls with equivalent parameters (after the same normalization
+    as the result cache) share that computation.
+
+    Args:
+        query (str): The search query to match against the term name.
+        language (str, optional): Language filter.
+        domain (str, optional): Domain filter.
+        part_of_speech (str, optional): Part of speech filter.
+        sort_by (str): 'name', 'popularity' or 'relevance'; anything else keeps dataset order.
+        page (int): 1-based page number, used when no cursor is given.
+        page_size (int): Number of items per page.
+        cursor (str, optional): next_cursor from a previous page; takes precedence over page.
+        group_by (str, optional): "concept" to collapse results to one position per concept.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+        fuzzy (bool): Also match query words misspelled by up to two edits.
+        phonetic (bool): Also match sound-alike query words in Bantu-language terms
+            (not with relevance sorting).
+
+    Returns:
+        PositionPage: The page positions, total count and the next page's cursor.
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed, stale, for another sort
+            order or for another grouping.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    args = (
+        catalog,
+        query,
+        language,
+        domain,
+        part_of_speech,
+        sort_by,
+        page,
+        page_size,
+        cursor,
+        group_by,
+        fuzzy,
+        phonetic,
+    )
+    cache_key = make_cache_key(
+        query, language, domain, part_of_speech, sort_by, group_by, fuzzy, phonetic
+    )
+    if result_cache.contains(catalog.version, cache_key):
+        # A page of a cached result takes microseconds: not worth a thread hop.
+        return _select_page(*args)
+
+    # Identical searches in flight at the same time share one computation. The work
+    # runs in a thread so the event loop keeps serving other requests meanwhile.
+    key = (catalog.version, cache_key, cursor or page, page_size)
+    return await search_flights.do(key, lambda: run_in_threadpool(_select_page, *args))
+
+
+def _select_page(
+    catalog: TermCatalog,
+    query: str,
+    language: Optional[str],
+    domain: Optional[str],
+    part_of_speech: Optional[str],
+    sort_by: str,
+    page: int,
+    page_size: int,
+    cursor: Optional[str],
+    group_by: Optional[str],
+    fuzzy: bool,
+    phonetic: bool,
+) -> PositionPage:
+    # Cursors from grouped and ungrouped searches rank different lists.
+    cursor_scope = sort_by if group_by is None else f"{sort_by}/{group_by}"
+    # Relevance depends on the query, so a term has no fixed rank to resume
+    # after: relevance cursors hold the offset of the page's last item instead.
+    relevance = sort_by == RELEVANCE
+    if cursor:
+        after_rank: Optional[int] = decode_cursor(cursor, catalog.version, cursor_scope)
+        offset = 0
+        if relevance and after_rank is not None:
+            offset, after_rank = after_rank + 1, None
+    else:
+        after_rank = None
+        offset = (page - 1) * page_size
+
+    # Fetch one extra item to learn whether another page follows.
+    selected: Sequence[int]
+    if result_cache.enabled:
+        key = make_cache_key(
+            query, language, domain, part_of_speech, sort_by, group_by, fuzzy, phonetic
+        )
+        ranked = result_cache.get(catalog.version, key)
+        if ranked is None:
+            ranked = _rank(
+                catalog,
+                query,
+                language,
+                domain,
+                part_of_speech,
+                sort_by,
+                fuzzy,
+                phonetic,
+            )
+            if group_by == "concept":
+                ranked = catalog.collapse_concepts(ranked)
+            result_cache.put(catalog.version, key, ranked)
+        total = len(ranked)
+        selected = catalog.page_ranked(
+            ranked, sort_by, page_size + 1, offset, after_rank, query
+        )
+    elif group_by == "concept" or relevance:
+        ranked = _rank(
+            catalog, query, language, domain, part_of_speech, sort_by, fuzzy, phonetic
+        )
+        if group_by == "concept":
+            ranked = catalog.collapse_concepts(ranked)
+        total = len(ranked)
+        selected = catalog.page_ranked(
+            ranked, sort_by, page_size + 1, offset, after_rank, query
+        )
+    else:
+        positions = catalog.search(
+            query, language, domain, part_of_speech, fuzzy, phonetic
+        )
+        total = len(positions)
+        selected = catalog.page(
+            positions, sort_by, page_size + 1, offset, after_rank, query
+        )
+
+    next_cursor = None
+    if len(selected) > page_size:
+        selected = selected[:page_size]
+        if relevance:
+            last_rank = offset + page_size - 1
+        else:
+            last_rank = catalog.rank(selected[-1], sort_by, query)
+        next_cursor = encode_cursor(catalog.version, cursor_scope, last_rank)
+    return PositionPage(selected, total, next_cursor)
+
+
+def _rank(
+    catalog: TermCatalog,
+    query: str,
+    language: Optional[str],
+    domain: Optional[str],
+    part_of_speech: Optional[str],
+    sort_by: str,
+    fuzzy: bool = False,
+    phonetic: bool = False,
+) -> array:
+    if sort_by == RELEVANCE:
+        return catalog.rank_relevance(query, language, domain, part_of_speech, fuzzy)
+    positions = catalog.search(query, language, domain, part_of_speech, fuzzy, phonetic)
+    return catalog.rank_all(positions, sort_by, query)
+
+
+async def facet_counts(
+    query: str,
+    language: Optional[str] = None,
+    domain: Optional[str] = None,
+    part_of_speech: Optional[str] = None,
+    catalog: Optional[TermCatalog] = None,
+    relevance: bool = False,
+    fuzzy: bool = False,
+    phonetic: bool = False,
+) -> Dict[str, Dict[str, int]]:
+    """
+    Count the terms matching a query per language, domain and part of speech.
+
+    Counts come from the catalog's facet bitmaps intersected with the query's
+    match set; each facet is counted with the other two filters applied.
+
+    Args:
+        query (str): The search query to match against the term name.
+        language (str, optional): Language filter.
+        domain (str, optional): Domain filter.
+        part_of_speech (str, optional): Part of speech filter.
+        relevance (bool): Count the match set of a relevance search (query words
+            against term text and definitions).
+        fuzzy (bool): Count the typo-tolerant match set.
+        phonetic (bool): Count the sound-alike match set.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+
+    Returns:
+        Dict[str, Dict[str, int]]: {"language": {...}, "domain": {...}, "part_of_speech": {...}}.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    return catalog.facet_counts(
+        query, language, domain, part_of_speech, relevance, fuzzy, phonetic
+    )
+
+
+async def did_you_mean(
+    query: str,
+    language: Optional[str] = None,
+    domain: Optional[str] = None,
+    part_of_speech: Optional[str] = None,
+    limit: int = 3,
+    catalog: Optional[TermCatalog] = None,
+) -> List[str]:
+    """
+    Suggest spelling corrections for a query that found nothing.
+
+    Candidates come from the catalog's fuzzy word index and are weighted by how
+    many terms (in any language) contain each word and by how often users
+    searched for it (see query_words).
+
+    Args:
+        query (str): The query that returned no results.
+        language (str, optional): Language filter.
+        domain (str, optional): Domain filter.
+        part_of_speech (str, optional): Part of speech filter.
+        limit (int): Maximum number of corrections.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+
+    Returns:
+        List[str]: Corrected queries, best first; empty if nothing close enough exists.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    return catalog.did_you_mean(
+        query, language, domain, part_of_speech, limit, query_words.count
+    )
+
+
+async def suggest_terms(
+    query: str,
+    language: Optional[str] = None,
+    limit: int = 10,
+    catalog: Optional[TermCatalog] = None,
+    fuzzy: bool = False,
+) -> List[Term]:
+    """
+    Return terms starting with the query, for autocomplete.
+
+    Uses the catalog's sorted prefix index rather than the substring search path,
+    so the cost is O(log n + limit) regardless of how many terms match.
+
+    Args:
+        query (str): The prefix to match against the term name (ignoring case, diacritics and punctuation).
+        language (str, optional): Language filter (case-insensitive).
+        limit (int): Maximum number of terms to return.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+        fuzzy (bool): Fill up the suggestions with terms matching the query's words
+            despite typos, after the exact prefix matches.
+
+    Returns:
+        List[Term]: Up to `limit` matching terms in alphabetical order.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    terms = catalog.terms
+    positions = await suggest_positions(query, language, limit, catalog, fuzzy)
+    return [terms[i] for i in positions]
+
+
+async def suggest_positions(
+    query: str,
+    language: Optional[str] = None,
+    limit: int = 10,
+    catalog: Optional[TermCatalog] = None,
+    fuzzy: bool = False,
+) -> List[int]:
+    """
+    Return the catalog positions of suggest_terms() results, without building Term models.
+
+    Args:
+        query (str): The prefix to match against the term name (ignoring case, diacritics and punctuation).
+        language (str, optional): Language filter (case-insensitive).
+        limit (int): Maximum number of positions to return.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+        fuzzy (bool): Fill up with typo-tolerant matches (see suggest_terms).
+
+    Returns:
+        List[int]: Up to `limit` positions in alphabetical order of the term.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    return catalog.suggest(query, limit, language, fuzzy)
+
+
+async def get_translations(
+    term_id: UUID, catalog: Optional[TermCatalog] = None
+) -> Optional[TermTranslations]:
+    """
+    Return a term and all of its language variants.
+
+    The term is found through the catalog's ID -> position map and its
+    variants through its translation group, so the cost does not depend on
+    the size of the catalog.
+
+    Args:
+        term_id (UUID): ID of any language variant of the concept.
+        catalog (TermCatalog, optional): Catalog to search; defaults to the process-wide catalog.
+
+    Returns:
+        Optional[TermTranslations]: The term and its translations (in language order),
+        or None if no term has this ID.
+    """
+    if catalog is None:
+        catalog = get_catalog()
+    terms = catalog.terms
+    position = terms.position_of(term_id)
+    if position is None:
+        return None
+    return TermTranslations(
+        term=terms[position],
+        translations=[terms[p] for p in terms.translation_positions(position)],
+    )
+
+
 pos_cache: Dict[str, str] = {}
 
 
@@ -146,30 +1021,21 @@ def detect_part_of_speech(text: str) -> str:
     """
     Use SpaCy to detect the part of speech for a given English word.
 
+    The model is loaded on first use. The dataset's terms are tagged in bulk
+    instead, offline by app.catalog.pos_tags or in one batch by _build_store.
+
     Args:
         text (str): The English word to analyze
 
     Returns:
         str: The detected part of speech (noun, verb, adjective, adverb)
     """
-    if not text or not text.isascii():
+    if not is_taggable(text):
         return "unknown"
 
     if text in pos_cache:
         return pos_cache[text]
 
-    doc = nlp(text)
-    pos = "unknown"
-    if doc and len(doc) > 0:
-        token = doc[0]
-        spacy_pos = token.pos_
-        if spacy_pos == "NOUN":
-            pos = "noun"
-        elif spacy_pos == "VERB":
-            pos = "verb"
-        elif spacy_pos == "ADJ":
-            pos = "adjective"
-        elif spacy_pos == "ADV":
-            pos = "adverb"
+    pos = pos_from_doc(get_nlp()(text))
     pos_cache[text] = pos
     return pos
@@ -1,10 +1,17 @@
 # app/main.py
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
+from typing import Optional, Set
 
 from app.api.v1.api import api_router_v1
+from app.api.v1.endpoints.analytics import load_marito_data
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.startup_report import startup_report
+from app.catalog.watcher import FileWatcher
+from app.crud.crud_search import load_catalog, watch_catalog
 from app.db.session import engine  # For DB check and potential table creation
 from app.db import base as db_base  # Ensures Base knows all models
 
@@ -34,6 +41,24 @@ async def create_db_and_tables_if_sqlite():
         logger.error("Database engine not initialized. Cannot create tables.")
 
 
+async def warm_up_heavy_dependencies():
+    """Loads lazily imported dependencies in the background so the first request doesn't pay for them."""
+    try:
+        with startup_report.phase("warm-up: analytics dataset"):
+            # Tag the dataset with the catalog version, which the analytics ETag is built from
+            catalog = await load_catalog()
+            await load_marito_data(catalog.version)
+    except Exception as e:
+        logger.error(f"Error during warm-up: {e}", exc_info=True)
+
+
+# Keep a reference to background tasks so they aren't garbage collected mid-run
+background_tasks: Set["asyncio.Task[None]"] = set()
+
+# Running dataset watcher, if CATALOG_WATCH_INTERVAL_SECONDS enables one
+catalog_watcher: Optional[FileWatcher] = None
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
@@ -63,6 +88,10 @@ app.add_middleware(
     allow_methods=["*"],  # Allows all standard methods
     allow_headers=["*"],  # Allows all headers
 )
+if settings.RESPONSE_COMPRESSION_MIN_BYTES >= 0:
+    app.add_middleware(
+        CompressionMiddleware, minimum_size=settings.RESPONSE_COMPRESSION_MIN_BYTES
+    )
 app.include_router(api_router_v1, prefix=settings.API_V1_STR)
 
 
@@ -91,7 +120,31 @@ async def on_startup():
 
     # For local development with SQLite, this creates the DB and tables if they don't exist.
     # For Cloud SQL, migrations should be handled separately (e.g., with Alembic).
-    await create_db_and_tables_if_sqlite()
+    with startup_report.phase("create SQLite tables"):
+        await create_db_and_tables_if_sqlite()
+
+    # Build the term catalog once, off the event loop, so search requests never parse the dataset.
+    try:
+        with startup_report.phase("load term catalog"):
+            catalog = await load_catalog()
+        logger.info(
+            f"Term catalog loaded: {len(catalog)} terms (version {catalog.version})."
+        )
+    except Exception as e:
+        logger.error(f"Error loading term catalog: {e}", exc_info=True)
+
+    global catalog_watcher
+    if settings.CATALOG_WATCH_INTERVAL_SECONDS > 0:
+        catalog_watcher = watch_catalog(settings.CATALOG_WATCH_INTERVAL_SECONDS)
+        logger.info(
+            f"Watching the dataset for changes every {settings.CATALOG_WATCH_INTERVAL_SECONDS}s."
+        )
+
+    if settings.WARM_UP_ON_STARTUP:
+        task = asyncio.create_task(warm_up_heavy_dependencies())
+        background_tasks.add(task)
+        task.add_done_callback(background_tasks.discard)
+    startup_report.log()
     logger.info("--- Application Startup Complete ---")
 
     if engine:  # Ensure engine is initialized
@@ -110,6 +163,8 @@ async def on_startup():
 @app.on_event("shutdown")
 async def on_shutdown():
     logger.info("--- Application Shutdown ---")
+    if catalog_watcher:
+        catalog_watcher.stop()
     if engine:
         await engine.dispose()  # Properly close DB connection pool
         logger.info("Database engine disposed.")
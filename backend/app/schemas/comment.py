@@ -1,6 +1,7 @@
 from pydantic import BaseModel, UUID4
 from datetime import datetime
 from typing import List, Optional
+from uuid import UUID
 
 
 class CommentBase(BaseModel):
@@ -14,7 +15,7 @@ class CommentBase(BaseModel):
         date_posted (datetime): Timestamp when the comment was created.
         tombstone (bool): Marks the comment as soft-deleted if True.
         replies (List[UUID4]): List of UUIDs of comments that are replies to this one.
-        term_id (UUID4): ID of the term this comment is associated with.
+        term_id (UUID): ID of the term this comment is associated with.
         parent_id (Optional[UUID4]): ID of the parent comment if this is a reply.
     """
 
@@ -23,7 +24,7 @@ class CommentBase(BaseModel):
     content: str
     date_posted: datetime
     tombstone: bool = False
-    term_id: UUID4
+    term_id: UUID
     parent_id: Optional[UUID4] = None
 
 
@@ -44,13 +45,13 @@ class CommentCreate(BaseModel):
     Attributes:
         user_id (UUID4): ID of the user posting the comment.
         content (str): Text content of the comment.
-        term_id (UUID4): ID of the term the comment is attached to.
+        term_id (UUID): ID of the term the comment is attached to.
         parent_id (Optional[UUID4]): ID of a parent comment if this is a reply.
     """
 
     user_id: UUID4
     content: str
-    term_id: UUID4
+    term_id: UUID
     parent_id: Optional[UUID4] = None
 
 
@@ -1,18 +1,20 @@
 # app/schemas/term.py
-from pydantic import BaseModel, UUID4
+from pydantic import BaseModel
 from typing import List
+from uuid import UUID
 
 
 class TermBase(BaseModel):
-    id: UUID4
+    # Name-based (v5) UUID, stable across loads; see crud_search.term_id
+    id: UUID
     term: str
     definition: str
     language: str
     domain: str
     part_of_speech: str
-    translations: List[UUID4]
+    translations: List[UUID]
     example: str
-    related_terms: List[UUID4]
+    related_terms: List[UUID]
     upvotes: int
     downvotes: int
     comments: List[str]
@@ -23,6 +25,38 @@ class Term(TermBase):
     pass
 
 
+# Attributes a client can select with the fields= parameter, in response order
+TERM_FIELDS = tuple(Term.model_fields)
+
+
+# Response model for GET /terms/{id}/translations: a term and its other language variants
+class TermTranslations(BaseModel):
+    term: Term
+    translations: List[Term]
+
+
+# One language variant of a concept; the fields the variants share live on the concept
+class TermVariant(BaseModel):
+    id: UUID
+    term: str
+    language: str
+    upvotes: int
+    downvotes: int
+
+
+# One concept in /search?group_by=concept: the best-ranked matching variant of a
+# source concept, the languages whose term matched, and the concept's other variants
+class ConceptMatch(BaseModel):
+    # ID of the concept's first term in dataset order (usually the English one)
+    concept_id: UUID
+    definition: str
+    domain: str
+    part_of_speech: str
+    term: TermVariant
+    matched_languages: List[str]
+    translations: List[TermVariant]
+
+
 # Model used for creating a new term
 class TermCreate(BaseModel):
     term: str
@@ -31,8 +65,8 @@ class TermCreate(BaseModel):
     domain: str
     part_of_speech: str
     # IDs to the other terms (UUID)
-    translations: List[UUID4] = []
+    translations: List[UUID] = []
     example: str = ""
     # Also a list of at most 3 UUIDs
-    related_terms: List[UUID4] = []
+    related_terms: List[UUID] = []
     comments: List[str] = []
@@ -0,0 +1,52 @@
+"""
+Unit tests for the /api/v1/admin endpoints.
+"""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.crud import crud_search
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_reload_is_disabled_without_configured_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", None)
+    response = client.post(
+        "/api/v1/admin/catalog/reload", headers={"X-Admin-Token": "anything"}
+    )
+    assert response.status_code == 403
+
+
+def test_reload_rejects_wrong_token(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "s3cret")
+    response = client.post("/api/v1/admin/catalog/reload")
+    assert response.status_code == 403
+    response = client.post(
+        "/api/v1/admin/catalog/reload", headers={"X-Admin-Token": "wrong"}
+    )
+    assert response.status_code == 403
+
+
+def test_reload_reports_versions(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "s3cret")
+    catalog = crud_search.get_catalog()
+    with patch(
+        "app.api.v1.endpoints.admin.reload_catalog", return_value=(catalog, False)
+    ) as reload_catalog:
+        response = client.post(
+            "/api/v1/admin/catalog/reload",
+            params={"force": "true"},
+            headers={"X-Admin-Token": "s3cret"},
+        )
+    assert response.status_code == 200
+    reload_catalog.assert_called_once_with(force=True)
+    assert response.json() == {
+        "reloaded": False,
+        "previous_version": catalog.version,
+        "version": catalog.version,
+        "terms": len(catalog),
+    }
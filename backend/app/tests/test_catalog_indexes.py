@@ -0,0 +1,317 @@
+"""
+Unit tests for the in-memory catalog indexes in app.catalog.
+
+These tests build indexes over small hand-written corpora, so they do not
+depend on the bundled dataset or on spaCy.
+"""
+
+import pytest
+
+from app.catalog.facet_index import (
+    FacetIndex,
+    bitmap_from_positions,
+    normalize_facet_value,
+    popcount,
+    positions_from_bitmap,
+)
+from app.catalog.fuzzy_index import FuzzyIndex, edit_distance, max_distance
+from app.catalog.ngram_index import NgramIndex
+from app.catalog.phonetic_index import PhoneticIndex, phonetic_key, rule_set
+from app.catalog.prefix_index import PrefixIndex
+from app.catalog.relevance_index import RelevanceIndex, tokenize
+
+CORPUS = [
+    "Agricultural inputs",
+    "Census",
+    "Population census",
+    "Izinsizamikhiqizo zezolimo",
+    "Labour force",
+    "Rate of unemployment",
+    "AB",
+    "",
+]
+
+
+class TestNgramIndex:
+    """Test cases for the trigram substring index."""
+
+    @pytest.fixture
+    def index(self):
+        return NgramIndex(CORPUS)
+
+    @pytest.mark.parametrize(
+        "query",
+        ["census", "CENSUS", "agri", "ab", "a", "", "zo", "of un", "xyz", "lim"],
+    )
+    def test_search_matches_linear_scan(self, index, query):
+        expected = [i for i, t in enumerate(CORPUS) if query.lower() in t.lower()]
+        assert index.search(query) == expected
+
+    def test_search_unknown_gram_returns_nothing(self, index):
+        assert index.search("qqqq") == []
+
+    @pytest.mark.parametrize("query", ["--", "?", " / ", "’"])
+    def test_search_punctuation_only_returns_nothing(self, index, query):
+        assert index.search(query) == []
+
+    def test_search_blank_query_returns_everything(self, index):
+        assert index.search("  ") == list(range(len(CORPUS)))
+
+    def test_postings_are_sorted(self, index):
+        for posting in index.postings.values():
+            assert list(posting) == sorted(posting)
+
+
+class TestPrefixIndex:
+    """Test cases for the sorted prefix index."""
+
+    @pytest.fixture
+    def index(self):
+        return PrefixIndex(CORPUS)
+
+    @pytest.mark.parametrize("prefix", ["", "c", "CEN", "la", "p", "zz", "ab"])
+    def test_top_k_matches_sort_then_filter(self, index, prefix):
+        ordered = sorted(range(len(CORPUS)), key=lambda i: CORPUS[i].lower())
+        expected = [i for i in ordered if CORPUS[i].lower().startswith(prefix.lower())][
+            :3
+        ]
+        assert index.top_k(prefix, 3) == expected
+
+    def test_top_k_with_explicit_positions(self):
+        index = PrefixIndex(["beta", "alpha"], positions=[10, 20])
+        assert index.top_k("", 5) == [20, 10]
+        assert index.top_k("b", 5) == [10]
+
+
+class TestFacetIndex:
+    """Test cases for the bitmap facet index and bitmap helpers."""
+
+    def test_bitmap_round_trip(self):
+        positions = [0, 3, 7, 8, 9, 63, 64, 1000]
+        bits = bitmap_from_positions(positions, 1001)
+        assert positions_from_bitmap(bits) == positions
+        assert popcount(bits) == len(positions)
+        assert positions_from_bitmap(0) == []
+
+    def test_normalize_facet_value(self):
+        assert normalize_facet_value("  Labour ") == "labour"
+        assert normalize_facet_value("Housing  and Services ") == "housing and services"
+
+    def test_messy_values_share_one_bitmap(self):
+        index = FacetIndex(["Labour ", "labour", "Prices", " LABOUR"])
+        assert positions_from_bitmap(index.bitmap("Labour")) == [0, 1, 3]
+        assert positions_from_bitmap(index.bitmap("prices ")) == [2]
+        assert index.bitmap("Unknown") == 0
+        assert index.labels["labour"] == "Labour"
+
+
+class TestRelevanceIndex:
+    """Test cases for the BM25 word index."""
+
+    DEFINITIONS = (
+        "Inputs used in farming.",
+        "An official count of a population.",
+        "A census of the whole population.",
+        "Inputs used in farming.",
+        "People who work or look for work.",
+        "Share of the labour force without work.",
+        "",
+        "",
+    )
+
+    @pytest.fixture
+    def index(self):
+        return RelevanceIndex(CORPUS, self.DEFINITIONS)
+
+    def test_tokenize_lowercases_words(self):
+        assert tokenize("Rate of unemployment, (narrow)") == [
+            "rate",
+            "of",
+            "unemployment",
+            "narrow",
+        ]
+
+    def test_rank_prefers_term_text_over_definition(self, index):
+        # "census" is in the text of terms 1 and 2, and in the definition of 2.
+        assert list(index.rank("census")) == [2, 1]
+        # "population" is only in definitions (1 and 2) and in the text of 2.
+        assert index.rank("population")[0] == 2
+
+    def test_rank_sums_scores_of_query_words(self, index):
+        ranked = list(index.rank("labour unemployment"))
+        assert ranked[0] == 5  # matches both words
+        assert set(ranked) == {4, 5}
+
+    def test_rank_ignores_unknown_words_and_repeats(self, index):
+        assert list(index.rank("qqqq")) == []
+        assert list(index.rank("census census qqqq")) == list(index.rank("census"))
+
+    def test_rank_applies_mask(self, index):
+        mask = bitmap_from_positions([1, 4], len(CORPUS))
+        assert list(index.rank("census", mask)) == [1]
+
+    def test_match_returns_ascending_positions(self, index):
+        assert index.match("inputs work") == [0, 3, 4, 5]
+
+    def test_from_arrays_matches_built_index(self, index):
+        loaded = RelevanceIndex.from_arrays(
+            index.size, list(index.words), index.offsets, index.postings, index.impacts
+        )
+        for query in ["census", "population census", "work", "inputs"]:
+            assert list(loaded.rank(query)) == list(index.rank(query))
+
+
+class TestFuzzyIndex:
+    """Test cases for the typo-tolerant deletion dictionary."""
+
+    @pytest.fixture
+    def index(self):
+        return FuzzyIndex(CORPUS)
+
+    @pytest.mark.parametrize(
+        "a, b, distance",
+        [
+            ("census", "census", 0),
+            ("census", "sensus", 1),
+            ("census", "cnesus", 1),  # transposition
+            ("census", "cenus", 1),
+            ("labour", "labor", 1),
+            ("unemployment", "unemplyoment", 1),
+            ("statistics", "statsitcs", 2),
+            ("census", "labour", 3),
+        ],
+    )
+    def test_edit_distance(self, a, b, distance):
+        assert edit_distance(a, b, 2) == min(distance, 3)
+
+    def test_max_distance_grows_with_word_length(self):
+        assert [max_distance("x" * n) for n in (3, 4, 7, 8)] == [0, 1, 1, 2]
+
+    @pytest.mark.parametrize("query", ["census", "sensus", "cencus", "CENSUS"])
+    def test_match_finds_typos(self, index, query):
+        assert set(index.match(query)) == {1, 2}
+
+    def test_match_requires_every_word(self, index):
+        assert index.match("populaton census") == {2: 1}
+        assert index.match("census labour") == {}
+
+    def test_short_words_must_match_exactly(self, index):
+        assert set(index.match("ab")) == {6}
+        assert index.match("ac") == {}
+
+    def test_long_words_allow_two_typos(self, index):
+        assert index.match("unenplyment") == {5: 2}
+        assert index.match("unenplymant") == {}
+
+    def test_lookup_matches_linear_scan(self, index):
+        for query in ["census", "force", "labor", "zezolimo", "izinsizamikiqizo"]:
+            limit = max_distance(query)
+            expected = {
+                i: edit_distance(query, word, limit)
+                for i, word in enumerate(index.words)
+                if edit_distance(query, word, limit) <= limit
+            }
+            assert index.lookup(query) == expected
+
+    def test_expand_adds_corrected_words(self, index):
+        assert index.expand("Sensus rate") == "sensus rate census"
+
+    def test_corrections_fix_every_word(self, index):
+        assert index.corrections("populaton sensus") == ["population census"]
+        assert index.corrections("labor forse") == ["labour force"]
+
+    def test_corrections_need_words_that_occur_together(self, index):
+        assert index.corrections("sensus labor") == []
+        assert index.corrections("qqqqqq") == []
+
+    def test_corrections_skip_the_query_itself(self, index):
+        assert index.corrections("census") == []
+
+    def test_corrections_prefer_searched_words(self):
+        index = FuzzyIndex(["Rate", "Race", "Rats", "Rate of birth"])
+        # "rate" occurs in more terms than "race"...
+        assert index.corrections("rade", k=2) == ["rate", "race"]
+        # ...but users searching for "race" outweighs that.
+        searches = {"race": 50}.get
+        assert index.corrections("rade", k=2, searches=lambda w: searches(w, 0)) == [
+            "race",
+            "rate",
+        ]
+
+    def test_corrections_apply_mask(self, index):
+        mask = bitmap_from_positions([1], len(CORPUS))
+        assert index.corrections("sensus", mask=mask) == ["census"]
+        assert index.corrections("populaton", mask=mask) == []
+
+    def test_from_arrays_matches_built_index(self, index):
+        loaded = FuzzyIndex.from_arrays(
+            index.words,
+            index.offsets,
+            index.postings,
+            memoryview(index.keys),
+            index.key_offsets,
+            index.key_words,
+            index.key_width,
+        )
+        for query in ["sensus", "populaton", "labor forse", "ab"]:
+            assert loaded.match(query) == index.match(query)
+
+
+class TestPhoneticIndex:
+    """Test cases for the sound-alike word index."""
+
+    TERMS = (
+        ("Dijalo tsa selemo", "Sesotho"),
+        ("Dijwalo tsa ngwaga", "Setswana"),
+        ("Dibjalo ta ngwaga", "Sepedi"),
+        ("Tlhaka", "Setswana"),
+        ("Izitshalo zonyaka", "isiZulu"),
+        ("Izilimo ezityalwe", "isiXhosa"),
+        ("Iisiriyeli", "isiXhosa"),
+        ("Dijalo", "English"),
+    )
+
+    @pytest.fixture
+    def index(self):
+        texts, languages = zip(*self.TERMS)
+        return PhoneticIndex(texts, languages)
+
+    def test_rule_set_ignores_case_and_unknown_languages(self):
+        assert rule_set(" isiZulu ") == "nguni"
+        assert rule_set("SETSWANA") == "sotho-tswana"
+        assert rule_set("English") is None
+
+    @pytest.mark.parametrize(
+        "a, b, rules",
+        [
+            ("thlaka", "tlhaka", "sotho-tswana"),
+            ("dijwalo", "dibjalo", "sotho-tswana"),
+            ("tshala", "shala", "nguni"),
+            ("tyala", "tshala", "nguni"),
+            ("iisiriyeli", "isiriyeli", "nguni"),
+            ("vhulimi", "vulimi", "venda"),
+            ("xitsonga", "shitsonga", "tsonga"),
+        ],
+    )
+    def test_sound_alike_words_share_a_key(self, a, b, rules):
+        assert phonetic_key(a, rules) == phonetic_key(b, rules)
+
+    def test_match_finds_spellings_by_ear(self, index):
+        assert index.match("dijalo") == [0, 1, 2]
+        assert index.match("thlaka") == [3]
+        assert index.match("izitjalo") == [4]
+        assert index.match("isiriyeli") == [6]
+
+    def test_match_requires_every_word(self, index):
+        assert index.match("dijwalo ngwaga") == [1, 2]
+        assert index.match("dijalo zonyaka") == []
+
+    def test_keys_only_reach_their_rule_set(self, index):
+        # "tj" ~ "tsh" is an Nguni rule: Sotho-Tswana terms are not matched by it.
+        assert index.match("ezitjalwe") == [5]
+        assert index.match("dijalo") == [0, 1, 2]  # not the English term
+
+    def test_from_arrays_matches_built_index(self, index):
+        loaded = PhoneticIndex.from_arrays(index.keys, index.offsets, index.postings)
+        for query in ["dijalo", "thlaka ngwaga", "iisiriyeli", "zzz", ""]:
+            assert loaded.match(query) == index.match(query)
@@ -0,0 +1,140 @@
+"""
+Unit tests for negotiated response compression (app.core.compression).
+"""
+
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, negotiate_encoding
+
+BODY = "isibalo sabantu " * 200
+
+app = FastAPI()
+app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+
+@app.get("/large")
+def large():
+    return PlainTextResponse(BODY)
+
+
+@app.get("/small")
+def small():
+    return PlainTextResponse("census")
+
+
+@app.get("/stream")
+def stream():
+    return StreamingResponse(iter([BODY.encode()] * 3), media_type="text/plain")
+
+
+@app.get("/image")
+def image():
+    return Response(BODY.encode(), media_type="image/png")
+
+
+client = TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+        ("br;q=0, gzip;q=0", None),
+        ("*", "br"),
+        ("*;q=0.1, br;q=0", "gzip"),
+        ("identity", None),
+        ("", None),
+        ("GZIP;q=bogus, br", "br"),
+    ],
+)
+def test_negotiate_encoding(header, expected):
+    assert negotiate_encoding(header, ("br", "gzip")) == expected
+
+
+def test_negotiate_encoding_without_brotli():
+    assert negotiate_encoding("br, gzip;q=0.5", ("gzip",)) == "gzip"
+    assert negotiate_encoding("br", ("gzip",)) is None
+
+
+def test_gzip_above_threshold_only():
+    response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == BODY
+
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "census"
+
+
+def test_identity_when_client_refuses_compression():
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in response.headers
+    assert response.text == BODY
+
+
+def test_gzip_body_is_valid(monkeypatch):
+    monkeypatch.setattr(compression, "brotli", None)
+    raw_client = TestClient(FastAPI())
+    raw_app = raw_client.app
+    raw_app.add_middleware(CompressionMiddleware, minimum_size=10)
+    raw_app.get("/large")(large)
+    with raw_client.stream(
+        "GET", "/large", headers={"Accept-Encoding": "br, gzip"}
+    ) as response:
+        assert response.headers["content-encoding"] == "gzip"
+        raw = b"".join(response.iter_raw())
+    assert gzip.decompress(raw).decode() == BODY
+
+
+def test_brotli_when_installed():
+    brotli = pytest.importorskip("brotli")
+    with client.stream(
+        "GET", "/large", headers={"Accept-Encoding": "gzip, br"}
+    ) as response:
+        assert response.headers["content-encoding"] == "br"
+        raw = b"".join(response.iter_raw())
+    assert brotli.decompress(raw).decode() == BODY
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_compressed_response_headers(encoding):
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    with client.stream(
+        "GET", "/large", headers={"Accept-Encoding": encoding}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+    assert response.headers["content-encoding"] == encoding
+    assert response.headers["content-length"] == str(len(raw))
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_streaming_response_is_compressed(encoding):
+    if encoding == "br":
+        pytest.importorskip("brotli")
+    response = client.get("/stream", headers={"Accept-Encoding": encoding})
+    assert response.headers["content-encoding"] == encoding
+    assert "content-length" not in response.headers
+    assert response.text == BODY * 3
+
+
+def test_excluded_content_type_is_not_compressed():
+    response = client.get("/image", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.content == BODY.encode()
+
+
+def test_identity_response_varies_on_accept_encoding():
+    response = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert response.headers["vary"] == "Accept-Encoding"
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "vary" not in response.headers
@@ -1,5 +1,8 @@
 import pytest
 from unittest.mock import patch
+from app.catalog.catalog import TermCatalog
+from app.catalog.cursor import InvalidCursorError
+from app.catalog.normalization import normalize_text
 from app.crud import crud_search
 from app.schemas.term import Term
 from uuid import uuid4
@@ -64,11 +67,33 @@ async def test_search_terms_domain_filter():
         assert term.domain == domain
 
 
+@pytest.mark.asyncio
+async def test_search_terms_domain_filter_is_normalized():
+    # The dataset stores this category as "Labour " (trailing space)
+    exact = await crud_search.search_terms("", domain="Labour")
+    messy = await crud_search.search_terms("", domain="  labour ")
+    assert len(exact) > 0
+    assert exact == messy
+    assert all(term.domain == "Labour" for term in exact)
+
+
+@pytest.mark.asyncio
+async def test_search_terms_combined_filters():
+    results = await crud_search.search_terms(
+        "a", language="isiZulu", domain="Agriculture"
+    )
+    assert len(results) > 0
+    for term in results:
+        assert "a" in term.term.lower()
+        assert term.language == "isiZulu"
+        assert term.domain == "Agriculture"
+
+
 @pytest.mark.asyncio
 async def test_search_terms_sort_by_name():
     query = ""
     results = await crud_search.search_terms(query, sort_by="name")
-    sorted_terms = sorted(results, key=lambda t: t.term.lower())
+    sorted_terms = sorted(results, key=lambda t: normalize_text(t.term))
     assert results == sorted_terms, "Results not sorted by name"
 
 
@@ -122,3 +147,332 @@ async def test_load_terms_mocked():
         results = await crud_search.load_terms()
         assert len(results) == 1
         assert results[0].term == "Mock Term"
+
+
+def test_get_catalog_is_shared():
+    catalog = crud_search.get_catalog()
+    assert catalog is crud_search.get_catalog(), "Catalog should be built once"
+    assert len(catalog) > 0
+    assert catalog.version
+
+
+@pytest.mark.asyncio
+async def test_search_terms_does_not_reload_dataset():
+    crud_search.get_catalog()
+    with patch("app.crud.crud_search.load_terms") as mock_load:
+        results = await crud_search.search_terms("agricultural")
+    mock_load.assert_not_called()
+    assert len(results) > 0
+
+
+@pytest.mark.asyncio
+async def test_search_terms_uses_given_catalog():
+    term = Term(
+        id=uuid4(),
+        term="Mock Term",
+        definition="Mock Definition",
+        language="English",
+        domain="Mock Domain",
+        part_of_speech="noun",
+        translations=[],
+        example="",
+        related_terms=[],
+        upvotes=0,
+        downvotes=0,
+        comments=[],
+    )
+    catalog = TermCatalog([term], version="test")
+    results = await crud_search.search_terms("mock", catalog=catalog)
+    assert results == [term]
+
+
+@pytest.mark.asyncio
+async def test_term_ids_are_stable_across_loads():
+    first = await crud_search.load_terms()
+    second = await crud_search.load_terms()
+    assert [t.id for t in first] == [t.id for t in second]
+    assert [t.translations for t in first] == [t.translations for t in second]
+    assert len({t.id for t in first}) == len(first), "Term IDs must be unique"
+
+
+def test_term_id_is_deterministic():
+    a = crud_search.term_id("zul term", 3, "Izibalo")
+    assert a == crud_search.term_id("zul term", 3, "Izibalo")
+    assert a != crud_search.term_id("xho term ", 3, "Izibalo")
+    assert a != crud_search.term_id("zul term", 4, "Izibalo")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by", ["name", "popularity"])
+async def test_search_page_matches_full_sort(sort_by):
+    full = await crud_search.search_terms("a", sort_by=sort_by)
+    for page in (1, 2, 40):
+        result = await crud_search.search_page(
+            "a", sort_by=sort_by, page=page, page_size=25
+        )
+        assert result.total == len(full)
+        assert result.items == full[(page - 1) * 25 : page * 25]
+
+
+@pytest.mark.asyncio
+async def test_search_page_cursor_walks_all_results():
+    full = await crud_search.search_terms("tion", language="English")
+    collected, cursor = [], None
+    while True:
+        result = await crud_search.search_page(
+            "tion", language="English", page_size=7, cursor=cursor
+        )
+        collected.extend(result.items)
+        cursor = result.next_cursor
+        if cursor is None:
+            break
+    assert collected == full
+
+
+@pytest.mark.asyncio
+async def test_search_page_rejects_cursor_for_other_sort():
+    first = await crud_search.search_page("a", sort_by="name", page_size=5)
+    assert first.next_cursor is not None
+    with pytest.raises(InvalidCursorError):
+        await crud_search.search_page(
+            "a", sort_by="popularity", cursor=first.next_cursor
+        )
+
+
+def group_by_concept(terms):
+    """Collapse a ranked term list the way a client would: first term per concept."""
+    concepts, seen = [], set()
+    for term in terms:
+        concept = frozenset([term.id, *term.translations])
+        if concept not in seen:
+            seen.add(concept)
+            concepts.append(term)
+    return concepts
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sort_by", ["name", "popularity"])
+async def test_search_concepts_page_collapses_language_variants(sort_by):
+    full = await crud_search.search_terms("data", sort_by=sort_by)
+    expected = group_by_concept(full)
+    assert len(expected) < len(full)
+
+    result = await crud_search.search_concepts_page(
+        "data", sort_by=sort_by, page_size=1000
+    )
+    assert result.total == len(expected)
+    assert [c.term.id for c in result.items] == [t.id for t in expected]
+    for concept, term in zip(result.items, expected):
+        assert [t.id for t in concept.translations] == term.translations
+        assert concept.definition == term.definition
+        matched = [
+            t.language
+            for t in [concept.term, *concept.translations]
+            if "data" in t.term.lower()
+        ]
+        assert sorted(concept.matched_languages) == sorted(matched)
+
+
+@pytest.mark.asyncio
+async def test_search_concepts_page_cursor_walks_all_concepts():
+    expected = group_by_concept(await crud_search.search_terms("rate"))
+    collected, cursor = [], None
+    while True:
+        result = await crud_search.search_concepts_page(
+            "rate", page_size=6, cursor=cursor
+        )
+        collected.extend(c.term.id for c in result.items)
+        cursor = result.next_cursor
+        if cursor is None:
+            break
+    assert collected == [t.id for t in expected]
+
+    # Cursors of grouped and ungrouped searches are not interchangeable
+    terms_page = await crud_search.search_page("rate", page_size=5)
+    with pytest.raises(InvalidCursorError):
+        await crud_search.search_concepts_page("rate", cursor=terms_page.next_cursor)
+
+
+def test_reload_catalog_swaps_atomically(tmp_path, monkeypatch):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text('[{"eng term": "", "afr term": "Sensus"}]')
+    monkeypatch.setattr(crud_search, "_catalog", None)
+    monkeypatch.setattr(crud_search, "_reload_listeners", [])
+    seen = []
+    crud_search.add_reload_listener(seen.append)
+
+    first, swapped = crud_search.reload_catalog(data_file)
+    assert swapped
+    assert crud_search.get_catalog() is first
+
+    # Unchanged dataset: nothing to swap, listeners not called
+    same, swapped = crud_search.reload_catalog(data_file)
+    assert same is first and not swapped
+    assert seen == [first]
+
+    data_file.write_text('[{"eng term": "", "afr term": "Steekproef"}]')
+    second, swapped = crud_search.reload_catalog(data_file)
+    assert swapped
+    assert second.version != first.version
+    assert crud_search.get_catalog() is second
+    assert seen == [first, second]
+    # Requests still holding the old catalog finish on it unchanged
+    assert [t.term for t in first.terms] == ["Sensus"]
+    assert [t.term for t in second.terms] == ["Steekproef"]
+
+
+def test_reload_catalog_keeps_serving_old_catalog_on_error(tmp_path, monkeypatch):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text('[{"eng term": "", "afr term": "Sensus"}]')
+    monkeypatch.setattr(crud_search, "_catalog", None)
+    monkeypatch.setattr(crud_search, "_reload_listeners", [])
+    current, _ = crud_search.reload_catalog(data_file)
+
+    data_file.write_text('[{"eng term": ')  # half-written file
+    with pytest.raises(ValueError):
+        crud_search.reload_catalog(data_file)
+    assert crud_search.get_catalog() is current
+
+
+@pytest.mark.asyncio
+async def test_select_page_coalesces_identical_concurrent_searches():
+    import asyncio
+    import threading
+    import time
+
+    catalog = crud_search.get_catalog()
+    calls = []
+    select = crud_search._select_page
+
+    def slow_select(*args):
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return select(*args)
+
+    crud_search.result_cache.clear()
+    before = crud_search.search_flights.stats()
+    with patch.object(crud_search, "_select_page", side_effect=slow_select):
+        # "Rate" and "rate" normalize to the same search.
+        pages = await asyncio.gather(
+            *[
+                crud_search.select_page(q, page_size=10, catalog=catalog)
+                for q in ["rate", "Rate", "rate", "rate"]
+            ],
+            crud_search.select_page("rate", page_size=20, catalog=catalog),
+        )
+    after = crud_search.search_flights.stats()
+
+    assert len(calls) == 2
+    assert threading.get_ident() not in calls
+    assert pages[0] is pages[1] is pages[3]
+    assert len(pages[4].positions) == 20
+    assert after["coalesced"] - before["coalesced"] == 3
+    assert after["executions"] - before["executions"] == 2
+
+    # Cached results are paged inline, without a worker thread.
+    with patch.object(crud_search, "_select_page", side_effect=slow_select):
+        await crud_search.select_page("rate", page=2, page_size=10, catalog=catalog)
+    assert calls[-1] == threading.get_ident()
+
+
+def make_catalog(texts):
+    terms = [
+        Term(
+            id=uuid4(),
+            term=text,
+            definition="Mock Definition",
+            language="Tshivenda",
+            domain="Mock Domain",
+            part_of_speech="noun",
+            translations=[],
+            example="",
+            related_terms=[],
+            upvotes=0,
+            downvotes=0,
+            comments=[],
+        )
+        for text in texts
+    ]
+    return TermCatalog(terms, version="test")
+
+
+NORMALIZED_TEXTS = ["Thoho", "ṱhoho", "E mail", "Ṱhoho ya muthu", "e-mail", "Email"]
+
+
+@pytest.mark.asyncio
+async def test_search_terms_ignores_diacritics_and_punctuation():
+    catalog = make_catalog(NORMALIZED_TEXTS)
+    results = await crud_search.search_terms("thoho", catalog=catalog)
+    assert [t.term for t in results] == ["Thoho", "ṱhoho", "Ṱhoho ya muthu"]
+    results = await crud_search.search_terms("E-MAIL", catalog=catalog)
+    assert [t.term for t in results] == ["e-mail", "E mail"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_entries", [0, 100])
+@pytest.mark.parametrize("dense_ratio", [0, 16])
+async def test_search_page_lists_exact_matches_first(cache_entries, dense_ratio):
+    catalog = make_catalog(NORMALIZED_TEXTS)
+    expected = {
+        "ṱhoho": ["ṱhoho", "Ṱhoho ya muthu", "Thoho"],
+        "e-mail": ["e-mail", "E mail"],
+        "e mail": ["E mail", "e-mail"],
+    }
+    crud_search.result_cache.clear()
+    with patch.object(
+        crud_search.result_cache, "max_entries", cache_entries
+    ), patch.object(TermCatalog, "DENSE_RATIO", dense_ratio):
+        for query, terms in expected.items():
+            collected, cursor = [], None
+            while True:
+                result = await crud_search.search_page(
+                    query, page_size=1, cursor=cursor, catalog=catalog
+                )
+                collected += [t.term for t in result.items]
+                cursor = result.next_cursor
+                if cursor is None:
+                    break
+            assert collected == terms
+            page = await crud_search.search_page(
+                query, page=2, page_size=1, catalog=catalog
+            )
+            assert [t.term for t in page.items] == terms[1:2]
+
+
+@pytest.mark.parametrize(
+    "query, options",
+    [
+        ("rate", {}),
+        ("unemployment rate", {"relevance": True}),
+        ("unemploymnet", {"relevance": True, "fuzzy": True}),
+        ("sensus", {"fuzzy": True}),
+        ("dijalo", {"phonetic": True}),
+        ("", {}),
+    ],
+)
+def test_matched_variants_all_matches_each_concept(query, options):
+    catalog = crud_search.get_catalog()
+    sort_by = "relevance" if options.get("relevance") else "name"
+    ranked = crud_search._rank(
+        catalog,
+        query,
+        None,
+        None,
+        None,
+        sort_by,
+        options.get("fuzzy", False),
+        options.get("phonetic", False),
+    )
+    positions = list(catalog.collapse_concepts(ranked))[:50]
+    batch = catalog.matched_variants_all(positions, query, "isiZulu", **options)
+    assert batch == [
+        catalog.matched_variants(p, query, "isiZulu", **options) for p in positions
+    ]
+    full = catalog.matched_variants_all(positions, query, **options)
+    assert any(full)
+
+
+def test_matched_variants_all_punctuation_only_query_matches_nothing():
+    catalog = crud_search.get_catalog()
+    assert catalog.matched_variants_all([0, 1, 2], "--") == [[], [], []]
+    assert all(catalog.matched_variants_all([0, 1, 2], ""))
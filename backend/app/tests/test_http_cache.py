@@ -0,0 +1,61 @@
+"""
+Unit tests for ETag and conditional GET helpers (app.core.http_cache).
+"""
+
+from starlette.requests import Request
+
+from app.core.http_cache import (
+    cache_headers,
+    encoded_etag,
+    if_none_match,
+    request_etag,
+)
+
+
+def make_request(query_string: str = "", if_none_match_header: str = "") -> Request:
+    headers = []
+    if if_none_match_header:
+        headers.append((b"if-none-match", if_none_match_header.encode()))
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/search",
+            "query_string": query_string.encode(),
+            "headers": headers,
+        }
+    )
+
+
+def test_request_etag_normalizes_parameters():
+    etag = request_etag(make_request("query=rate&language=English"), "v1")
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == request_etag(make_request("language=English&query=rate"), "v1")
+    assert etag == request_etag(
+        make_request("language=English&domain=&query=rate"), "v1"
+    )
+    assert etag != request_etag(make_request("query=rate&language=English"), "v2")
+    assert etag != request_etag(make_request("query=rate&language=isiZulu"), "v1")
+
+
+def test_if_none_match():
+    etag = '"abc"'
+    assert if_none_match(make_request(), etag) is None
+    assert if_none_match(make_request(if_none_match_header='"abc"'), etag) == '"abc"'
+    assert if_none_match(make_request(if_none_match_header='"old", W/"abc"'), etag)
+    assert if_none_match(make_request(if_none_match_header="*"), etag) == etag
+    assert if_none_match(make_request(if_none_match_header='"old"'), etag) is None
+    # Tags of compressed representations match the uncompressed response
+    gzip_tag = encoded_etag(etag, "gzip")
+    assert gzip_tag == '"abc-gzip"'
+    assert if_none_match(make_request(if_none_match_header=gzip_tag), etag) == gzip_tag
+
+
+def test_encoded_etag_leaves_weak_tags_alone():
+    assert encoded_etag('W/"abc"', "br") == 'W/"abc"'
+
+
+def test_cache_headers():
+    headers = cache_headers('"abc"')
+    assert headers["ETag"] == '"abc"'
+    assert headers["Cache-Control"].startswith("public, max-age=")
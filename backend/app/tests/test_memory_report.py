@@ -0,0 +1,35 @@
+"""
+Unit tests for the per-worker memory report (app.core.memory_report).
+"""
+
+import sys
+
+import pytest
+
+from app.core import memory_report
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc")
+def test_process_memory_splits_shared_and_private():
+    usage = memory_report.process_memory()
+
+    assert usage.rss > 0
+    assert 0 < usage.pss <= usage.rss
+    assert usage.shared + usage.private == usage.rss
+    assert usage.snapshot_rss >= 0
+
+
+def test_process_memory_counts_mapped_snapshot(tmp_path):
+    import mmap
+
+    path = tmp_path / "terms.catalog.bin"
+    path.write_bytes(b"\x01" * mmap.PAGESIZE * 4)
+    with open(path, "rb") as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    sum(mapped[:: mmap.PAGESIZE])  # touch every page
+
+    usage = memory_report.process_memory()
+    if usage.snapshot_rss is None:
+        pytest.skip("/proc is unavailable")
+    assert usage.snapshot_rss >= mmap.PAGESIZE * 4
+    mapped.close()
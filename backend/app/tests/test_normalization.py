@@ -0,0 +1,33 @@
+"""
+Unit tests for search key normalization (app.catalog.normalization).
+"""
+
+import pytest
+
+from app.catalog.normalization import normalize_text
+
+
+@pytest.mark.parametrize(
+    "text, key",
+    [
+        ("Census", "census"),
+        ("Tshivenḓa", "tshivenda"),
+        ("ṄWAHA", "nwaha"),
+        ("Straße", "strasse"),
+        ("ng'ombe", "ngombe"),
+        ("ng’ombe", "ngombe"),
+        ("e-mail", "e mail"),
+        ("Population / census (total)", "population census total"),
+        ("  Labour   force ", "labour force"),
+        ("ﬁnance", "finance"),
+        ("", ""),
+    ],
+)
+def test_normalize_text(text, key):
+    assert normalize_text(text) == key
+
+
+def test_normalize_text_is_idempotent():
+    for text in ["Tshivenḓa ṅwaha", "e-mail / E-MAIL", "ng'ombe"]:
+        key = normalize_text(text)
+        assert normalize_text(key) == key
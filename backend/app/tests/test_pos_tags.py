@@ -0,0 +1,102 @@
+"""
+Unit tests for the offline part-of-speech artifact (app.catalog.pos_tags)
+and its use when building the catalog.
+"""
+
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.catalog import pos_tags
+from app.crud import crud_search
+
+ROWS = [
+    {"eng term": "Census", "eng definition ": "A count.", "category": "Population "},
+    {"eng term": "Estimate", "eng definition ": "A guess.", "category": "Methods"},
+]
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text(json.dumps(ROWS))
+    return data_file
+
+
+def write_artifact(data_file, tags, **overrides):
+    artifact = {
+        "format_version": pos_tags.POS_TAGS_FORMAT_VERSION,
+        "source_sha256": hashlib.sha256(data_file.read_bytes()).hexdigest(),
+        "tags": tags,
+    }
+    artifact.update(overrides)
+    pos_tags.pos_tags_path(data_file).write_text(json.dumps(artifact))
+
+
+def test_pos_tags_path_is_next_to_dataset(dataset):
+    assert pos_tags.pos_tags_path(dataset) == dataset.parent / "terms.pos.json"
+
+
+def test_load_pos_tags_checks_source_hash(dataset):
+    digest = hashlib.sha256(dataset.read_bytes()).hexdigest()
+    assert pos_tags.load_pos_tags(dataset, digest) is None  # no artifact yet
+
+    write_artifact(dataset, {"Census": "noun"})
+    assert pos_tags.load_pos_tags(dataset, digest) == {"Census": "noun"}
+    assert pos_tags.load_pos_tags(dataset, "0" * 64) is None
+
+
+def test_load_pos_tags_rejects_other_format_version(dataset):
+    digest = hashlib.sha256(dataset.read_bytes()).hexdigest()
+    write_artifact(dataset, {"Census": "noun"}, format_version=0)
+    assert pos_tags.load_pos_tags(dataset, digest) is None
+
+
+def test_build_catalog_uses_artifact_without_spacy(dataset):
+    write_artifact(dataset, {"Census": "noun", "Estimate": "verb"})
+    with patch(
+        "app.crud.crud_search.get_nlp", side_effect=AssertionError("spaCy loaded")
+    ):
+        catalog = crud_search.build_catalog(dataset)
+    assert [t.part_of_speech for t in catalog.terms] == ["noun", "verb"]
+
+
+def test_build_catalog_tags_missing_terms_in_one_batch(dataset):
+    write_artifact(dataset, {"Census": "noun"})
+    with patch.object(
+        crud_search, "tag_texts", return_value={"Estimate": "verb"}
+    ) as tag_texts:
+        catalog = crud_search.build_catalog(dataset, use_snapshot=False)
+    tag_texts.assert_called_once_with(["Estimate"])
+    assert [t.part_of_speech for t in catalog.terms] == ["noun", "verb"]
+
+
+def test_build_pos_tags_writes_artifact(dataset):
+    pytest.importorskip(pos_tags.SPACY_MODEL)
+    output = pos_tags.build_pos_tags(dataset)
+    artifact = json.loads(output.read_text())
+    assert set(artifact["tags"]) == {"Census", "Estimate"}
+    digest = hashlib.sha256(dataset.read_bytes()).hexdigest()
+    assert pos_tags.load_pos_tags(dataset, digest) == artifact["tags"]
+
+
+def test_reload_picks_up_regenerated_artifact(dataset, monkeypatch):
+    monkeypatch.setattr(crud_search, "_catalog", None)
+    monkeypatch.setattr(crud_search, "_reload_listeners", [])
+    write_artifact(dataset, {"Census": "noun", "Estimate": "noun"})
+    first, swapped = crud_search.reload_catalog(dataset)
+    assert swapped
+
+    # Unchanged dataset and artifact: not even rebuilt
+    with patch.object(crud_search, "build_catalog") as build:
+        same, swapped = crud_search.reload_catalog(dataset)
+    build.assert_not_called()
+    assert same is first and not swapped
+
+    write_artifact(dataset, {"Census": "noun", "Estimate": "verb"})
+    second, swapped = crud_search.reload_catalog(dataset)
+    assert swapped
+    assert second.version != first.version
+    assert [t.part_of_speech for t in second.terms] == ["noun", "verb"]
@@ -0,0 +1,33 @@
+"""
+Unit tests for the searched-word counts (app.catalog.query_stats).
+"""
+
+from app.catalog.query_stats import QueryWordCounts
+
+
+def test_record_counts_each_word_once_per_query():
+    counts = QueryWordCounts()
+    counts.record("Unemployment rate, unemployment")
+    counts.record("rate")
+    assert counts.count("unemployment") == 1
+    assert counts.count("rate") == 2
+    assert counts.count("census") == 0
+
+
+def test_counts_are_halved_when_full():
+    counts = QueryWordCounts(max_words=3)
+    for _ in range(4):
+        counts.record("census")
+    counts.record("labour force")
+    counts.record("household")
+    # Four distinct words: counts halve and single hits are forgotten.
+    assert counts.count("census") == 2
+    assert counts.count("household") == 0
+    assert len(counts) == 1
+    assert counts.stats() == {"size": 1, "max_words": 3, "decays": 1}
+
+
+def test_zero_max_words_disables_counting():
+    counts = QueryWordCounts(max_words=0)
+    counts.record("census")
+    assert len(counts) == 0
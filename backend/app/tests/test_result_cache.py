@@ -0,0 +1,93 @@
+"""
+Unit tests for the search result cache (app.catalog.result_cache).
+"""
+
+from array import array
+
+from app.catalog.result_cache import SearchResultCache, make_cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def ids(*values):
+    return array("I", values)
+
+
+def test_make_cache_key_normalizes_parameters():
+    assert make_cache_key("Census", "English ", None, None, "name") == make_cache_key(
+        "census", "english", "", "", "name"
+    )
+    assert make_cache_key("census", None, None, None, "name") != make_cache_key(
+        "census", None, None, None, "popularity"
+    )
+    assert make_cache_key("census", None, None, None, "name") != make_cache_key(
+        "census", None, None, None, "name", fuzzy=True
+    )
+    assert make_cache_key("census", None, None, None, "name") != make_cache_key(
+        "census", None, None, None, "name", phonetic=True
+    )
+
+
+def test_hit_and_miss_counts():
+    cache = SearchResultCache(max_entries=4, ttl_seconds=60)
+    assert cache.get("v1", ("a",)) is None
+    cache.put("v1", ("a",), ids(1, 2))
+    assert list(cache.get("v1", ("a",))) == [1, 2]
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (1, 1, 1)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("v1", ("a",), ids(1))
+    cache.put("v1", ("b",), ids(2))
+    cache.get("v1", ("a",))  # "b" is now least recently used
+    cache.put("v1", ("c",), ids(3))
+    assert cache.get("v1", ("b",)) is None
+    assert cache.get("v1", ("a",)) is not None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = SearchResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    cache.put("v1", ("a",), ids(1))
+    clock.now = 9.9
+    assert cache.get("v1", ("a",)) is not None
+    clock.now = 10.0
+    assert cache.get("v1", ("a",)) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_new_catalog_version_invalidates_entries():
+    cache = SearchResultCache(max_entries=2, ttl_seconds=60)
+    cache.put("v1", ("a",), ids(1))
+    assert cache.get("v2", ("a",)) is None
+    assert cache.stats()["invalidations"] == 1
+    assert cache.stats()["size"] == 0
+
+
+def test_disabled_cache_stores_nothing():
+    cache = SearchResultCache(max_entries=0, ttl_seconds=60)
+    assert not cache.enabled
+    cache.put("v1", ("a",), ids(1))
+    assert cache.stats()["size"] == 0
+
+
+def test_contains_does_not_count_or_refresh():
+    clock = FakeClock()
+    cache = SearchResultCache(max_entries=2, ttl_seconds=10, clock=clock)
+    assert not cache.contains("v1", ("a",))
+    cache.put("v1", ("a",), ids(1))
+    assert cache.contains("v1", ("a",))
+    assert not cache.contains("v2", ("a",))
+    clock.now = 10.0
+    assert not cache.contains("v1", ("a",))
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["size"]) == (0, 0, 1)
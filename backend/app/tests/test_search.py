@@ -9,13 +9,29 @@ Validates:
 """
 
 import pytest
-from app.crud.crud_search import detect_part_of_speech
+from app.core.config import settings
+from app.crud.crud_search import detect_part_of_speech, query_words
 from fastapi.testclient import TestClient
 from app.main import app
 
 client = TestClient(app)
 
 
+@pytest.fixture
+def search_stats(monkeypatch):
+    """Fetch /search/stats with a configured admin token."""
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "s3cret")
+
+    def fetch():
+        response = client.get(
+            "/api/v1/search/stats", headers={"X-Admin-Token": "s3cret"}
+        )
+        assert response.status_code == 200
+        return response.json()
+
+    return fetch
+
+
 def test_search_with_filters_and_pagination():
     """
     Test /api/v1/search with full filters and pagination.
@@ -124,3 +140,387 @@ def test_detect_part_of_speech_empty_string():
 def test_detect_part_of_speech_non_english():
     result = detect_part_of_speech("走る")  # Japanese for 'run'
     assert result == "unknown", "Non-English input should return 'unknown'"
+
+
+def test_search_with_facet_counts():
+    """
+    Test /api/v1/search returns facet counts consistent with the results.
+    """
+    response = client.get(
+        "/api/v1/search",
+        params={"query": "a", "language": "English", "include_facets": True},
+    )
+    assert response.status_code == 200
+    json = response.json()
+    facets = json["facets"]
+    assert set(facets) == {"language", "domain", "part_of_speech"}
+    # The selected language's count equals the filtered total
+    assert facets["language"]["English"] == json["total"]
+    # Other languages are still counted, ignoring the language filter
+    assert facets["language"].get("isiZulu", 0) > 0
+    # Domain and POS counts are computed with the language filter applied
+    assert sum(facets["domain"].values()) == json["total"]
+    assert sum(facets["part_of_speech"].values()) == json["total"]
+
+
+def test_search_without_facets_by_default():
+    response = client.get("/api/v1/search", params={"query": "census"})
+    assert response.status_code == 200
+    assert "facets" not in response.json()
+
+
+def test_search_cursor_pagination():
+    """
+    Test that next_cursor resumes where the previous page ended.
+    """
+    first = client.get("/api/v1/search", params={"query": "a", "page_size": 5}).json()
+    second = client.get(
+        "/api/v1/search",
+        params={"query": "a", "page_size": 5, "cursor": first["next_cursor"]},
+    ).json()
+    by_page = client.get(
+        "/api/v1/search", params={"query": "a", "page": 2, "page_size": 5}
+    ).json()
+    assert first["next_cursor"]
+    assert second["items"] == by_page["items"]
+    assert second["total"] == first["total"]
+
+
+def test_search_sort_by_relevance():
+    """
+    Test that relevance ranks terms by BM25 over term text and definitions.
+    """
+    response = client.get(
+        "/api/v1/search",
+        params={"query": "unemployment rate", "sort_by": "relevance"},
+    )
+    assert response.status_code == 200
+    json = response.json()
+    assert json["items"][0]["term"] == "Unemployment rate"
+    # Terms matching only one of the words (in text or definition) count too.
+    substring = client.get("/api/v1/search", params={"query": "unemployment rate"})
+    assert json["total"] > substring.json()["total"]
+
+
+def test_search_relevance_cursor_pagination():
+    """
+    Test that relevance cursors walk the ranking without gaps or repeats.
+    """
+    params = {
+        "query": "census",
+        "language": "English",
+        "sort_by": "relevance",
+        "page_size": 7,
+    }
+    everything = client.get(
+        "/api/v1/search", params={**params, "page_size": 100}
+    ).json()
+    walked = []
+    cursor = None
+    while True:
+        page = client.get("/api/v1/search", params={**params, "cursor": cursor}).json()
+        walked.extend(item["id"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    assert walked == [item["id"] for item in everything["items"]]
+    assert len(walked) == everything["total"]
+
+
+def test_search_relevance_facets_count_ranked_matches():
+    json = client.get(
+        "/api/v1/search",
+        params={
+            "query": "unemployment rate",
+            "sort_by": "relevance",
+            "include_facets": True,
+        },
+    ).json()
+    assert sum(json["facets"]["language"].values()) == json["total"]
+
+
+def test_search_fuzzy_matches_misspelled_words():
+    """
+    Test that fuzzy=true finds terms despite typos, on top of the exact matches.
+    """
+    params = {"query": "unemploymnet rate", "page_size": 100}
+    assert client.get("/api/v1/search", params=params).json()["total"] == 0
+
+    fuzzy = client.get("/api/v1/search", params={**params, "fuzzy": True}).json()
+    assert "Unemployment rate" in [item["term"] for item in fuzzy["items"]]
+
+    exact = client.get("/api/v1/search", params={"query": "census"}).json()
+    widened = client.get(
+        "/api/v1/search", params={"query": "census", "fuzzy": True}
+    ).json()
+    assert widened["total"] >= exact["total"]
+
+
+def test_search_fuzzy_with_filters_and_facets():
+    json = client.get(
+        "/api/v1/search",
+        params={
+            "query": "izibalu",
+            "language": "isiZulu",
+            "fuzzy": True,
+            "include_facets": True,
+        },
+    ).json()
+    assert json["total"] > 0
+    assert all(item["language"] == "isiZulu" for item in json["items"])
+    assert json["facets"]["language"]["isiZulu"] == json["total"]
+
+
+def test_search_phonetic_matches_spellings_by_ear():
+    """
+    Test that match=phonetic finds sound-alike spellings, listed after the exact matches.
+    """
+    params = {"query": "dijalo", "page_size": 100}
+    exact = client.get("/api/v1/search", params=params).json()
+    phonetic = client.get(
+        "/api/v1/search", params={**params, "match": "phonetic"}
+    ).json()
+    terms = [item["term"].lower() for item in phonetic["items"]]
+    assert phonetic["total"] > exact["total"]
+    assert any("dijwalo" in term or "dibjalo" in term for term in terms)
+    assert all("dijalo" in term for term in terms[: exact["total"]])
+
+    json = client.get(
+        "/api/v1/search",
+        params={
+            "query": "thlaka",
+            "match": "phonetic",
+            "language": "Setswana",
+            "include_facets": True,
+        },
+    ).json()
+    assert json["total"] > 0
+    assert all("tlhaka" in item["term"].lower() for item in json["items"])
+    assert json["facets"]["language"] == {"Setswana": json["total"]}
+
+
+def test_search_phonetic_rejects_relevance_sort():
+    response = client.get(
+        "/api/v1/search",
+        params={"query": "dijalo", "match": "phonetic", "sort_by": "relevance"},
+    )
+    assert response.status_code == 400
+    response = client.get("/api/v1/search", params={"query": "a", "match": "sound"})
+    assert response.status_code == 422
+
+
+def test_search_without_results_suggests_corrections():
+    """
+    Test that an empty result carries ranked "did you mean" corrections.
+    """
+    response = client.get("/api/v1/search", params={"query": "unemploymnet rate"})
+    json = response.json()
+    assert json["total"] == 0
+    assert json["did_you_mean"][0] == "unemployment rate"
+    # Corrections follow live search counts: never served from a cache unvalidated
+    assert "etag" not in response.headers
+    assert response.headers["cache-control"] == "no-cache"
+
+    corrected = client.get(
+        "/api/v1/search", params={"query": json["did_you_mean"][0]}
+    ).json()
+    assert corrected["total"] > 0
+    assert "did_you_mean" not in corrected
+
+
+@pytest.mark.parametrize(
+    "params", [{}, {"language": "English"}, {"group_by": "concept"}]
+)
+def test_search_punctuation_only_query_matches_nothing(params):
+    """
+    Test that a query of only punctuation does not match the whole catalog.
+    """
+    response = client.get("/api/v1/search", params={"query": "--", **params})
+    assert response.status_code == 200
+    assert response.json()["total"] == 0
+
+
+def test_search_records_words_of_successful_queries(search_stats):
+    """
+    Test that first pages of successful searches feed the "did you mean" word counts.
+    """
+    before = query_words.count("household")
+    client.get("/api/v1/search", params={"query": "Household head"})
+    client.get("/api/v1/search", params={"query": "household", "page": 2})
+    client.get("/api/v1/search", params={"query": "householdzzqq"})
+    assert query_words.count("household") == before + 1
+    assert query_words.count("householdzzqq") == 0
+    assert search_stats()["query_words"]["size"] > 0
+
+
+def test_search_invalid_cursor():
+    response = client.get(
+        "/api/v1/search", params={"query": "a", "cursor": "not-a-cursor"}
+    )
+    assert response.status_code == 400
+
+
+def test_search_stats_reports_cache_hits(search_stats):
+    """
+    Test that a repeated search is served from the result cache.
+    """
+    params = {"query": "household", "sort_by": "name"}
+    before = search_stats()["result_cache"]
+    client.get("/api/v1/search", params=params)
+    client.get("/api/v1/search", params=params)
+    after = search_stats()["result_cache"]
+    assert after["hits"] >= before["hits"] + 1
+    assert after["size"] >= 1
+
+
+def test_search_stats_requires_admin_token(monkeypatch):
+    """
+    Test that the stats endpoint is refused without the admin token.
+    """
+    monkeypatch.setattr(settings, "ADMIN_API_TOKEN", "s3cret")
+    assert client.get("/api/v1/search/stats").status_code == 403
+    response = client.get("/api/v1/search/stats", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
+
+
+def test_search_stats_reports_worker_memory(search_stats):
+    """
+    Test that the stats endpoint reports the answering worker's memory.
+    """
+    memory = search_stats()["memory"]
+    assert memory["pid"] > 0
+    assert memory["rss"] > 0
+
+
+def test_search_grouped_by_concept():
+    """
+    Test that group_by=concept returns one row per concept with its translations.
+    """
+    params = {"query": "data", "page_size": 100}
+    terms = client.get("/api/v1/search", params=params).json()
+    concepts = client.get(
+        "/api/v1/search", params={**params, "group_by": "concept"}
+    ).json()
+
+    assert 0 < concepts["total"] < terms["total"]
+    ids = [item["concept_id"] for item in concepts["items"]]
+    assert len(ids) == len(set(ids))
+    for item in concepts["items"]:
+        assert item["term"]["language"] in item["matched_languages"]
+        assert item["term"]["id"] not in {t["id"] for t in item["translations"]}
+
+
+def test_search_rejects_unknown_grouping():
+    """
+    Test that only group_by=concept is accepted.
+    """
+    response = client.get(
+        "/api/v1/search", params={"query": "census", "group_by": "language"}
+    )
+    assert response.status_code == 422
+
+
+def test_search_sparse_fieldset():
+    """
+    Test that fields= returns only the selected attributes, plus the id.
+    """
+    params = {"query": "census", "page_size": 5}
+    full = client.get("/api/v1/search", params=params).json()
+    sparse = client.get(
+        "/api/v1/search", params={**params, "fields": "language, term"}
+    ).json()
+
+    assert sparse["total"] == full["total"]
+    assert sparse["items"] == [
+        {"id": t["id"], "term": t["term"], "language": t["language"]}
+        for t in full["items"]
+    ]
+
+
+def test_search_rejects_unknown_fields():
+    """
+    Test that unknown attributes, and fields with group_by, are rejected.
+    """
+    response = client.get("/api/v1/search", params={"query": "a", "fields": "nope"})
+    assert response.status_code == 400
+    assert "nope" in response.json()["detail"]
+
+    response = client.get(
+        "/api/v1/search",
+        params={"query": "a", "fields": "term", "group_by": "concept"},
+    )
+    assert response.status_code == 400
+
+
+def test_search_compresses_large_pages():
+    """
+    Test that large pages are gzip-compressed when the client accepts it.
+    """
+    params = {"query": "a", "page_size": 100}
+    compressed = client.get(
+        "/api/v1/search", params=params, headers={"Accept-Encoding": "gzip"}
+    )
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["vary"]
+
+    plain = client.get(
+        "/api/v1/search", params=params, headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in plain.headers
+    assert compressed.json() == plain.json()
+
+
+def test_search_conditional_get():
+    """
+    Test that search responses carry an ETag and revalidate with 304.
+    """
+    params = {"query": "census", "page_size": 5}
+    response = client.get("/api/v1/search", params=params)
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    # Same parameters in another order: same ETag, answered with 304
+    reordered = client.get(
+        "/api/v1/search?page_size=5&query=census", headers={"If-None-Match": etag}
+    )
+    assert reordered.status_code == 304
+    assert reordered.headers["etag"] == etag
+    assert reordered.content == b""
+
+    other = client.get(
+        "/api/v1/search",
+        params={**params, "page": 2},
+        headers={"If-None-Match": etag},
+    )
+    assert other.status_code == 200
+    assert other.headers["etag"] != etag
+
+
+def test_search_compressed_etag_revalidates():
+    """
+    Test that compressed responses get their own ETag, which still revalidates.
+    """
+    params = {"query": "a", "page_size": 100}
+    response = client.get(
+        "/api/v1/search", params=params, headers={"Accept-Encoding": "gzip"}
+    )
+    etag = response.headers["etag"]
+    assert etag.endswith('-gzip"')
+
+    again = client.get(
+        "/api/v1/search",
+        params=params,
+        headers={"Accept-Encoding": "gzip", "If-None-Match": etag},
+    )
+    assert again.status_code == 304
+
+
+def test_search_stats_reports_coalescing(search_stats):
+    """
+    Test that the stats endpoint reports single-flight counters.
+    """
+    client.get("/api/v1/search", params={"query": "rate"})
+    stats = search_stats()["single_flight"]
+    assert stats["executions"] >= 1
+    assert stats["in_flight"] == 0
+    assert "coalesced" in stats
@@ -0,0 +1,93 @@
+"""
+Unit tests for fast response encoding (app.core.serialization) and the
+catalog's cached per-term JSON (app.catalog.term_json).
+"""
+
+import asyncio
+import json
+from unittest.mock import patch
+from uuid import UUID
+
+import numpy as np
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.core import serialization
+from app.crud import crud_search
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    # Tag every term as a noun so the test does not depend on the spaCy model.
+    with patch.object(
+        crud_search, "tag_texts", side_effect=lambda texts: dict.fromkeys(texts, "noun")
+    ):
+        return crud_search.build_catalog(use_snapshot=False)
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_dumps_encodes_uuids_and_numpy_scalars(use_orjson):
+    value = {
+        "id": UUID("12345678-1234-5678-1234-567812345678"),
+        "term": "Isibalo sabantu",
+        "count": np.int64(3),
+        "mean": np.float64(7.5),
+        "items": [1, None, "ë"],
+    }
+    orjson = serialization.orjson if use_orjson else None
+    with patch.object(serialization, "orjson", orjson):
+        encoded = serialization.dumps(value)
+    assert json.loads(encoded) == {
+        "id": "12345678-1234-5678-1234-567812345678",
+        "term": "Isibalo sabantu",
+        "count": 3,
+        "mean": 7.5,
+        "items": [1, None, "ë"],
+    }
+    assert b" " not in encoded.replace(b"Isibalo sabantu", b"")
+
+
+def test_dumps_object_splices_encoded_members():
+    body = serialization.dumps_object(
+        {"total": 2, "next_cursor": None},
+        {"items": serialization.dumps_array([b'{"a":1}', b"[]"])},
+    )
+    assert json.loads(body) == {
+        "total": 2,
+        "next_cursor": None,
+        "items": [{"a": 1}, []],
+    }
+    assert json.loads(serialization.dumps_object({}, {"x": b"1"})) == {"x": 1}
+
+
+def test_term_fragments_match_models(catalog):
+    fragments = catalog.json
+    for position in range(0, len(catalog), 97):
+        term = catalog.terms[position]
+        assert json.loads(fragments.term(position)) == jsonable_encoder(term)
+        assert json.loads(fragments.suggestion(position)) == {
+            "id": str(term.id),
+            "label": term.term,
+        }
+    # Fragments are encoded once and reused.
+    assert fragments.term(0) is fragments.term(0)
+
+
+def test_concept_fragments_match_models(catalog):
+    page = asyncio.run(
+        crud_search.search_concepts_page("rate", page_size=50, catalog=catalog)
+    )
+    positions = asyncio.run(
+        crud_search.select_page(
+            "rate", page_size=50, group_by="concept", catalog=catalog
+        )
+    ).positions
+    encoded = [
+        json.loads(
+            catalog.json.concept(
+                p, catalog.matched_variants(p, "rate", None, None, None)
+            )
+        )
+        for p in positions
+    ]
+    assert encoded == jsonable_encoder(page.items)
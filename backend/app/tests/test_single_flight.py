@@ -0,0 +1,81 @@
+"""
+Unit tests for request coalescing (app.core.single_flight).
+"""
+
+import asyncio
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+
+
+def test_concurrent_calls_share_one_computation():
+    flights = SingleFlight()
+    calls = []
+
+    async def compute(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return [value]
+
+    async def main():
+        return await asyncio.gather(
+            *[flights.do("a", lambda: compute(1)) for _ in range(5)],
+            flights.do("b", lambda: compute(2)),
+        )
+
+    results = asyncio.run(main())
+    assert calls == [1, 2]
+    assert results[:5] == [[1]] * 5 and results[0] is results[4]
+    assert results[5] == [2]
+    assert flights.stats() == {"in_flight": 0, "executions": 2, "coalesced": 4}
+
+
+def test_finished_computations_are_not_reused():
+    flights = SingleFlight()
+    counter = iter(range(10))
+
+    async def compute():
+        return next(counter)
+
+    async def main():
+        return [await flights.do("a", compute), await flights.do("a", compute)]
+
+    assert asyncio.run(main()) == [0, 1]
+    assert flights.stats()["coalesced"] == 0
+
+
+def test_exception_is_shared():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    async def main():
+        return await asyncio.gather(
+            flights.do("a", compute), flights.do("a", compute), return_exceptions=True
+        )
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, ValueError) for r in results)
+    assert flights.stats() == {"in_flight": 0, "executions": 1, "coalesced": 1}
+
+
+def test_cancelled_caller_does_not_cancel_others():
+    flights = SingleFlight()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def main():
+        first = asyncio.ensure_future(flights.do("a", compute))
+        second = asyncio.ensure_future(flights.do("a", compute))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(main()) == "done"
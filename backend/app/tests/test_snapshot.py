@@ -0,0 +1,208 @@
+"""
+Unit tests for binary catalog snapshots (app.catalog.snapshot).
+"""
+
+import hashlib
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.catalog import snapshot
+from app.catalog.phonetic_index import PHONETIC_LANGUAGES
+from app.crud import crud_search
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    # Tag every term as a noun so the test does not depend on the spaCy model.
+    with patch.object(
+        crud_search, "tag_texts", side_effect=lambda texts: dict.fromkeys(texts, "noun")
+    ):
+        return crud_search.build_catalog(use_snapshot=False)
+
+
+@pytest.fixture
+def snapshot_file(tmp_path, catalog):
+    return snapshot.write_snapshot(
+        catalog, tmp_path / "terms.catalog.bin", source_sha256="a" * 64
+    )
+
+
+def test_snapshot_path_is_next_to_dataset(tmp_path):
+    data_file = tmp_path / "terms.json"
+    assert snapshot.snapshot_path(data_file) == tmp_path / "terms.catalog.bin"
+
+
+def test_snapshot_round_trips_terms(catalog, snapshot_file):
+    loaded = snapshot.read_snapshot(snapshot_file, source_sha256="a" * 64)
+
+    assert loaded.version == catalog.version
+    assert len(loaded) == len(catalog)
+    assert [t.model_dump() for t in loaded.terms] == [
+        t.model_dump() for t in catalog.terms
+    ]
+
+
+def test_snapshot_indexes_match_built_indexes(catalog, snapshot_file):
+    loaded = snapshot.read_snapshot(snapshot_file, source_sha256="a" * 64)
+
+    for query in ["", "a", "st", "sample", "census", "zzz"]:
+        assert loaded.search(query, "isiZulu", None, None) == catalog.search(
+            query, "isiZulu", None, None
+        )
+        assert loaded.search(query, None, "statistics", "noun") == catalog.search(
+            query, None, "statistics", "noun"
+        )
+        assert loaded.facet_counts(query, None, None, None) == catalog.facet_counts(
+            query, None, None, None
+        )
+        assert loaded.suggest(query, k=10, language="english") == catalog.suggest(
+            query, k=10, language="english"
+        )
+    for query in ["sensus", "houshold hed", "zzz"]:
+        assert loaded.search(query, None, None, None, fuzzy=True) == catalog.search(
+            query, None, None, None, fuzzy=True
+        )
+    for query in ["dijwalo", "thlaka", "iisiriyeli", "zzz"]:
+        assert loaded.search(query, None, None, None, phonetic=True) == catalog.search(
+            query, None, None, None, phonetic=True
+        )
+    for query in ["unemployment rate", "census", "zzz"]:
+        assert list(loaded.rank_relevance(query, None, None, None)) == list(
+            catalog.rank_relevance(query, None, None, None)
+        )
+    for sort_by in ["name", "popularity"]:
+        assert list(loaded.sort_orders[sort_by]) == list(catalog.sort_orders[sort_by])
+        assert list(loaded.sort_ranks[sort_by]) == list(catalog.sort_ranks[sort_by])
+
+
+def test_read_snapshot_rejects_other_dataset(snapshot_file):
+    with pytest.raises(snapshot.SnapshotError, match="different dataset"):
+        snapshot.read_snapshot(snapshot_file, source_sha256="b" * 64)
+
+
+def test_read_snapshot_rejects_corrupt_files(tmp_path, snapshot_file):
+    not_a_snapshot = tmp_path / "other.bin"
+    not_a_snapshot.write_bytes(b"{}" * 16)
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.read_snapshot(not_a_snapshot, source_sha256="a" * 64)
+
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.read_snapshot(empty, source_sha256="a" * 64)
+
+    truncated = tmp_path / "truncated.bin"
+    truncated.write_bytes(snapshot_file.read_bytes()[:-64])
+    with pytest.raises(snapshot.SnapshotError, match="truncated"):
+        snapshot.read_snapshot(truncated, source_sha256="a" * 64)
+
+
+def test_build_catalog_prefers_fresh_snapshot(tmp_path, catalog):
+    data_file = tmp_path / "terms.json"
+    data_file.write_bytes(crud_search.DATA_FILE.read_bytes())
+    digest = hashlib.sha256(data_file.read_bytes()).hexdigest()
+    snapshot.write_snapshot(catalog, snapshot.snapshot_path(data_file), digest)
+
+    with patch.object(crud_search, "_build_store") as build_terms:
+        loaded = crud_search.build_catalog(data_file)
+    build_terms.assert_not_called()
+    assert loaded.version == catalog.version
+
+
+def test_build_catalog_ignores_stale_snapshot(tmp_path, catalog):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text('[{"eng term": "", "afr term": "Sensus"}]')
+    snapshot.write_snapshot(catalog, snapshot.snapshot_path(data_file), "0" * 64)
+
+    loaded = crud_search.build_catalog(data_file)
+    assert [t.term for t in loaded.terms] == ["Sensus"]
+
+
+def _rewrite_header(path, edit):
+    # Replace the header in place, padded to its old length so the sections stay put.
+    data = path.read_bytes()
+    _, _, length = snapshot._PREAMBLE.unpack_from(data)
+    start = snapshot._PREAMBLE.size
+    header = json.loads(data[start : start + length])
+    edit(header)
+    encoded = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    assert len(encoded) <= length
+    path.write_bytes(data[:start] + encoded.ljust(length) + data[start + length :])
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda header: header.pop("byteorder"),
+        lambda header: header.pop("count"),
+        lambda header: header["sections"].pop("term"),
+        lambda header: header["string_counts"].update(term="many"),
+        lambda header: header["sections"].update(ids=None),
+        lambda header: header["sections"].update(ids=[0]),
+    ],
+    ids=[
+        "no-byteorder",
+        "no-count",
+        "no-section",
+        "bad-string-count",
+        "bad-section",
+        "short-section",
+    ],
+)
+def test_read_snapshot_rejects_mangled_header(snapshot_file, edit):
+    _rewrite_header(snapshot_file, edit)
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.read_snapshot(snapshot_file, source_sha256="a" * 64)
+
+
+def test_read_snapshot_rejects_non_object_header(snapshot_file):
+    _rewrite_header(snapshot_file, lambda header: header.clear())
+    data = snapshot_file.read_bytes()
+    start = snapshot._PREAMBLE.size
+    snapshot_file.write_bytes(data[:start] + b"[]" + data[start + 2 :])
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.read_snapshot(snapshot_file, source_sha256="a" * 64)
+
+
+def test_read_snapshot_rejects_other_pos_artifact(tmp_path, catalog):
+    data_file = tmp_path / "terms.json"
+    data_file.write_bytes(crud_search.DATA_FILE.read_bytes())
+    digest = hashlib.sha256(data_file.read_bytes()).hexdigest()
+    path = snapshot.snapshot_path(data_file)
+    snapshot.write_snapshot(catalog, path, digest, pos_tags_sha256="c" * 64)
+
+    with pytest.raises(snapshot.SnapshotError, match="POS artifact"):
+        snapshot.read_snapshot(path, digest)
+
+
+def test_build_catalog_saves_and_maps_snapshot(tmp_path):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text('[{"eng term": "", "afr term": "Sensus"}]')
+
+    built = crud_search.build_catalog(data_file, save_snapshot=True)
+    assert snapshot.snapshot_path(data_file).exists()
+    # Served from the mapped snapshot: sort orders are views of the file.
+    assert isinstance(built.sort_orders["name"], memoryview)
+
+    with patch.object(crud_search, "_build_store") as build_terms:
+        again = crud_search.build_catalog(data_file, save_snapshot=True)
+    build_terms.assert_not_called()
+    assert [t.term for t in again.terms] == ["Sensus"]
+
+
+def test_read_snapshot_rejects_other_phonetic_rules(snapshot_file):
+    with patch.dict(PHONETIC_LANGUAGES, {"afrikaans": "nguni"}), pytest.raises(
+        snapshot.SnapshotError, match="phonetic rules"
+    ):
+        snapshot.read_snapshot(snapshot_file, source_sha256="a" * 64)
+
+
+def test_build_catalog_without_writable_directory(tmp_path):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text('[{"eng term": "", "afr term": "Sensus"}]')
+    with patch.object(snapshot, "open", side_effect=PermissionError, create=True):
+        catalog = crud_search.build_catalog(data_file, save_snapshot=True)
+    assert [t.term for t in catalog.terms] == ["Sensus"]
+    assert not snapshot.snapshot_path(data_file).exists()
@@ -0,0 +1,54 @@
+"""
+Tests for the startup report and the API's import-time budget.
+"""
+
+import subprocess
+import sys
+
+from app.core.startup_report import (
+    LAZY_MODULES,
+    ImportTiming,
+    StartupReport,
+    summarize_by_package,
+)
+
+
+def test_phase_is_recorded():
+    report = StartupReport()
+    with report.phase("load something"):
+        pass
+    assert list(report.as_dict()) == ["load something"]
+
+
+def test_phase_is_recorded_when_it_raises():
+    report = StartupReport()
+    try:
+        with report.phase("broken"):
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+    assert "broken" in report.as_dict()
+
+
+def test_summarize_by_package():
+    timings = [
+        ImportTiming("sqlalchemy", 100, 300),
+        ImportTiming("sqlalchemy.engine", 200, 200),
+        ImportTiming("app.api.v1.endpoints.auth", 50, 500),
+    ]
+    assert summarize_by_package(timings) == {
+        "sqlalchemy": 300,
+        "app.api.v1.endpoints": 50,
+    }
+
+
+def test_importing_app_does_not_load_heavy_dependencies():
+    """spaCy and pandas must only be loaded on first use, not on import of app.main."""
+    code = (
+        "import sys, app.main; "
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert completed.stdout.strip() == ""
@@ -35,3 +35,51 @@ def test_suggest_endpoint():
         first_item = data[0]
         assert "id" in first_item, "Expected each item to contain an 'id' key"
         assert "label" in first_item, "Expected each item to contain a 'label' key"
+
+
+def test_suggest_endpoint_prefix_and_language():
+    """
+    Suggestions must start with the query, respect the language filter and be capped at 10.
+    """
+    response = client.get(
+        "/api/v1/suggest",
+        params={"query": "a", "language": "Afrikaans"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert 0 < len(data) <= 10
+    labels = [item["label"] for item in data]
+    assert all(label.lower().startswith("a") for label in labels)
+    assert labels == sorted(labels, key=str.lower)
+
+
+def test_suggest_conditional_get():
+    """
+    Test that suggestions carry an ETag and revalidate with 304.
+    """
+    response = client.get("/api/v1/suggest", params={"query": "cen"})
+    etag = response.headers["etag"]
+
+    again = client.get(
+        "/api/v1/suggest", params={"query": "cen"}, headers={"If-None-Match": etag}
+    )
+    assert again.status_code == 304
+
+
+def test_suggest_fuzzy_fills_up_with_typo_matches():
+    """
+    Test that fuzzy suggestions tolerate misspelled words but keep exact prefixes first.
+    """
+    exact = client.get("/api/v1/suggest", params={"query": "houshold"}).json()
+    assert exact == []
+    fuzzy = client.get(
+        "/api/v1/suggest", params={"query": "houshold", "fuzzy": True}
+    ).json()
+    assert fuzzy
+    assert all("household" in item["label"].lower() for item in fuzzy)
+
+    prefix = client.get("/api/v1/suggest", params={"query": "census"}).json()
+    widened = client.get(
+        "/api/v1/suggest", params={"query": "census", "fuzzy": True}
+    ).json()
+    assert widened[: len(prefix)] == prefix
@@ -1,7 +1,7 @@
 import pytest
 import pandas as pd
 import json
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from fastapi.testclient import TestClient
 from fastapi import FastAPI
 
@@ -122,6 +122,25 @@ class TestAnalyticsModule:
         mock_read_json.assert_called_once()
         assert result1 is result2  # Same object reference
 
+    @patch("pandas.read_json")
+    def test_refresh_marito_data_after_catalog_reload(
+        self, mock_read_json, sample_dataframe
+    ):
+        """Test that a catalog reload re-reads the dataset only if it was loaded"""
+        import app.api.v1.endpoints.analytics as analytics_module
+
+        mock_read_json.return_value = sample_dataframe
+
+        # Not loaded yet: stays lazy
+        analytics_module.refresh_marito_data(None)
+        mock_read_json.assert_not_called()
+        assert analytics_module.TERM_DATASET is None
+
+        analytics_module.TERM_DATASET = pd.DataFrame()
+        analytics_module.refresh_marito_data(MagicMock(version="v1"))
+        mock_read_json.assert_called_once_with(DATASET_PATH)
+        assert analytics_module.TERM_DATASET is sample_dataframe
+
     @patch("pandas.read_json")
     @pytest.mark.asyncio
     async def test_load_marito_data_column_normalization(self, mock_read_json):
@@ -278,6 +297,103 @@ class TestAnalyticsModule:
         assert "eng_definition" in def_lengths
         assert len(def_lengths) == 1
 
+    @patch("app.api.v1.endpoints.analytics.compute_descriptive_analytics")
+    @patch("app.api.v1.endpoints.analytics.load_marito_data")
+    @pytest.mark.asyncio
+    async def test_descriptive_response_cached_per_dataset(
+        self, mock_load_data, mock_compute, sample_dataframe
+    ):
+        """Test that the encoded response is reused until the dataset changes"""
+        mock_load_data.return_value = sample_dataframe
+        mock_compute.return_value = {"category_frequency": {"Statistics": 2}}
+
+        first = client.get("/analytics/descriptive")
+        second = client.get("/analytics/descriptive")
+        assert first.json() == second.json() == mock_compute.return_value
+        mock_compute.assert_called_once()
+
+        mock_load_data.return_value = sample_dataframe.copy()
+        client.get("/analytics/descriptive")
+        assert mock_compute.call_count == 2
+
+    @patch("app.api.v1.endpoints.analytics.compute_descriptive_analytics")
+    @patch("app.api.v1.endpoints.analytics.load_marito_data")
+    @pytest.mark.asyncio
+    async def test_descriptive_conditional_get(
+        self, mock_load_data, mock_compute, sample_dataframe
+    ):
+        """Test that a matching If-None-Match is answered without computing statistics"""
+        import app.api.v1.endpoints.analytics as analytics_module
+
+        analytics_module.DESCRIPTIVE_RESPONSE = None
+        mock_load_data.return_value = sample_dataframe
+        mock_compute.return_value = {"category_frequency": {"Statistics": 2}}
+
+        response = client.get("/analytics/descriptive")
+        etag = response.headers["etag"]
+        mock_compute.reset_mock()
+
+        again = client.get("/analytics/descriptive", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        mock_compute.assert_not_called()
+
+    @patch("app.api.v1.endpoints.analytics.load_marito_data")
+    @pytest.mark.asyncio
+    async def test_descriptive_etag_follows_dataset_version(
+        self, mock_load_data, sample_dataframe
+    ):
+        """Test that the ETag changes with the loaded dataset, not with the catalog"""
+        sample_dataframe.attrs["catalog_version"] = "v1"
+        mock_load_data.return_value = sample_dataframe
+        etag = client.get("/analytics/descriptive").headers["etag"]
+
+        # A dataset not yet re-read after a catalog reload keeps its ETag
+        assert client.get("/analytics/descriptive").headers["etag"] == etag
+
+        refreshed = sample_dataframe.copy()
+        refreshed.attrs["catalog_version"] = "v2"
+        mock_load_data.return_value = refreshed
+        assert client.get("/analytics/descriptive").headers["etag"] != etag
+
+    @patch("pandas.read_json")
+    @pytest.mark.asyncio
+    async def test_warm_up_tags_dataset_with_catalog_version(
+        self, mock_read_json, sample_dataframe
+    ):
+        """Test that a dataset loaded by the startup warm-up gets a versioned ETag"""
+        import app.api.v1.endpoints.analytics as analytics_module
+        from app.crud.crud_search import get_catalog
+        from app.main import warm_up_heavy_dependencies
+
+        analytics_module.DESCRIPTIVE_RESPONSE = None
+        mock_read_json.return_value = sample_dataframe
+        await warm_up_heavy_dependencies()
+
+        version = get_catalog().version
+        assert analytics_module.TERM_DATASET.attrs["catalog_version"] == version
+        etag = client.get("/analytics/descriptive").headers["etag"]
+
+        # Same ETag as a dataset loaded by the endpoint itself for this catalog
+        analytics_module.TERM_DATASET = None
+        await load_marito_data(version)
+        assert client.get("/analytics/descriptive").headers["etag"] == etag
+
+        # A reload to another catalog version changes it
+        analytics_module.refresh_marito_data(MagicMock(version="other"))
+        assert client.get("/analytics/descriptive").headers["etag"] != etag
+
+    @patch("pandas.read_json")
+    def test_refresh_marito_data_tags_catalog_version(
+        self, mock_read_json, sample_dataframe
+    ):
+        """Test that a re-read dataset records the version of the reloaded catalog"""
+        import app.api.v1.endpoints.analytics as analytics_module
+
+        mock_read_json.return_value = sample_dataframe
+        analytics_module.TERM_DATASET = pd.DataFrame()
+        analytics_module.refresh_marito_data(MagicMock(version="v2"))
+        assert analytics_module.TERM_DATASET.attrs["catalog_version"] == "v2"
+
     # @patch('app.api.v1.endpoints.analytics.load_marito_data')
     # @pytest.mark.asyncio
     # async def test_empty_dataframe_handling(self, mock_load_data):
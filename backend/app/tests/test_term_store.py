@@ -0,0 +1,92 @@
+"""
+Unit tests for the compact term store (app.catalog.term_store).
+"""
+
+from uuid import uuid4
+
+import pytest
+
+from app.catalog.term_store import TermStore, TermStoreBuilder, group_table
+from app.schemas.term import Term
+
+
+def make_term(term, language="English", translations=(), **fields):
+    values = {
+        "id": uuid4(),
+        "term": term,
+        "definition": "A definition.",
+        "language": language,
+        "domain": "Statistics",
+        "part_of_speech": "noun",
+        "translations": list(translations),
+        "example": "",
+        "related_terms": [],
+        "upvotes": 0,
+        "downvotes": 0,
+        "comments": [],
+    }
+    values.update(fields)
+    return Term(**values)
+
+
+def test_group_table_lists_members_in_position_order():
+    starts, positions = group_table([1, 0, 1, 2, 0])
+    assert list(starts) == [0, 2, 4, 5]
+    assert list(positions) == [1, 4, 0, 2, 3]
+
+
+def test_builder_shares_translation_groups():
+    builder = TermStoreBuilder()
+    ids = [uuid4() for _ in range(3)]
+    builder.append(ids[0], "Census", group=0, language="English")
+    builder.append(ids[1], "Sensus", group=0, language="Afrikaans")
+    builder.append(ids[2], "Mean", group=1, language="English")
+    store = builder.build()
+
+    assert len(store) == 3
+    assert store.translations(0) == [ids[1]]
+    assert store.translations(2) == []
+    # Repeated values are stored once
+    assert store.tables["language"] == ["English", "Afrikaans"]
+    assert store[1].term == "Sensus" and store[1].language == "Afrikaans"
+    assert store[-1].id == ids[2]
+    with pytest.raises(IndexError):
+        store[3]
+
+
+def test_from_terms_round_trips_any_terms():
+    census = make_term("Census", upvotes=3, downvotes=1)
+    sensus = make_term("Sensus", language="Afrikaans", translations=[census.id])
+    census.translations = [sensus.id]
+    lonely = make_term(
+        "Mean",
+        translations=[uuid4()],  # points outside the catalog
+        related_terms=[census.id],
+        comments=["Check this"],
+    )
+    terms = [census, sensus, lonely]
+
+    store = TermStore.from_terms(terms)
+
+    assert list(store) == terms
+    assert store[0:2] == terms[0:2]
+    assert store.score(0) == 2
+    assert set(store.extras) == {2}
+    assert TermStore.from_terms(store) is store
+
+
+def test_position_of_and_translation_positions():
+    census = make_term("Census")
+    sensus = make_term("Sensus", language="Afrikaans", translations=[census.id])
+    census.translations = [sensus.id]
+    outside = make_term("Mean", translations=[census.id, uuid4()])
+    store = TermStore.from_terms([census, sensus, outside])
+
+    assert store.position_of(sensus.id) == 1
+    assert store.position_of(uuid4()) is None
+    assert store.translation_positions(0) == [1]
+    # Translations outside the term's group resolve through the ID map
+    assert store.translation_positions(2) == [0]
+    assert [t.translations for t in store] == [
+        t.translations for t in [census, sensus, outside]
+    ]
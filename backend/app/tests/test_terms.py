@@ -0,0 +1,76 @@
+"""
+Unit test module for the /api/v1/terms endpoints.
+"""
+
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.crud.crud_search import get_catalog
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_term_translations_returns_every_language_variant():
+    """
+    Test that a term resolves to its variants in the other languages.
+    """
+    catalog = get_catalog()
+    term = catalog.terms[0]
+
+    response = client.get(f"/api/v1/terms/{term.id}/translations")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["term"]["id"] == str(term.id)
+    assert [t["id"] for t in data["translations"]] == [
+        str(uid) for uid in term.translations
+    ]
+    languages = {t["language"] for t in data["translations"]}
+    assert term.language not in languages
+    assert len(languages) == len(data["translations"])
+
+    # Any variant resolves to the same concept
+    other = data["translations"][0]["id"]
+    again = client.get(f"/api/v1/terms/{other}/translations").json()
+    assert {t["id"] for t in again["translations"]} | {other} == {
+        t["id"] for t in data["translations"]
+    } | {str(term.id)}
+
+
+def test_term_translations_unknown_id():
+    """
+    Test that unknown and malformed IDs are rejected.
+    """
+    assert client.get(f"/api/v1/terms/{uuid4()}/translations").status_code == 404
+    assert client.get("/api/v1/terms/not-a-uuid/translations").status_code == 422
+
+
+def test_term_translations_sparse_fieldset():
+    """
+    Test that fields= applies to the term and each of its translations.
+    """
+    term = get_catalog().terms[0]
+
+    response = client.get(
+        f"/api/v1/terms/{term.id}/translations", params={"fields": "term,language"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["term"] == {
+        "id": str(term.id),
+        "term": term.term,
+        "language": term.language,
+    }
+    assert all(set(t) == {"id", "term", "language"} for t in data["translations"])
+    full = client.get(f"/api/v1/terms/{term.id}/translations").json()
+    assert data["translations"] == [
+        {name: t[name] for name in ("id", "term", "language")}
+        for t in full["translations"]
+    ]
+    assert (
+        client.get(
+            f"/api/v1/terms/{term.id}/translations", params={"fields": "votes"}
+        ).status_code
+        == 400
+    )
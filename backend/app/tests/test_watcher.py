@@ -0,0 +1,57 @@
+"""
+Unit tests for the dataset file watcher (app.catalog.watcher).
+"""
+
+import os
+import threading
+
+from app.catalog.watcher import FileWatcher
+
+
+def touch(path, content):
+    path.write_text(content)
+    # Make sure the mtime moves even on filesystems with coarse timestamps.
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_poll_detects_changes(tmp_path):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text("[]")
+    calls = []
+    watcher = FileWatcher([data_file, tmp_path / "missing"], lambda: calls.append(1), 1)
+
+    assert not watcher.poll()
+    touch(data_file, '[{"eng term": "Census"}]')
+    assert watcher.poll()
+    assert not watcher.poll()
+    (tmp_path / "missing").write_text("{}")  # appearing files count as changes
+    assert watcher.poll()
+    assert len(calls) == 2
+
+
+def test_poll_survives_failing_callback(tmp_path):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text("[]")
+
+    def fail():
+        raise ValueError("half-written file")
+
+    watcher = FileWatcher([data_file], fail, 1)
+    touch(data_file, "[")
+    assert watcher.poll()
+    # Not retried until the file changes again
+    assert not watcher.poll()
+
+
+def test_watcher_thread_calls_back(tmp_path):
+    data_file = tmp_path / "terms.json"
+    data_file.write_text("[]")
+    changed = threading.Event()
+    watcher = FileWatcher([data_file], changed.set, interval=0.01)
+    watcher.start()
+    try:
+        touch(data_file, '[{"eng term": "Census"}]')
+        assert changed.wait(5)
+    finally:
+        watcher.stop(timeout=5)
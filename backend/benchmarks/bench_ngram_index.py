@@ -0,0 +1,94 @@
+"""
+Benchmark: trigram index vs. linear substring scan.
+
+Builds synthetic corpora of 10k, 100k and 1M terms from the vocabulary of the
+bundled terminology dataset and compares NgramIndex.search() against a linear
+scan with the same semantics: ``normalize_text(query) in key`` over the
+precomputed normalized keys (ignoring case, diacritics and punctuation).
+
+Run from the backend directory:
+    PYTHONPATH=. python benchmarks/bench_ngram_index.py [sizes...]
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+from app.catalog.ngram_index import NgramIndex
+from app.catalog.normalization import normalize_text
+
+DATA_FILE = (
+    Path(__file__).resolve().parents[1]
+    / "../Mock_Data"
+    / "multilingual_statistical_terminology_clean.json"
+)
+
+QUERIES = [
+    "agri",
+    "census",
+    "rate",
+    "tion",
+    "ser",
+    "zokulima",
+    "household",
+    "xyzq",
+    "Cénsus",
+    "RATE,",
+]
+
+
+def load_vocabulary() -> List[str]:
+    with open(DATA_FILE) as f:
+        rows = json.load(f)
+    words = set()
+    for row in rows:
+        for key, value in row.items():
+            if key.strip().endswith("term") and value:
+                words.update(value.split())
+    return sorted(words)
+
+
+def make_corpus(vocabulary: List[str], size: int) -> List[str]:
+    rng = random.Random(size)
+    return [" ".join(rng.choices(vocabulary, k=rng.randint(1, 4))) for _ in range(size)]
+
+
+def best_of(fn: Callable[[], object], repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(sizes: List[int]) -> None:
+    vocabulary = load_vocabulary()
+    print(
+        f"{'terms':>9} {'build s':>8} {'query':>10} {'hits':>7} {'scan ms':>9} {'index ms':>9} {'speedup':>8}"
+    )
+    for size in sizes:
+        corpus = make_corpus(vocabulary, size)
+        start = time.perf_counter()
+        index = NgramIndex(corpus)
+        build = time.perf_counter() - start
+        keys = [normalize_text(t) for t in corpus]
+        for query in QUERIES:
+            needle = normalize_text(query)
+            expected = [i for i, key in enumerate(keys) if needle in key]
+            assert index.search(query) == expected, query
+            scan = best_of(
+                lambda keys=keys, needle=needle: [k for k in keys if needle in k]
+            )
+            indexed = best_of(lambda index=index, query=query: index.search(query))
+            print(
+                f"{size:>9} {build:>8.2f} {query:>10} {len(expected):>7} "
+                f"{scan * 1000:>9.2f} {indexed * 1000:>9.2f} {scan / indexed:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000])
@@ -0,0 +1,81 @@
+"""
+Benchmark: search response serialization, FastAPI's default path vs. cached fragments.
+
+For page sizes up to SEARCH_MAX_PAGE_SIZE, times encoding one page of search
+results (an empty query, so every page is full) three ways:
+
+- default: Term models through jsonable_encoder + json.dumps, as FastAPI does
+  for a ``response_model=Dict[str, Any]`` endpoint returning models
+- dumps: the same models encoded with app.core.serialization.dumps
+- fragments: the catalog's cached per-term JSON spliced into the body, as the
+  search endpoint now does (measured after a first, warming pass)
+
+Run from the backend directory:
+    PYTHONPATH=. python benchmarks/bench_serialization.py [page sizes...]
+"""
+
+import json
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.config import settings
+from app.core.serialization import dumps, dumps_array, dumps_object
+from app.crud.crud_search import build_catalog
+
+
+def best_of(fn: Callable[[], object], repeats: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(page_sizes: List[int]) -> None:
+    catalog = build_catalog()
+    print(
+        f"{'page':>6} {'KiB':>7} {'default ms':>11} {'dumps ms':>9} "
+        f"{'fragments ms':>13} {'speedup':>8}"
+    )
+    for page_size in page_sizes:
+        positions = list(catalog.sort_orders["name"][:page_size])
+        fields: Dict[str, Any] = {"total": len(catalog), "next_cursor": None}
+
+        def default(
+            positions: List[int] = positions, fields: Dict[str, Any] = fields
+        ) -> bytes:
+            items = [catalog.terms[p] for p in positions]
+            content = jsonable_encoder({"items": items, **fields})
+            return json.dumps(content, ensure_ascii=False).encode("utf-8")
+
+        def fast_models(
+            positions: List[int] = positions, fields: Dict[str, Any] = fields
+        ) -> bytes:
+            items = [catalog.terms[p].model_dump() for p in positions]
+            return dumps({"items": items, **fields})
+
+        def fragments(
+            positions: List[int] = positions, fields: Dict[str, Any] = fields
+        ) -> bytes:
+            items = dumps_array(catalog.json.term(p) for p in positions)
+            return dumps_object(fields, {"items": items})
+
+        body = fragments()
+        assert json.loads(body) == json.loads(default())
+        slow = best_of(default)
+        models = best_of(fast_models)
+        cached = best_of(fragments)
+        print(
+            f"{page_size:>6} {len(body) / 1024:>7.1f} {slow * 1000:>11.2f} "
+            f"{models * 1000:>9.2f} {cached * 1000:>13.3f} {slow / cached:>7.0f}x"
+        )
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]]
+    maximum = settings.SEARCH_MAX_PAGE_SIZE
+    main(sizes or [s for s in (10, 20, 50, 100, 200, 500) if s < maximum] + [maximum])